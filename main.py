@@ -3,7 +3,7 @@ Point d'entrée principal du projet de prédiction du churn client
 """
 import os
 import sys
-import pandas as pd
+import argparse
 from pathlib import Path
 
 # Ajouter le dossier racine au PYTHONPATH
@@ -14,12 +14,129 @@ sys.path.append(str(project_root))
 from scripts.data.dowload_setup import main as setup_data
 from src.utils.logger import logger
 # Créer et entraîner les modèles
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
+from src.models import RandomForestModel, LogisticRegressionModel, DecisionTreeModel, TrainingScheduler
 from src.evaluation.model_evaluator import ModelEvaluator
+from src.data.storage import ProcessedDataStore
+from src.data.cache import DataCache
+from src.data.preprocessor import DataPreprocessor
+from src.models.registry import ModelRegistry
+from src.data.dataset import Dataset
 
-def main():
+RAW_DATA_FILE = project_root / 'data' / 'raw' / 'WA_Fn-UseC_-Telco-Customer-Churn.csv'
+PROCESSED_DIR = project_root / 'data' / 'processed'
+CACHE_DIR = project_root / 'data' / 'cache'
+REGISTRY_DIR = project_root / 'models' / 'registry'
+EVALUATION_FILE = project_root / 'models' / 'evaluation.json'
+
+
+def parse_args(argv=None):
+    """
+    Analyse les options de la ligne de commande
+    """
+    parser = argparse.ArgumentParser(description="Pipeline de prédiction du churn client")
+    parser.add_argument('--force-rebuild', action='store_true',
+                        help="Ignorer le cache et refaire téléchargement et preprocessing")
+    parser.add_argument('--cache-max-age-days', type=float, default=None,
+                        help="Supprimer les entrées du cache inutilisées depuis N jours")
+    parser.add_argument('--cache-max-size-mb', type=float, default=None,
+                        help="Taille maximale du cache (suppression des entrées les moins récentes)")
+    parser.add_argument('--n-cores', type=int, default=None,
+                        help="Nombre de cœurs alloués à l'entraînement (par défaut tous)")
+    
+    # Sous-commande de scoring de nouveaux clients (sans sous-commande : pipeline complet)
+    subparsers = parser.add_subparsers(dest='command')
+    score = subparsers.add_parser('score', help="Scorer un CSV brut de nouveaux clients")
+    score.add_argument('input', help="CSV brut au format Telco")
+    score.add_argument('--output', default=None,
+                       help="CSV de sortie (customerID, probability, label) ; par défaut <input>_scores.csv")
+    score.add_argument('--model', default='RandomForestModel', help="Nom du modèle dans le registre")
+    score.add_argument('--version', default=None, help="Version du modèle (par défaut le champion)")
+    score.add_argument('--chunksize', type=int, default=100_000, help="Lignes par bloc")
+    score.add_argument('--workers', type=int, default=None,
+                       help="Nombre de processus de scoring (par défaut tous les cœurs)")
+    score.add_argument('--threshold', type=float, default=0.5, help="Seuil de décision du label")
+    
+    # Sous-commande du service HTTP de scoring (micro-lots)
+    serve = subparsers.add_parser('serve', help="Lancer le service HTTP de scoring")
+    serve.add_argument('--model', default='RandomForestModel', help="Nom du modèle dans le registre")
+    serve.add_argument('--version', default=None, help="Version du modèle (par défaut le champion)")
+    serve.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute")
+    serve.add_argument('--port', type=int, default=8080, help="Port d'écoute")
+    serve.add_argument('--max-batch-size', type=int, default=64, help="Clients maximum par micro-lot")
+    serve.add_argument('--max-wait-ms', type=float, default=5.0,
+                       help="Attente maximale (ms) avant de scorer un micro-lot incomplet")
+    serve.add_argument('--threshold', type=float, default=0.5, help="Seuil de décision du label")
+    serve.add_argument('--cache-size', type=int, default=0,
+                       help="Taille du cache des prédictions (0 : pas de cache)")
+    serve.add_argument('--cache-ttl', type=float, default=3600.0,
+                       help="Durée de vie des entrées du cache (secondes)")
+    return parser.parse_args(argv)
+
+
+def score_customers(args):
+    """
+    Score un CSV brut de nouveaux clients avec un modèle du registre.
+    """
+    from src.scoring import score_csv
+    
+    output = args.output or str(Path(args.input).with_name(Path(args.input).stem + '_scores.csv'))
+    logger.info(f"Scoring de {args.input} avec {args.model} ({args.version or 'champion'})")
+    summary = score_csv(args.input, output, REGISTRY_DIR, args.model, version=args.version,
+                        chunksize=args.chunksize, n_workers=args.workers, threshold=args.threshold)
+    logger.info(f"{summary['rows']} clients scorés ({summary['rows_per_second']:,.0f} lignes/s) : {output}")
+
+
+def serve_model(args):
+    """
+    Lance le service HTTP de scoring avec un modèle du registre.
+    """
+    from src.scoring.service import serve
+    
+    logger.info(f"Service de scoring avec {args.model} ({args.version or 'champion'})")
+    serve(REGISTRY_DIR, args.model, version=args.version, host=args.host, port=args.port,
+          max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms, threshold=args.threshold,
+          cache_size=args.cache_size, cache_ttl=args.cache_ttl)
+
+
+def prepare_data(args):
+    """
+    Étapes 1 et 2 : téléchargement et preprocessing, ignorés si le cache
+    contient déjà les splits pour le même fichier brut et la même configuration.
+    """
+    cache = DataCache(CACHE_DIR)
+    config = DataPreprocessor().get_config()
+    dataset = Dataset(dataset_path=RAW_DATA_FILE.parent)
+    key = None
+    
+    # Le checksum vient du manifeste du CSV (temps constant si le fichier n'a pas changé)
+    raw_info = dataset.probe()
+    if raw_info is not None:
+        key = cache.make_key(RAW_DATA_FILE, config, raw_hash=raw_info['sha256'])
+        if not args.force_rebuild and cache.has(key):
+            logger.info(f"Cache des données trouvé ({key}) : étapes 1 et 2 ignorées")
+            cache.restore(key, PROCESSED_DIR)
+            cache.evict(args.cache_max_age_days, args.cache_max_size_mb, keep=key)
+            return
+    
+    # Étape 1 : Téléchargement et configuration des données
+    logger.info("Étape 1 : Téléchargement et configuration des données")
+    setup_data(preprocess=False)
+    logger.info("Étape 1 terminée avec succès")
+    
+    # Étape 2 : Préparation des données
+    logger.info("Étape 2 : Préparation des données")
+    from src.data.process_data import main as process_data
+    process_data()
+    logger.info("Étape 2 terminée avec succès")
+    
+    # Mettre en cache les splits et le préprocesseur ajusté
+    key = key or cache.make_key(RAW_DATA_FILE, config, raw_hash=dataset.probe()['sha256'])
+    cache.store(key, PROCESSED_DIR, config=config)
+    logger.info(f"Données prétraitées mises en cache ({key})")
+    cache.evict(args.cache_max_age_days, args.cache_max_size_mb, keep=key)
+
+
+def main(argv=None):
     """
     Fonction principale qui exécute toutes les étapes du projet dans l'ordre
     1. Téléchargement et configuration des données
@@ -27,54 +144,53 @@ def main():
     3. Entraînement des modèles
     4. Évaluation des performances
     5. Visualisation des résultats
+    
+    Les étapes 1 et 2 sont ignorées si le cache des données est valide
+    (voir --force-rebuild). La sous-commande « score » score un CSV brut
+    de nouveaux clients avec un modèle du registre, « serve » lance le
+    service HTTP de scoring.
     """
+    args = parse_args(argv)
+    if args.command in ('score', 'serve'):
+        try:
+            if args.command == 'score':
+                score_customers(args)
+            else:
+                serve_model(args)
+        except Exception as e:
+            logger.error(f"Une erreur est survenue : {str(e)}", exc_info=True)
+            sys.exit(1)
+        return
+    
     logger.info("Démarrage du projet de prédiction du churn client")
     
     try:
-        # Étape 1 : Téléchargement et configuration des données
-        logger.info("Étape 1 : Téléchargement et configuration des données")
-        setup_data()
-        logger.info("Étape 1 terminée avec succès")
-        
-        # Étape 2 : Préparation des données
-        logger.info("Étape 2 : Préparation des données")
-        from src.data.process_data import main as process_data
-        process_data()
-        logger.info("Étape 2 terminée avec succès")
+        # Étapes 1 et 2 : données (avec cache)
+        prepare_data(args)
         
         # Étape 3 : Entraînement et évaluation des modèles
         logger.info("Étape 3 : Entraînement et évaluation des modèles")
         
-        # Charger les données préparées
-        X_train = pd.read_csv('data/processed/X_train.csv')
-        X_test = pd.read_csv('data/processed/X_test.csv')
-        y_train = pd.read_csv('data/processed/y_train.csv')['0']
-        y_test = pd.read_csv('data/processed/y_test.csv')['0']
-        
-       
-        
-        # Random Forest
-        rf_model = RandomForestClassifier(
-            n_estimators=100, max_depth=10, min_samples_split=5,
-            min_samples_leaf=2, random_state=42, class_weight='balanced', n_jobs=-1
-        )
+        # Charger les données préparées (memory-map, sans copie)
+        store = ProcessedDataStore(PROCESSED_DIR)
+        X_train, X_val, X_test, y_train, y_val, y_test = store.load(mmap=True)
         
-        # Régression Logistique
-        lr_model = LogisticRegression(
-            random_state=42, max_iter=1000, class_weight='balanced', C=1.0
-        )
+        # Entraîner les modèles en parallèle, chacun avec sa part des cœurs
+        # (Random Forest, parallélisable, reçoit la plus grande part)
+        logger.info("Entraînement des modèles...")
+        scheduler = TrainingScheduler(n_cores=args.n_cores)
+        scheduler.add(RandomForestModel, weight=4.0)
+        scheduler.add(LogisticRegressionModel, weight=1.0)
+        scheduler.add(DecisionTreeModel, weight=1.0)
+        trained = scheduler.run(PROCESSED_DIR)
         
-        # Arbre de Décision
-        dt_model = DecisionTreeClassifier(
-            max_depth=10, min_samples_split=20, min_samples_leaf=10,
-            random_state=42, class_weight='balanced'
-        )
+        for name, result in trained.items():
+            logger.info(f"  {name}: {result['wall_time']:.2f}s sur {result['n_cores']} cœur(s)")
+        logger.info(f"Entraînement terminé en {scheduler.total_wall_time:.2f}s (temps réel)")
         
-        # Entraîner les modèles
-        logger.info("Entraînement des modèles...")
-        rf_model.fit(X_train, y_train)
-        lr_model.fit(X_train, y_train)
-        dt_model.fit(X_train, y_train)
+        rf_model = trained["Random Forest"]['model']
+        lr_model = trained["Régression Logistique"]['model']
+        dt_model = trained["Arbre de Décision"]['model']
         
         # Évaluer les modèles
         logger.info("Évaluation des modèles...")
@@ -86,6 +202,24 @@ def main():
         
         # Afficher les résultats
         evaluator.print_results()
+        
+        # Enregistrer les modèles (avec préprocesseur et métriques) dans le registre ;
+        # une version devient champion si elle bat le champion actuel en ROC-AUC
+        registry = ModelRegistry(REGISTRY_DIR)
+        preprocessor = DataPreprocessor.load(PROCESSED_DIR / 'preprocessor.joblib')
+        versions = {}
+        for model in (rf_model, lr_model, dt_model):
+            name = type(model).__name__
+            version = registry.register(model, preprocessor, evaluator.results[model.name], name=name)
+            promoted = registry.promote_if_better(name, version)
+            versions[model.name] = {'name': name, 'version': version, 'champion': promoted}
+            logger.info(f"  {name} {version} enregistré{' (champion)' if promoted else ''}")
+        
+        # Artefact d'évaluation lu par le dashboard (métriques, matrices de
+        # confusion, courbes ROC/PR sous-échantillonnées, importances)
+        evaluator.save_report(EVALUATION_FILE, feature_names=list(X_test.columns), versions=versions,
+                              n_samples=len(X_train) + len(X_val) + len(X_test), n_test=len(X_test))
+        logger.info(f"Artefact d'évaluation écrit : {EVALUATION_FILE}")
         logger.info("Étape 3 terminée avec succès")
         
         # Étape 4 : Lancement du dashboard
@@ -0,0 +1,67 @@
+"""
+Benchmark du temps d'entraînement : Random Forest contre gradient boosting sur
+histogrammes, en fonction du nombre de lignes.
+
+Les données sont générées par SyntheticTelcoGenerator (distributions apprises
+sur le dataset réel), puis prétraitées avec DataPreprocessor. Le gradient
+boosting utilise le split de validation pour l'arrêt anticipé.
+
+Usage:
+    python scripts/benchmarks/compare_training_time.py --rows 10000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from sklearn.metrics import roc_auc_score
+
+from src.data import DataPreprocessor, SyntheticTelcoGenerator
+from src.models import RandomForestModel, GradientBoostingModel
+
+MODELS = {
+    'rf': RandomForestModel,
+    'gb': GradientBoostingModel
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Nombres de lignes à tester")
+    parser.add_argument('--models', nargs='+', choices=sorted(MODELS), default=sorted(MODELS),
+                        help="Modèles à comparer")
+    parser.add_argument('--seed', type=int, default=42, help="Graine du générateur synthétique")
+    parser.add_argument('--source', default=os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv'),
+                        help="Dataset réel servant à apprendre les distributions")
+    args = parser.parse_args()
+
+    generator = SyntheticTelcoGenerator.from_csv(args.source, seed=args.seed)
+
+    print(f"{'modèle':<20}{'lignes':>12}{'entraînement (s)':>18}{'itérations':>12}{'AUC test':>10}")
+    for n_rows in args.rows:
+        df = generator.generate_chunk(n_rows)
+        X_train, X_val, X_test, y_train, y_val, y_test = DataPreprocessor().preprocess_data(df, 'Churn')
+
+        for key in args.models:
+            model = MODELS[key]()
+            start = time.perf_counter()
+            if isinstance(model, GradientBoostingModel):
+                model.train(X_train, y_train, X_val, y_val)
+                n_iter = model.model.n_iter_
+            else:
+                model.train(X_train, y_train)
+                n_iter = model.model.n_estimators
+            elapsed = time.perf_counter() - start
+
+            auc = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+            print(f"{model.name:<20}{len(X_train):>12}{elapsed:>18.2f}{n_iter:>12}{auc:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
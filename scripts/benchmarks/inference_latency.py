@@ -0,0 +1,89 @@
+"""
+Benchmark de latence d'inférence : predict_proba sklearn (via BaseModel)
+contre le moteur NumPy à arbres aplatis (FlatTreeEnsemble), pour Random
+Forest et l'arbre de décision, à différentes tailles de lot. Pour l'arbre de
+décision, mesure aussi le scorer généré (CompiledTree) ligne par ligne.
+
+Les modèles sont entraînés sur le stockage prétraité (data/processed) avec un
+seul cœur, pour comparer des chemins d'exécution équivalents.
+
+Usage:
+    python scripts/benchmarks/inference_latency.py --batch-sizes 1 100 100000
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.data.storage import ProcessedDataStore
+from src.models import RandomForestModel, DecisionTreeModel, FlatTreeEnsemble, CompiledTree
+
+
+def measure(func, X, min_time=0.5, max_repeats=1000):
+    """
+    Latence médiane d'un appel (secondes), répété jusqu'à min_time ou max_repeats.
+    """
+    timings = []
+    start = time.perf_counter()
+    while len(timings) < max_repeats and (len(timings) < 3 or time.perf_counter() - start < min_time):
+        t0 = time.perf_counter()
+        func(X)
+        timings.append(time.perf_counter() - t0)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 100_000],
+                        help="Tailles de lot à tester")
+    parser.add_argument('--processed-dir', default=os.path.join(project_root, 'data', 'processed'),
+                        help="Dossier des données prétraitées")
+    args = parser.parse_args()
+
+    X_train, _, X_test, y_train, _, _ = ProcessedDataStore(args.processed_dir).load(mmap=True)
+    rng = np.random.default_rng(42)
+    tree_model = None
+
+    print(f"{'modèle':<20}{'lot':>8}{'sklearn (ms)':>14}{'aplati (ms)':>13}{'gain':>8}"
+          f"{'lignes/s aplati':>17}{'écart max':>11}")
+    for model_class in (RandomForestModel, DecisionTreeModel):
+        model = model_class()
+        model.set_n_jobs(1)
+        model.train(X_train, y_train)
+        flat = FlatTreeEnsemble.from_estimator(model)
+        if model_class is DecisionTreeModel:
+            tree_model = model
+
+        for batch_size in args.batch_sizes:
+            rows = rng.integers(0, len(X_test), size=batch_size)
+            X_frame = X_test.iloc[rows]
+            X_array = np.ascontiguousarray(X_frame.to_numpy())
+
+            max_diff = np.abs(model.predict_proba(X_frame) - flat.predict_proba(X_array)).max()
+            t_sklearn = measure(model.predict_proba, X_frame)
+            t_flat = measure(flat.predict_proba, X_array)
+            print(f"{model.name:<20}{batch_size:>8}{t_sklearn * 1e3:>14.3f}{t_flat * 1e3:>13.3f}"
+                  f"{t_sklearn / t_flat:>7.1f}x{batch_size / t_flat:>17,.0f}{max_diff:>11.1e}")
+
+    # Scoring ligne par ligne : la fonction générée reçoit une liste de floats
+    compiled = CompiledTree.from_estimator(tree_model)
+    rows = X_test.iloc[rng.integers(0, len(X_test), size=1000)]
+    records = rows.to_numpy().tolist()
+    expected = tree_model.predict_proba(rows)
+    max_diff = np.abs(compiled.predict_proba(rows) - expected).max()
+    t_row = measure(lambda records: [compiled.predict_proba_row(x) for x in records], records) / len(records)
+    t_sklearn = measure(tree_model.predict_proba, rows.iloc[:1])
+    print(f"\nArbre compilé ({compiled.source.count('if x[')} comparaisons) : "
+          f"{t_row * 1e6:.2f} µs/ligne contre {t_sklearn * 1e6:.0f} µs pour sklearn "
+          f"({t_sklearn / t_row:,.0f}x), écart max {max_diff:.1e}")
+
+
+if __name__ == "__main__":
+    main()
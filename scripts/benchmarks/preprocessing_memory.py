@@ -0,0 +1,117 @@
+"""
+Benchmark mémoire du preprocessing : pic de RSS en fonction de la taille d'entrée.
+
+Compare l'enchaînement historique par étapes (clean_data -> encode_categorical
+-> scale_numerical, une copie du DataFrame à chaque étape) au pipeline en une
+passe (fit + transform_array dans une matrice préallouée).
+
+Usage:
+    python scripts/benchmarks/preprocessing_memory.py --multipliers 1 10 50
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import psutil
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.data import Dataset, DataPreprocessor
+
+MODES = ('staged', 'pipeline')
+
+
+class PeakRSSMonitor:
+    """
+    Échantillonne le RSS du processus dans un thread pour en relever le pic.
+    """
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.process = psutil.Process(os.getpid())
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.peak = self.process.memory_info().rss
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def build_input(multiplier):
+    """
+    Construit une entrée de taille multiplier x le dataset Telco (types compacts).
+    """
+    df = Dataset(dataset_path=os.path.join(project_root, 'data', 'raw')).load_data(compact=True)
+    rows = np.resize(np.arange(len(df)), len(df) * multiplier)
+    return df.iloc[rows].reset_index(drop=True)
+
+
+def run_single(mode, multiplier):
+    """
+    Mesure un couple (mode, taille) ; exécuté dans un processus dédié pour isoler le pic.
+    """
+    df = build_input(multiplier)
+    input_bytes = df.memory_usage(deep=True).sum()
+    preprocessor = DataPreprocessor()
+    process = psutil.Process(os.getpid())
+    baseline = process.memory_info().rss
+
+    with PeakRSSMonitor() as monitor:
+        start = time.perf_counter()
+        if mode == 'staged':
+            X = df.drop(columns=['Churn'])
+            X = preprocessor.clean_data(X)
+            X = preprocessor.encode_categorical(X)
+            X = preprocessor.scale_numerical(X)
+        else:
+            preprocessor.fit(df, target_column='Churn')
+            X = preprocessor.transform_array(df)
+        elapsed = time.perf_counter() - start
+
+    print(f"{mode},{len(df)},{input_bytes},{monitor.peak - baseline},{elapsed:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--multipliers', type=int, nargs='+', default=[1, 10, 50],
+                        help="Tailles d'entrée en multiples du dataset Telco")
+    parser.add_argument('--single', nargs=2, metavar=('MODE', 'MULTIPLIER'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single[0], int(args.single[1]))
+        return
+
+    print(f"{'mode':<10}{'lignes':>12}{'entrée (Mo)':>14}{'pic RSS (Mo)':>15}{'ratio':>8}{'temps (s)':>11}")
+    for multiplier in args.multipliers:
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, '--single', mode, str(multiplier)],
+                check=True, capture_output=True, text=True
+            ).stdout.strip().splitlines()[-1]
+            _, rows, input_bytes, peak, elapsed = output.split(',')
+            ratio = int(peak) / int(input_bytes)
+            print(f"{mode:<10}{int(rows):>12}{int(input_bytes) / 1e6:>14.1f}{int(peak) / 1e6:>15.1f}"
+                  f"{ratio:>8.2f}{float(elapsed):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark de latence du scoring d'un seul client : chemin DataFrame
+(DataFrame d'une ligne, preprocessing pandas, predict_proba sklearn) contre
+BaseModel.predict_record (dictionnaire encodé dans un vecteur préalloué,
+routine de prédiction bas niveau de l'estimateur).
+
+Les modèles sont entraînés sur le stockage prétraité (data/processed) ; les
+clients sont tirés du CSV brut.
+
+Usage:
+    python scripts/benchmarks/record_latency.py --records 1000
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.data.preprocessor import DataPreprocessor
+from src.data.schema import TARGET_COLUMN
+from src.data.storage import ProcessedDataStore
+from src.models import (LogisticRegressionModel, DecisionTreeModel, RandomForestModel,
+                        GradientBoostingModel, SGDLogisticModel)
+
+
+def measure(func, records):
+    """
+    Latence médiane par appel (secondes) sur une liste de clients.
+    """
+    timings = np.empty(len(records))
+    for i, record in enumerate(records):
+        t0 = time.perf_counter()
+        func(record)
+        timings[i] = time.perf_counter() - t0
+    return float(np.median(timings)), float(np.percentile(timings, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=1000, help="Nombre de clients scorés un par un")
+    parser.add_argument('--csv', default=os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv'),
+                        help="CSV brut d'où sont tirés les clients")
+    parser.add_argument('--processed-dir', default=os.path.join(project_root, 'data', 'processed'),
+                        help="Dossier des données prétraitées (splits et préprocesseur)")
+    args = parser.parse_args()
+
+    X_train, _, _, y_train, _, _ = ProcessedDataStore(args.processed_dir).load(mmap=True)
+    preprocessor = DataPreprocessor.load(os.path.join(args.processed_dir, 'preprocessor.joblib'))
+    customers = pd.read_csv(args.csv, nrows=args.records).drop(columns=[TARGET_COLUMN], errors='ignore')
+    records = customers.to_dict(orient='records')
+
+    print(f"{'modèle':<30}{'DataFrame p50 (µs)':>20}{'record p50 (µs)':>17}{'record p99 (µs)':>17}"
+          f"{'gain':>8}{'écart max':>11}")
+    for model_class in (LogisticRegressionModel, SGDLogisticModel, DecisionTreeModel,
+                        RandomForestModel, GradientBoostingModel):
+        model = model_class()
+        model.set_n_jobs(1)
+        model.train(X_train, y_train)
+
+        def dataframe_path(record):
+            return model.predict_proba(preprocessor.transform(pd.DataFrame([record])))[0, 1]
+
+        def record_path(record):
+            return model.predict_record(record, preprocessor)
+
+        max_diff = max(abs(dataframe_path(r) - record_path(r)) for r in records)
+        t_frame, _ = measure(dataframe_path, records)
+        t_record, t_record_p99 = measure(record_path, records)
+        print(f"{model.name:<30}{t_frame * 1e6:>20.0f}{t_record * 1e6:>17.1f}{t_record_p99 * 1e6:>17.1f}"
+              f"{t_frame / t_record:>7.0f}x{max_diff:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
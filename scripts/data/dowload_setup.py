@@ -10,10 +10,16 @@ import pandas as pd
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.data import Dataset, DataPreprocessor
+from src.data import Dataset, DataPreprocessor, ProcessedDataStore
 
-def main():
-    
+def main(output_format='npy', preprocess=True):
+    """
+    Télécharge le dataset, le prétraite et sauvegarde les splits.
+
+    Args:
+        output_format (str): 'npy' (binaire memory-mappable), 'csv' ou 'both'
+        preprocess (bool): Prétraiter et sauvegarder les splits après le téléchargement
+    """
     dataset = Dataset()
     
     print("Téléchargement du dataset Telco Customer Churn")
@@ -28,9 +34,11 @@ def main():
     
     # Télécharger si nécessaire
     dataset.data_downloads()
+    if not preprocess:
+        return
     
-    # Charger et afficher un aperçu
-    df = dataset.load_data()
+    # Charger (types compacts) et afficher un aperçu
+    df = dataset.load_data(compact=True)
     if df is not None:
         print(f"\nAperçu des données:")
         print(df.head())
@@ -53,20 +61,19 @@ def main():
         print(f"Taille de l'ensemble de validation : {X_val.shape}")
         print(f"Taille de l'ensemble de test : {X_test.shape}")
         
-        # Créer le dossier processed s'il n'existe pas
+        # Sauvegarder les splits (binaire par défaut, CSV en option)
         processed_dir = os.path.join(project_root, 'data', 'processed')
-        os.makedirs(processed_dir, exist_ok=True)
-        
-        # Sauvegarder les fichiers
-        X_train.to_csv(os.path.join(processed_dir, 'X_train.csv'), index=False)
-        X_val.to_csv(os.path.join(processed_dir, 'X_val.csv'), index=False)
-        X_test.to_csv(os.path.join(processed_dir, 'X_test.csv'), index=False)
-        y_train.to_csv(os.path.join(processed_dir, 'y_train.csv'), index=False)
-        y_val.to_csv(os.path.join(processed_dir, 'y_val.csv'), index=False)
-        y_test.to_csv(os.path.join(processed_dir, 'y_test.csv'), index=False)
+        store = ProcessedDataStore(processed_dir)
+        store.save(X_train, X_val, X_test, y_train, y_val, y_test, fmt=output_format)
+        preprocessor.save(os.path.join(processed_dir, 'preprocessor.joblib'))
         
         print("\nLes données prétraitées ont été sauvegardées dans le dossier 'data/processed/'")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Téléchargement et préparation des données Telco")
+    parser.add_argument('--format', choices=ProcessedDataStore.FORMATS, default='npy',
+                        help="Format de sortie des splits (par défaut: npy)")
+    args = parser.parse_args()
+    main(output_format=args.format)
@@ -0,0 +1,49 @@
+"""
+Script de génération de données synthétiques au format Telco pour les tests de montée en charge
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.data.synthetic import SyntheticTelcoGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génération de clients Telco synthétiques")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Nombre de lignes à générer")
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help="Lignes par bloc")
+    parser.add_argument('--seed', type=int, default=42, help="Graine aléatoire")
+    parser.add_argument('--churn-rate', type=float, default=None,
+                        help="Taux de churn cible (par défaut celui du dataset réel)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help="Format de sortie")
+    parser.add_argument('--output', default=None, help="Fichier de sortie (par défaut data/synthetic/)")
+    parser.add_argument('--source', default=os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv'),
+                        help="Dataset réel servant à apprendre les distributions")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(
+        project_root, 'data', 'synthetic', f"telco_{args.rows}_seed{args.seed}.{args.format}"
+    )
+
+    print(f"Apprentissage des distributions sur {args.source}")
+    generator = SyntheticTelcoGenerator.from_csv(args.source, seed=args.seed, churn_rate=args.churn_rate)
+    print(f"Génération de {args.rows} lignes (taux de churn {generator.churn_rate:.3f}) -> {output}")
+
+    start = time.perf_counter()
+    if args.format == 'csv':
+        generator.write_csv(output, args.rows, args.chunksize)
+    else:
+        generator.write_parquet(output, args.rows, args.chunksize)
+    elapsed = time.perf_counter() - start
+
+    print(f"Terminé en {elapsed:.1f}s ({args.rows / elapsed:,.0f} lignes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Test de charge du service HTTP de scoring (python main.py serve).
+
+Des clients concurrents (une connexion persistante chacun) envoient des
+clients tirés d'un CSV brut, un par requête POST /score. Le script rapporte
+les latences (p50, p90, p99, max), le débit et la taille moyenne des
+micro-lots formés par le service.
+
+Usage:
+    python main.py serve --max-batch-size 64 --max-wait-ms 5 &
+    python scripts/load_test.py --requests 5000 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.data.schema import TARGET_COLUMN
+
+
+async def request(reader, writer, host, method, path, payload=None):
+    """
+    Envoie une requête HTTP/1.1 sur une connexion persistante.
+
+    Returns:
+        tuple: (statut, corps JSON décodé)
+    """
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(head[0].split(' ')[1])
+    length = next(int(line.split(':', 1)[1]) for line in head[1:] if line.lower().startswith('content-length'))
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def worker(host, port, records, counter, n_requests, latencies, errors):
+    """
+    Envoie des requêtes en boucle jusqu'à atteindre le nombre total demandé.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < n_requests:
+            i = counter[0]
+            counter[0] += 1
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, 'POST', '/score', records[i % len(records)])
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(args, records):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, before = await request(reader, writer, args.host, 'GET', '/health')
+
+    latencies, errors, counter = [], [], [0]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(args.host, args.port, records, counter, args.requests, latencies, errors)
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    _, after = await request(reader, writer, args.host, 'GET', '/health')
+    writer.close()
+
+    latencies_ms = np.array(latencies) * 1000
+    batches = after['batches'] - before['batches']
+    print(f" Modèle : {after['model']} (lots de {after['max_batch_size']} max, attente {after['max_wait_ms']:g} ms)")
+    print(f" {len(latencies)} requêtes, {args.concurrency} connexions, {len(errors)} erreur(s)")
+    print(f" Débit : {len(latencies) / elapsed:,.0f} requêtes/s")
+    print(f" Latence (ms) : p50 {np.percentile(latencies_ms, 50):.2f} | p90 {np.percentile(latencies_ms, 90):.2f} | "
+          f"p99 {np.percentile(latencies_ms, 99):.2f} | max {latencies_ms.max():.2f}")
+    if batches:
+        print(f" Micro-lots : {batches} (taille moyenne {(after['requests'] - before['requests']) / batches:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse du service")
+    parser.add_argument('--port', type=int, default=8080, help="Port du service")
+    parser.add_argument('--csv', default=os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv'),
+                        help="CSV brut d'où sont tirés les clients envoyés")
+    parser.add_argument('--requests', type=int, default=5000, help="Nombre total de requêtes")
+    parser.add_argument('--concurrency', type=int, default=64, help="Nombre de connexions simultanées")
+    args = parser.parse_args()
+
+    # Clients bruts tels qu'un CRM les enverrait (sans la cible)
+    customers = pd.read_csv(args.csv, nrows=10_000).drop(columns=[TARGET_COLUMN], errors='ignore')
+    records = customers.to_dict(orient='records')
+    asyncio.run(run(args, records))
+
+
+if __name__ == "__main__":
+    main()
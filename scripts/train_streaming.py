@@ -0,0 +1,52 @@
+"""
+Entraînement hors mémoire d'une régression logistique SGD sur un CSV brut
+(dataset réel ou extraction synthétique de grande taille), lu par blocs.
+
+Usage:
+    python scripts/train_streaming.py --csv data/synthetic/telco_10000000_seed42.csv --epochs 2
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.data import Dataset, DataPreprocessor
+from src.models.sgd_logistic import SGDLogisticModel
+from src.models.streaming import train_streaming
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default=os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv'),
+                        help="CSV brut d'entraînement")
+    parser.add_argument('--preprocessor', default=os.path.join(project_root, 'data', 'processed', 'preprocessor.joblib'),
+                        help="Préprocesseur ajusté (ajusté sur le premier bloc s'il n'existe pas)")
+    parser.add_argument('--chunksize', type=int, default=100_000, help="Lignes par bloc")
+    parser.add_argument('--epochs', type=int, default=1, help="Nombre de passes sur le fichier")
+    parser.add_argument('--alpha', type=float, default=1e-4, help="Régularisation L2")
+    parser.add_argument('--output', default=os.path.join(project_root, 'models', 'sgd_logistic.joblib'),
+                        help="Fichier du modèle entraîné")
+    args = parser.parse_args()
+
+    if os.path.exists(args.preprocessor):
+        preprocessor = DataPreprocessor.load(args.preprocessor)
+    else:
+        print(f"Préprocesseur absent ({args.preprocessor}) : ajustement sur le premier bloc")
+        first_chunk = next(Dataset().iter_chunks(chunksize=args.chunksize, csv_path=args.csv))
+        preprocessor = DataPreprocessor()
+        preprocessor.preprocess_data(first_chunk, 'Churn')
+
+    model = SGDLogisticModel(alpha=args.alpha)
+    train_streaming(model, preprocessor, args.csv, chunksize=args.chunksize, n_epochs=args.epochs)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    model.save_model(args.output)
+    print(f"Modèle sauvegardé dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,17 @@
 from .dataset import Dataset
 
 from .preprocessor import DataPreprocessor
+from .storage import ProcessedDataStore
+from .cache import DataCache
+from .encoder import CategoricalEncoder
+from .synthetic import SyntheticTelcoGenerator
 
 __all__ = [
     'Dataset',
     
     'DataPreprocessor',
+    'ProcessedDataStore',
+    'DataCache',
+    'CategoricalEncoder',
+    'SyntheticTelcoGenerator',
 ]
\ No newline at end of file
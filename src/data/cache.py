@@ -0,0 +1,180 @@
+"""
+Cache des données prétraitées, indexé par le contenu du fichier brut et la
+configuration du préprocesseur.
+
+Une entrée contient les splits (format ProcessedDataStore) et le préprocesseur
+ajusté. Si ni le fichier brut ni la configuration n'ont changé, le
+téléchargement et le preprocessing peuvent être ignorés.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from .storage import ProcessedDataStore
+
+
+class DataCache:
+    """
+    Cache sur disque des splits prétraités (data/cache/<clé>/).
+    """
+    META_NAME = 'meta.json'
+    PREPROCESSOR_NAME = 'preprocessor.joblib'
+    ENTRY_FILES = ('X.npy', 'y.npy', ProcessedDataStore.MANIFEST_NAME, PREPROCESSOR_NAME)
+
+    def __init__(self, cache_dir='data/cache'):
+        self.cache_dir = os.path.normpath(str(cache_dir))
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def file_hash(filepath, block_size=1 << 20):
+        """
+        Calcule le SHA-256 d'un fichier par lecture bufferisée.
+
+        Args:
+            filepath (str): Fichier à hacher
+            block_size (int): Taille des blocs lus
+
+        Returns:
+            str: Empreinte hexadécimale
+        """
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def make_key(self, raw_path, config, raw_hash=None):
+        """
+        Construit la clé de cache à partir du fichier brut et de la configuration.
+
+        Args:
+            raw_path (str): Fichier CSV brut
+            config (dict): Configuration du préprocesseur (DataPreprocessor.get_config)
+            raw_hash (str): Empreinte déjà connue du fichier brut (évite de le relire)
+
+        Returns:
+            str: Clé de cache
+        """
+        raw_hash = raw_hash or self.file_hash(raw_path)
+        payload = json.dumps({'raw': raw_hash, 'config': config}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    def entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def has(self, key):
+        """
+        Vérifie si une entrée complète existe pour la clé.
+        """
+        entry = self.entry_dir(key)
+        return all(os.path.exists(os.path.join(entry, name)) for name in self.ENTRY_FILES + (self.META_NAME,))
+
+    def store(self, key, processed_dir, config=None):
+        """
+        Copie les splits et le préprocesseur de processed_dir dans une nouvelle entrée.
+
+        Args:
+            key (str): Clé de cache
+            processed_dir (str): Dossier contenant X.npy, y.npy, manifest.json et preprocessor.joblib
+            config (dict): Configuration enregistrée dans les métadonnées
+        """
+        entry = self.entry_dir(key)
+        tmp_entry = entry + '.tmp'
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        os.makedirs(tmp_entry)
+
+        for name in self.ENTRY_FILES:
+            shutil.copyfile(os.path.join(processed_dir, name), os.path.join(tmp_entry, name))
+
+        with open(os.path.join(tmp_entry, self.META_NAME), 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'created': time.time(), 'config': config}, f, indent=2)
+
+        # Publication atomique de l'entrée
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp_entry, entry)
+
+    def restore(self, key, processed_dir):
+        """
+        Recopie une entrée du cache dans processed_dir et marque son utilisation.
+
+        Args:
+            key (str): Clé de cache
+            processed_dir (str): Dossier de destination
+        """
+        entry = self.entry_dir(key)
+        os.makedirs(processed_dir, exist_ok=True)
+        for name in self.ENTRY_FILES:
+            shutil.copyfile(os.path.join(entry, name), os.path.join(processed_dir, name))
+        self.touch(key)
+
+    def touch(self, key):
+        """
+        Met à jour la date de dernière utilisation d'une entrée.
+        """
+        os.utime(os.path.join(self.entry_dir(key), self.META_NAME))
+
+    def entries(self):
+        """
+        Liste les entrées du cache.
+
+        Returns:
+            list: Dictionnaires (key, last_used, size) triés du plus ancien au plus récent
+        """
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            entry = self.entry_dir(key)
+            meta_path = os.path.join(entry, self.META_NAME)
+            if not os.path.isdir(entry) or not os.path.exists(meta_path):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(entry, name))
+                for name in os.listdir(entry)
+            )
+            entries.append({'key': key, 'last_used': os.path.getmtime(meta_path), 'size': size})
+        return sorted(entries, key=lambda e: e['last_used'])
+
+    def evict(self, max_age_days=None, max_size_mb=None, keep=None):
+        """
+        Supprime les entrées trop anciennes puis les moins récemment utilisées
+        jusqu'à respecter la taille maximale.
+
+        Args:
+            max_age_days (float): Âge maximal depuis la dernière utilisation
+            max_size_mb (float): Taille totale maximale du cache
+            keep (str): Clé à ne jamais supprimer (entrée en cours d'utilisation)
+
+        Returns:
+            list: Clés supprimées
+        """
+        removed = []
+        entries = [e for e in self.entries() if e['key'] != keep]
+
+        if max_age_days is not None:
+            limit = time.time() - max_age_days * 86400
+            for entry in [e for e in entries if e['last_used'] < limit]:
+                self.remove(entry['key'])
+                removed.append(entry['key'])
+                entries.remove(entry)
+
+        if max_size_mb is not None:
+            kept_size = sum(e['size'] for e in self.entries() if e['key'] == keep)
+            total = kept_size + sum(e['size'] for e in entries)
+            while entries and total > max_size_mb * 1e6:
+                entry = entries.pop(0)
+                self.remove(entry['key'])
+                removed.append(entry['key'])
+                total -= entry['size']
+
+        return removed
+
+    def remove(self, key):
+        shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+
+    def clear(self):
+        """
+        Vide entièrement le cache.
+        """
+        for entry in self.entries():
+            self.remove(entry['key'])
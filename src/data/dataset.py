@@ -1,10 +1,14 @@
 import pandas as pd
 import subprocess
 import zipfile
+import hashlib
+import json
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from .schema import RAW_DTYPES, RAW_NA_VALUES, COMPACT_DTYPES, TRUE_VALUES, FALSE_VALUES
+
 load_dotenv()
 
 class Dataset:
@@ -22,6 +26,9 @@ class Dataset:
         # Fichier CSV attendu pour le churn prediction
         self.csv_filename = "WA_Fn-UseC_-Telco-Customer-Churn.csv"
         
+        # Manifeste écrit à côté du CSV (dimensions, colonnes, checksum)
+        self.manifest_filename = self.csv_filename + ".manifest.json"
+        
         # Créer le dossier s'il n'existe pas
         os.makedirs(self.dataset_path, exist_ok=True)
 
@@ -38,9 +45,8 @@ class Dataset:
         """
         if self.data_already_downloaded():
             print(" Le dataset Telco Customer Churn existe déjà, téléchargement ignoré.")
-            csv_path = os.path.join(self.dataset_path, self.csv_filename)
-            df = pd.read_csv(csv_path)
-            print(f" Dimensions: {df.shape[0]} lignes, {df.shape[1]} colonnes")
+            info = self.probe()
+            print(f" Dimensions: {info['rows']} lignes, {len(info['columns'])} colonnes")
             return
 
         # Vérifier d'abord s'il y a déjà un fichier ZIP à extraire
@@ -110,32 +116,137 @@ class Dataset:
         try:
             print(f" Extraction du fichier ZIP: {zip_to_extract}")
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(self.dataset_path)
+                members = [m for m in zip_ref.infolist() if os.path.basename(m.filename) == self.csv_filename]
+                if not members:
+                    print("Le fichier CSV attendu n'a pas été trouvé dans l'archive")
+                    print(f" Contenu: {', '.join(zip_ref.namelist())}")
+                    return False
+                info = self._extract_member(zip_ref, members[0])
 
             # Supprimer le fichier ZIP après extraction
             os.remove(zip_path)
             print("Extraction terminée, fichier ZIP supprimé")
-
-            # Vérifier que le fichier CSV est présent
-            csv_path = os.path.join(self.dataset_path, self.csv_filename)
-            if os.path.exists(csv_path):
-                df = pd.read_csv(csv_path)
-                print(f"Dataset extrait avec succès!")
-                print(f" Fichier: {self.csv_filename}")
-                print(f" Dimensions: {df.shape[0]} lignes, {df.shape[1]} colonnes")
-                return True
-            else:
-                print("Le fichier CSV attendu n'a pas été trouvé après extraction")
-                self._list_downloaded_files()
-                return False
+            print(f"Dataset extrait avec succès!")
+            print(f" Fichier: {self.csv_filename}")
+            print(f" Dimensions: {info['rows']} lignes, {len(info['columns'])} colonnes")
+            return True
                 
-        except zipfile.BadZipFile:
-            print(f" Le fichier {zip_to_extract} n'est pas un fichier ZIP valide")
+        except zipfile.BadZipFile as e:
+            print(f" Le fichier {zip_to_extract} n'est pas un fichier ZIP valide: {e}")
             return False
         except Exception as e:
             print(f" Erreur lors de l'extraction: {e}")
             return False
 
+    def _extract_member(self, zip_ref, member):
+        """
+        Extrait en streaming le seul membre CSV attendu, en calculant au passage
+        le checksum et le nombre de lignes, puis écrit le manifeste.
+        
+        Returns:
+            dict: Contenu du manifeste
+        """
+        csv_path = os.path.join(self.dataset_path, self.csv_filename)
+        tmp_path = csv_path + ".part"
+        scan = _FileScan()
+        
+        # La lecture du membre vérifie le CRC de l'archive
+        with zip_ref.open(member) as src, open(tmp_path, 'wb') as dst:
+            for block in iter(lambda: src.read(1 << 20), b''):
+                scan.update(block)
+                dst.write(block)
+        
+        if scan.size != member.file_size:
+            os.remove(tmp_path)
+            raise zipfile.BadZipFile(
+                f"Extraction partielle de {member.filename}: {scan.size} octets sur {member.file_size}"
+            )
+        
+        os.replace(tmp_path, csv_path)
+        info = self._write_manifest(csv_path, scan)
+        
+        # Relire le fichier écrit : une écriture disque incomplète est détectée ici
+        if not self.verify():
+            os.remove(csv_path)
+            os.remove(os.path.join(self.dataset_path, self.manifest_filename))
+            raise zipfile.BadZipFile(f"Le fichier extrait {self.csv_filename} ne correspond pas à l'archive")
+        return info
+
+    def _write_manifest(self, csv_path, scan):
+        stat = os.stat(csv_path)
+        info = {
+            'filename': self.csv_filename,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'rows': scan.rows,
+            'columns': scan.columns,
+            'sha256': scan.sha256.hexdigest()
+        }
+        with open(os.path.join(self.dataset_path, self.manifest_filename), 'w', encoding='utf-8') as f:
+            json.dump(info, f, indent=2)
+        return info
+
+    def _read_manifest(self):
+        manifest_path = os.path.join(self.dataset_path, self.manifest_filename)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def probe(self):
+        """
+        Retourne les métadonnées du CSV (lignes, colonnes, checksum) sans le parser.
+        
+        Si le manifeste correspond au fichier (taille et date de modification),
+        il est renvoyé tel quel (temps constant). Sinon le fichier est parcouru
+        une fois par blocs d'octets et le manifeste est réécrit. Un manifeste
+        périmé dont le checksum ne correspond plus au fichier signale une
+        extraction corrompue ou partielle (ValueError) ; supprimer le manifeste
+        pour accepter un fichier modifié volontairement.
+        
+        Returns:
+            dict: Métadonnées du fichier, ou None si le fichier est absent
+        """
+        csv_path = os.path.join(self.dataset_path, self.csv_filename)
+        if not os.path.exists(csv_path):
+            return None
+        
+        stat = os.stat(csv_path)
+        info = self._read_manifest()
+        if info and info['size'] == stat.st_size and info['mtime_ns'] == stat.st_mtime_ns:
+            return info
+        if info and not self.verify():
+            raise ValueError(f"{csv_path} ne correspond plus à son manifeste : "
+                             f"supprimez-le et relancez l'extraction, ou supprimez {self.manifest_filename}")
+        
+        scan = _FileScan()
+        with open(csv_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                scan.update(block)
+        return self._write_manifest(csv_path, scan)
+
+    def verify(self):
+        """
+        Recalcule le checksum du CSV et le compare au manifeste.
+        
+        Returns:
+            bool: True si le fichier correspond au manifeste
+        """
+        csv_path = os.path.join(self.dataset_path, self.csv_filename)
+        info = self._read_manifest()
+        if info is None or not os.path.exists(csv_path):
+            return False
+        
+        digest = hashlib.sha256()
+        with open(csv_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        
+        if digest.hexdigest() != info['sha256']:
+            print(f" Checksum invalide pour {self.csv_filename} : extraction corrompue ou partielle")
+            return False
+        return True
+
     def _list_downloaded_files(self):
         """
         Liste les fichiers téléchargés pour debug
@@ -146,9 +257,13 @@ class Dataset:
             if os.path.isfile(file_path):
                 print(f"   - {file}")
 
-    def load_data(self):
+    def load_data(self, compact=False):
         """
         Charge le fichier CSV du dataset churn.
+        
+        Args:
+            compact (bool): Charger chaque colonne directement dans le plus petit
+                type correct (catégories, booléens, float32, TotalCharges numérique)
         """
         try:
             csv_path = os.path.join(self.dataset_path, self.csv_filename)
@@ -159,7 +274,16 @@ class Dataset:
                 print("Ou téléchargez manuellement et placez archive.zip dans data/raw/")
                 return None
                 
-            df = pd.read_csv(csv_path)
+            if compact:
+                df = pd.read_csv(
+                    csv_path,
+                    dtype=COMPACT_DTYPES,
+                    na_values=RAW_NA_VALUES,
+                    true_values=TRUE_VALUES,
+                    false_values=FALSE_VALUES
+                )
+            else:
+                df = pd.read_csv(csv_path)
             print(f" Dataset chargé: {df.shape[0]} lignes, {df.shape[1]} colonnes")
             return df
             
@@ -173,6 +297,62 @@ class Dataset:
             print(f" Erreur inattendue lors du chargement: {e}")
             return None
 
+    def iter_chunks(self, chunksize=100_000, csv_path=None):
+        """
+        Lit le fichier CSV par blocs de taille fixe avec un schéma de types explicite.
+        
+        La mémoire utilisée est bornée par la taille d'un bloc, ce qui permet de
+        traiter des extractions de plusieurs dizaines de millions de lignes.
+        
+        Args:
+            chunksize (int): Nombre de lignes par bloc
+            csv_path (str): Fichier à lire (par défaut le CSV du dataset)
+            
+        Yields:
+            pd.DataFrame: Bloc de données typé (category, float32, int8)
+        """
+        csv_path = csv_path or os.path.join(self.dataset_path, self.csv_filename)
+        
+        if not os.path.exists(csv_path):
+            print(f" Fichier non trouvé: {csv_path}")
+            print("Exécutez d'abord data_downloads() pour télécharger le dataset")
+            return
+        
+        with pd.read_csv(
+            csv_path,
+            dtype=RAW_DTYPES,
+            na_values=RAW_NA_VALUES,
+            chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def memory_report(self):
+        """
+        Compare l'empreinte mémoire du chargement par défaut et du chargement compact.
+        
+        Returns:
+            pd.DataFrame: Octets par colonne avant/après et facteur de réduction
+        """
+        df_default = self.load_data()
+        df_compact = self.load_data(compact=True)
+        if df_default is None or df_compact is None:
+            return None
+        
+        report = pd.DataFrame({
+            'dtype_before': df_default.dtypes.astype(str),
+            'bytes_before': df_default.memory_usage(index=False, deep=True),
+            'dtype_after': df_compact.dtypes.astype(str),
+            'bytes_after': df_compact.memory_usage(index=False, deep=True)
+        })
+        report.loc['TOTAL', ['bytes_before', 'bytes_after']] = report[['bytes_before', 'bytes_after']].sum()
+        report['reduction'] = (report['bytes_before'] / report['bytes_after']).round(1)
+        
+        print(f" Mémoire: {report.loc['TOTAL', 'bytes_before'] / 1e6:.2f} Mo -> "
+              f"{report.loc['TOTAL', 'bytes_after'] / 1e6:.2f} Mo "
+              f"(x{report.loc['TOTAL', 'reduction']})")
+        return report
+
     def get_dataset_info(self):
         """
         Retourne les informations sur le dataset
@@ -183,3 +363,36 @@ class Dataset:
             "csv_filename": self.csv_filename,
             "is_downloaded": self.data_already_downloaded()
         }
+
+
+class _FileScan:
+    """
+    Accumule checksum, taille, en-tête et nombre de lignes d'un CSV lu par blocs.
+    
+    Le comptage se fait sur les sauts de ligne : les champs entre guillemets
+    contenant des retours à la ligne ne sont pas gérés (absents du dataset Telco).
+    """
+    def __init__(self):
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self.newlines = 0
+        self.header = b''
+        self.last_byte = b''
+
+    def update(self, block):
+        self.sha256.update(block)
+        self.size += len(block)
+        self.newlines += block.count(b'\n')
+        if b'\n' not in self.header:
+            self.header += block[:block.find(b'\n') + 1 if b'\n' in block else len(block)]
+        self.last_byte = block[-1:]
+
+    @property
+    def columns(self):
+        header = self.header.decode('utf-8-sig').strip()
+        return header.split(',') if header else []
+
+    @property
+    def rows(self):
+        lines = self.newlines + (1 if self.last_byte not in (b'', b'\n') else 0)
+        return max(lines - 1, 0)
@@ -0,0 +1,155 @@
+"""
+Encodeur catégoriel par tables de correspondance.
+
+Remplace les LabelEncoder colonne par colonne : les catégories apprises sont
+triées (mêmes codes que LabelEncoder) et l'encodage est une recherche
+vectorisée dans un index de hachage, ou une simple indexation des codes pour
+les colonnes de type category. Les catégories inconnues reçoivent un code
+réservé au lieu de lever une erreur.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .schema import TRUE_VALUES, FALSE_VALUES
+
+
+class CategoricalEncoder:
+    """
+    Encode plusieurs colonnes catégorielles en codes entiers.
+    """
+    def __init__(self, columns, unknown_value=-1, n_jobs=1):
+        """
+        Args:
+            columns (list): Colonnes à encoder
+            unknown_value (int): Code réservé aux catégories absentes du fit
+            n_jobs (int): Nombre de threads pour encoder les colonnes en parallèle
+        """
+        self.columns = list(columns)
+        self.unknown_value = unknown_value
+        self.n_jobs = n_jobs
+        self.categories_ = {}
+
+    def fit(self, df):
+        """
+        Apprend les catégories (triées) de chaque colonne présente dans df.
+
+        Args:
+            df (pd.DataFrame): Données d'apprentissage
+
+        Returns:
+            CategoricalEncoder: L'instance ajustée
+        """
+        self.categories_ = {}
+        for col in self.columns:
+            if col in df.columns:
+                values = pd.unique(df[col].dropna().to_numpy(dtype=object))
+                self.categories_[col] = pd.Index(np.sort(values), dtype=object)
+        return self
+
+    def transform_column(self, series, col, fill_value=None):
+        """
+        Encode une colonne.
+
+        Args:
+            series (pd.Series): Valeurs brutes
+            col (str): Nom de la colonne apprise
+            fill_value: Valeur d'imputation des manquants (code réservé si None)
+
+        Returns:
+            np.ndarray: Codes entiers (int64)
+        """
+        categories = self.categories_[col]
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Table code du lot -> code appris, calculée sur les seules catégories du lot
+            table = categories.get_indexer(self._as_learned(series.cat.categories.to_numpy(dtype=object), categories))
+            table = np.append(table, -1)  # code -1 (manquant) -> dernière case
+            codes = table[series.cat.codes.to_numpy()]
+            missing = series.cat.codes.to_numpy() < 0
+        elif pd.api.types.is_bool_dtype(series.dtype):
+            # Booléens (nullable) : table False/True indexée directement par la valeur
+            labels = [False, True] if self._is_boolean(categories) else [FALSE_VALUES[0], TRUE_VALUES[0]]
+            table = np.append(categories.get_indexer(labels), -1)
+            values = series.to_numpy(dtype=np.int8, na_value=-1)
+            codes = table[values]
+            missing = values < 0
+        else:
+            values = self._as_learned(series.to_numpy(dtype=object), categories)
+            codes = categories.get_indexer(values)
+            missing = pd.isna(values)
+
+        codes = codes.astype(np.int64, copy=False)
+        codes[(codes < 0) & ~missing] = self.unknown_value
+
+        if missing.any():
+            fill_code = categories.get_indexer([fill_value])[0] if fill_value is not None else -1
+            codes[missing] = fill_code if fill_code >= 0 else self.unknown_value
+
+        return codes
+
+    @staticmethod
+    def _is_boolean(categories):
+        return len(categories) > 0 and all(isinstance(c, (bool, np.bool_)) for c in categories)
+
+    @classmethod
+    def _as_learned(cls, values, categories):
+        """
+        Convertit les libellés 'Yes'/'No' en booléens si l'encodeur a été
+        ajusté sur le chargement compact (colonnes booléennes).
+        """
+        if not cls._is_boolean(categories):
+            return values
+        labels = pd.Series(values, dtype=object)
+        values = values.copy()
+        values[labels.isin(TRUE_VALUES).to_numpy()] = True
+        values[labels.isin(FALSE_VALUES).to_numpy()] = False
+        return values
+
+    def transform_into(self, df, out, positions, fill_values=None, rows=None):
+        """
+        Encode toutes les colonnes directement dans les colonnes d'une matrice.
+
+        Args:
+            df (pd.DataFrame): Données brutes
+            out (np.ndarray): Matrice de sortie
+            positions (dict): Colonne -> indice de colonne dans out
+            fill_values (dict): Valeurs d'imputation par colonne
+            rows (np.ndarray): Ligne de out où écrire chaque ligne de df (toutes, dans l'ordre, si None)
+        """
+        fill_values = fill_values or {}
+        target_rows = slice(None) if rows is None else rows
+
+        def encode(col):
+            out[target_rows, positions[col]] = self.transform_column(df[col], col, fill_values.get(col))
+
+        columns = [col for col in self.categories_ if col in positions]
+        if self.n_jobs is not None and self.n_jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                list(executor.map(encode, columns))
+        else:
+            for col in columns:
+                encode(col)
+
+    def transform(self, df):
+        """
+        Encode les colonnes apprises et retourne un DataFrame.
+
+        Args:
+            df (pd.DataFrame): Données brutes
+
+        Returns:
+            pd.DataFrame: Copie de df avec les colonnes catégorielles encodées
+        """
+        columns = [col for col in self.categories_ if col in df.columns]
+        codes = np.empty((len(df), len(columns)), dtype=np.int64)
+        self.transform_into(df, codes, {col: j for j, col in enumerate(columns)})
+
+        df_encoded = df.copy()
+        for j, col in enumerate(columns):
+            df_encoded[col] = codes[:, j]
+        return df_encoded
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
@@ -1,30 +1,70 @@
 import pandas as pd
 import numpy as np
+import joblib
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
 
+from .schema import NUMERIC_COLUMNS, CATEGORICAL_COLUMNS, ID_COLUMN, TRUE_VALUES, FALSE_VALUES
+from .encoder import CategoricalEncoder
+
 class DataPreprocessor:
-    def __init__(self):
+    # Version du pipeline : à incrémenter quand la sortie du preprocessing change
+    VERSION = 3
+
+    def __init__(self, n_jobs=1):
+        """
+        Args:
+            n_jobs (int): Nombre de threads pour l'encodage des colonnes catégorielles
+        """
         self.scaler = StandardScaler()
-        self.label_encoders = {}
+        self.label_encoders = {}  # Encodeur de la variable cible
+        
+        # État appris par fit() : valeurs d'imputation, ordre des features et
+        # type des colonnes numériques (float32 sur le chargement compact)
+        self.fill_values = {}
+        self.feature_names = None
+        self.numeric_dtypes = {}
+        self.is_fitted = False
         
         # Définir les colonnes à traiter
-        self.numeric_columns = ['tenure', 'MonthlyCharges', 'TotalCharges']
-        self.categorical_columns = [
-            'gender', 'Partner', 'Dependents', 'PhoneService',
-            'MultipleLines', 'InternetService', 'OnlineSecurity',
-            'OnlineBackup', 'DeviceProtection', 'TechSupport',
-            'StreamingTV', 'StreamingMovies', 'Contract',
-            'PaperlessBilling', 'PaymentMethod'
-        ]
-        self.columns_to_drop = ['customerID']
-        
-    def clean_data(self, df):
+        self.numeric_columns = list(NUMERIC_COLUMNS)
+        self.categorical_columns = list(CATEGORICAL_COLUMNS)
+        self.columns_to_drop = [ID_COLUMN]
+        
+        # Encodeur des features catégorielles (code -1 pour les catégories inconnues)
+        self.encoder = CategoricalEncoder(self.categorical_columns, unknown_value=-1, n_jobs=n_jobs)
+        
+        # Paramètres de division train/validation/test
+        self.test_size = 0.2
+        self.val_size = 0.25
+        self.random_state = 42
+        
+    def get_config(self):
+        """
+        Retourne la configuration du preprocessing (utilisée comme clé de cache)
+        
+        Returns:
+            dict: Version, colonnes traitées et paramètres de division
+        """
+        return {
+            'version': self.VERSION,
+            'numeric_columns': self.numeric_columns,
+            'numeric_dtypes': dict(getattr(self, 'numeric_dtypes', {})),
+            'categorical_columns': self.categorical_columns,
+            'columns_to_drop': self.columns_to_drop,
+            'test_size': self.test_size,
+            'val_size': self.val_size,
+            'random_state': self.random_state
+        }
+
+    def clean_data(self, df, fit=True):
         """
         Nettoie les données en gérant les valeurs manquantes et les doublons
         
         Args:
             df (pd.DataFrame): DataFrame à nettoyer
+            fit (bool): Calculer les valeurs d'imputation (moyennes, modes) sur df.
+                Si False, les valeurs apprises lors du fit sont réutilisées.
             
         Returns:
             pd.DataFrame: DataFrame nettoyé
@@ -38,44 +78,43 @@ class DataPreprocessor:
         # Convertir TotalCharges en numérique (car c'est une string dans le dataset)
         df_clean['TotalCharges'] = pd.to_numeric(df_clean['TotalCharges'], errors='coerce')
         
-        # Gérer les valeurs manquantes numériques
-        for col in self.numeric_columns:
-            df_clean[col] = df_clean[col].fillna(df_clean[col].mean())
+        if fit:
+            self.fill_values = {col: df_clean[col].mean() for col in self.numeric_columns}
+            self.fill_values.update({col: df_clean[col].mode()[0] for col in self.categorical_columns})
         
-        # Gérer les valeurs manquantes catégorielles
-        for col in self.categorical_columns:
-            df_clean[col] = df_clean[col].fillna(df_clean[col].mode()[0])
+        # Gérer les valeurs manquantes numériques et catégorielles
+        for col in self.numeric_columns + self.categorical_columns:
+            if col in df_clean.columns:
+                df_clean[col] = df_clean[col].fillna(self.fill_values[col])
         
         return df_clean
 
-    def encode_categorical(self, df):
+    def encode_categorical(self, df, fit=True):
         """
-        Encode les variables catégorielles en utilisant LabelEncoder
+        Encode les variables catégorielles (tables de correspondance triées,
+        mêmes codes que LabelEncoder ; code -1 pour les catégories inconnues)
         
         Args:
             df (pd.DataFrame): DataFrame avec variables catégorielles
+            fit (bool): Ajuster les encodeurs sur df. Si False, les encodeurs
+                déjà ajustés sont appliqués tels quels.
             
         Returns:
             pd.DataFrame: DataFrame avec variables catégorielles encodées
         """
-        # Créer une copie pour éviter de modifier les données originales
-        df_encoded = df.copy()
-        
-        # Encoder uniquement les colonnes catégorielles spécifiées
-        for col in self.categorical_columns:
-            if col in df_encoded.columns:
-                if col not in self.label_encoders:
-                    self.label_encoders[col] = LabelEncoder()
-                df_encoded[col] = self.label_encoders[col].fit_transform(df_encoded[col])
-        
-        return df_encoded
+        # Encoder uniquement les colonnes catégorielles spécifiées (retourne une copie)
+        if fit:
+            return self.encoder.fit_transform(df)
+        return self.encoder.transform(df)
 
-    def scale_numerical(self, df):
+    def scale_numerical(self, df, fit=True):
         """
         Standardise les variables numériques
         
         Args:
             df (pd.DataFrame): DataFrame avec variables numériques
+            fit (bool): Ajuster le scaler sur df. Si False, les moyennes et
+                écarts-types appris sont réutilisés.
             
         Returns:
             pd.DataFrame: DataFrame avec variables numériques standardisées
@@ -86,39 +125,293 @@ class DataPreprocessor:
         # Standardiser uniquement les colonnes numériques spécifiées
         columns_to_scale = [col for col in self.numeric_columns if col in df_scaled.columns]
         if len(columns_to_scale) > 0:
-            df_scaled[columns_to_scale] = self.scaler.fit_transform(df_scaled[columns_to_scale])
+            if fit:
+                df_scaled[columns_to_scale] = self.scaler.fit_transform(df_scaled[columns_to_scale])
+            else:
+                df_scaled[columns_to_scale] = self.scaler.transform(df_scaled[columns_to_scale])
         
         return df_scaled
 
-    def split_data(self, X, y, test_size=0.2, val_size=0.25):
+    def fit(self, df, target_column=None):
         """
-        Divise les données en ensembles train, validation et test
+        Apprend les statistiques de nettoyage, les correspondances des
+        catégories et les paramètres du scaler, colonne par colonne et sans
+        copier le DataFrame
         
         Args:
-            X (pd.DataFrame): Features
-            y (pd.Series): Variable cible
-            test_size (float): Proportion de données pour le test (par défaut 0.2 soit 20%)
-            val_size (float): Proportion des données d'entraînement pour la validation (par défaut 0.25 soit 25%)
+            df (pd.DataFrame): Données brutes
+            target_column (str): Colonne cible à ignorer si elle est présente
             
         Returns:
-            tuple: (X_train, X_val, X_test, y_train, y_val, y_test)
+            DataPreprocessor: L'instance ajustée
+        """
+        excluded = set(self.columns_to_drop) | {target_column}
+        self.feature_names = [col for col in df.columns if col not in excluded]
+        self.fill_values = {}
+        self.numeric_dtypes = {}
+        
+        # Colonnes numériques : moyenne d'imputation puis paramètres du scaler
+        numeric_columns = [col for col in self.numeric_columns if col in self.feature_names]
+        numeric = {}
+        for col in numeric_columns:
+            values = pd.to_numeric(df[col], errors='coerce')
+            self.numeric_dtypes[col] = values.dtype.name
+            self.fill_values[col] = values.mean()
+            numeric[col] = values.fillna(self.fill_values[col])
+        if numeric_columns:
+            self.scaler.fit(pd.DataFrame(numeric))
+        del numeric
+        
+        # Colonnes catégorielles : mode d'imputation puis tables des catégories
+        categorical_columns = [col for col in self.categorical_columns if col in self.feature_names]
+        for col in categorical_columns:
+            self.fill_values[col] = df[col].mode()[0]
+        self.encoder.fit(df)
+        
+        self.is_fitted = True
+        self._record_plan = None
+        return self
+
+    def transform_array(self, df, out=None, dtype=np.float64, rows=None):
         """
+        Applique tout le preprocessing en une passe, directement dans une
+        matrice de sortie préallouée (aucune copie intermédiaire du DataFrame)
+        
+        Args:
+            df (pd.DataFrame): Données brutes
+            out (np.ndarray): Matrice de sortie (n_lignes, n_features) à remplir.
+                Allouée si None.
+            dtype: Type de la matrice allouée
+            rows (np.ndarray): Ligne de out où écrire chaque ligne de df
+                (permutation). Par défaut, même ordre que df.
+            
+        Returns:
+            np.ndarray: Features prétraitées, dans l'ordre appris lors du fit
+        """
+        if not self.is_fitted:
+            raise ValueError("Le préprocesseur doit être ajusté (fit) avant transform")
+        
+        shape = (len(df), len(self.feature_names))
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"Matrice de sortie de forme {out.shape}, attendue {shape}")
+        
+        scaled_columns = list(self.scaler.feature_names_in_) if hasattr(self.scaler, 'feature_names_in_') else []
+        positions = {col: j for j, col in enumerate(self.feature_names)}
+        numeric_dtypes = getattr(self, 'numeric_dtypes', {})
+        
+        # Colonnes catégorielles : une passe vectorisée (éventuellement multi-thread)
+        self.encoder.transform_into(df, out, positions, fill_values=self.fill_values, rows=rows)
+        
+        target_rows = slice(None) if rows is None else rows
+        for j, col in enumerate(self.feature_names):
+            if col in self.encoder.categories_:
+                continue
+            elif col in scaled_columns:
+                k = scaled_columns.index(col)
+                # Arrondi au type vu lors du fit (float32 sur le chargement compact) :
+                # mêmes seuils de décision que les données d'entraînement
+                values = pd.to_numeric(df[col], errors='coerce')
+                if col in numeric_dtypes and values.dtype != numeric_dtypes[col]:
+                    values = values.astype(numeric_dtypes[col])
+                # Copie : la standardisation se fait en place, sans toucher à df
+                values = values.to_numpy(dtype=out.dtype, na_value=np.nan, copy=True)
+                values[np.isnan(values)] = self.fill_values[col]
+                values -= self.scaler.mean_[k]
+                values /= self.scaler.scale_[k]
+                out[target_rows, j] = values
+            else:
+                out[target_rows, j] = df[col].to_numpy(dtype=out.dtype)
+        
+        return out
+
+    def _build_record_plan(self):
+        """
+        Prépare, pour chaque feature dans l'ordre appris, la transformation
+        d'une valeur isolée (table des codes, moyenne et écart-type, imputation)
+        """
+        scaled_columns = list(self.scaler.feature_names_in_) if hasattr(self.scaler, 'feature_names_in_') else []
+        numeric_dtypes = getattr(self, 'numeric_dtypes', {})
+        plan = []
+        for col in self.feature_names:
+            if col in self.encoder.categories_:
+                categories = self.encoder.categories_[col]
+                codes = {category: float(code) for code, category in enumerate(categories)}
+                if self.encoder._is_boolean(categories):
+                    # Encodeur ajusté sur le chargement compact : libellés bruts 'Yes'/'No'
+                    codes.update({label: codes[True] for label in TRUE_VALUES if True in codes})
+                    codes.update({label: codes[False] for label in FALSE_VALUES if False in codes})
+                fill = codes.get(self.fill_values.get(col), float(self.encoder.unknown_value))
+                plan.append((col, 'categorical', (codes, fill, float(self.encoder.unknown_value))))
+            elif col in scaled_columns:
+                k = scaled_columns.index(col)
+                cast = np.dtype(numeric_dtypes.get(col, 'float64')).type
+                plan.append((col, 'scaled', (float(self.fill_values[col]), float(self.scaler.mean_[k]),
+                                             float(self.scaler.scale_[k]), cast)))
+            else:
+                plan.append((col, 'raw', None))
+        return plan
+
+    def encode_record(self, record, out=None):
+        """
+        Prétraite un seul client (dictionnaire brut) sans passer par pandas,
+        avec le même résultat que transform_array sur un DataFrame d'une ligne
+
+        Args:
+            record (dict): Valeurs brutes d'un client (colonnes du CSV Telco)
+            out (np.ndarray): Vecteur de sortie (n_features,) à remplir. Alloué si None.
+
+        Returns:
+            np.ndarray: Features prétraitées, dans l'ordre appris lors du fit
+        """
+        if not self.is_fitted:
+            raise ValueError("Le préprocesseur doit être ajusté (fit) avant transform")
+        plan = getattr(self, '_record_plan', None)
+        if plan is None:
+            plan = self._record_plan = self._build_record_plan()
+        if out is None:
+            out = np.empty(len(plan), dtype=np.float64)
+
+        for j, (col, kind, params) in enumerate(plan):
+            try:
+                value = record[col]
+            except KeyError:
+                raise ValueError(f"Champ manquant : {col}") from None
+            if kind == 'categorical':
+                codes, fill, unknown = params
+                if value is None or value != value:  # None ou NaN
+                    out[j] = fill
+                else:
+                    out[j] = codes.get(value, unknown)
+            elif kind == 'scaled':
+                fill, mean, scale, cast = params
+                try:
+                    # Même arrondi que transform_array (type des colonnes lors du fit)
+                    value = float(cast(float(value)))
+                except (TypeError, ValueError):
+                    value = fill
+                if value != value:
+                    value = fill
+                out[j] = (value - mean) / scale
+            else:
+                out[j] = value
+
+        return out
+
+    def transform(self, df):
+        """
+        Applique le preprocessing appris par fit() sans recalculer aucune statistique
+        
+        Args:
+            df (pd.DataFrame): Données brutes de nouveaux clients
+            
+        Returns:
+            pd.DataFrame: Features prétraitées, dans l'ordre appris lors du fit
+        """
+        return pd.DataFrame(self.transform_array(df), columns=self.feature_names, index=df.index, copy=False)
+
+    def fit_transform(self, df, target_column=None):
+        """
+        Apprend l'état du preprocessing puis transforme les données
+        
+        Args:
+            df (pd.DataFrame): Données brutes
+            target_column (str): Colonne cible à ignorer si elle est présente
+            
+        Returns:
+            pd.DataFrame: Features prétraitées
+        """
+        return self.fit(df, target_column=target_column).transform(df)
+
+    def save(self, filepath):
+        """
+        Sauvegarde le préprocesseur ajusté sur le disque
+        
+        Args:
+            filepath (str): Chemin du fichier de sortie
+        """
+        if not self.is_fitted:
+            raise ValueError("Pas de préprocesseur ajusté à sauvegarder")
+        joblib.dump(self, filepath)
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Charge un préprocesseur ajusté
+        
+        Args:
+            filepath (str): Chemin du fichier sauvegardé
+            
+        Returns:
+            DataPreprocessor: Préprocesseur prêt pour transform()
+        """
+        preprocessor = joblib.load(filepath)
+        if not isinstance(preprocessor, cls):
+            raise ValueError(f"Le fichier {filepath} ne contient pas un {cls.__name__}")
+        return preprocessor
+
+    def split_indices(self, y, test_size=None, val_size=None, stratify=True):
+        """
+        Calcule les indices (positions) des ensembles train, validation et test,
+        stratifiés sur la cible et reproductibles (self.random_state)
+        
+        Args:
+            y (array-like): Variable cible
+            test_size (float): Proportion de données pour le test (par défaut self.test_size, 0.2 soit 20%)
+            val_size (float): Proportion des données d'entraînement pour la validation (par défaut self.val_size, 0.25 soit 25%)
+            stratify (bool): Conserver la proportion de churn dans chaque ensemble
+            
+        Returns:
+            tuple: (train_idx, val_idx, test_idx) tableaux d'entiers triés
+        """
+        test_size = self.test_size if test_size is None else test_size
+        val_size = self.val_size if val_size is None else val_size
+        y = np.asarray(y)
+        positions = np.arange(len(y))
+        
         # Première division : séparer les données de test
-        X_train_val, X_test, y_train_val, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=42
+        train_val_idx, test_idx = train_test_split(
+            positions, test_size=test_size, random_state=self.random_state,
+            stratify=y if stratify else None
         )
         
         # Deuxième division : séparer les données de validation
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_train_val, y_train_val, test_size=val_size, random_state=42
+        train_idx, val_idx = train_test_split(
+            train_val_idx, test_size=val_size, random_state=self.random_state,
+            stratify=y[train_val_idx] if stratify else None
         )
         
-        return X_train, X_val, X_test, y_train, y_val, y_test
+        return np.sort(train_idx), np.sort(val_idx), np.sort(test_idx)
+
+    def split_data(self, X, y, test_size=None, val_size=None):
+        """
+        Divise les données en ensembles train, validation et test (stratifiés)
+        
+        Args:
+            X (pd.DataFrame): Features
+            y (pd.Series): Variable cible
+            test_size (float): Proportion de données pour le test (par défaut self.test_size, 0.2 soit 20%)
+            val_size (float): Proportion des données d'entraînement pour la validation (par défaut self.val_size, 0.25 soit 25%)
+            
+        Returns:
+            tuple: (X_train, X_val, X_test, y_train, y_val, y_test)
+        """
+        train_idx, val_idx, test_idx = self.split_indices(y, test_size, val_size)
+        
+        return (
+            X.iloc[train_idx], X.iloc[val_idx], X.iloc[test_idx],
+            y.iloc[train_idx], y.iloc[val_idx], y.iloc[test_idx]
+        )
 
     def preprocess_data(self, df, target_column):
         """
         Applique tout le pipeline de preprocessing sur les données
         
+        Les features sont écrites une seule fois dans une matrice ordonnée
+        [train | validation | test] : les six ensembles retournés sont des
+        vues de cette matrice, sans copie.
+        
         Args:
             df (pd.DataFrame): DataFrame brut
             target_column (str): Nom de la colonne cible
@@ -126,23 +419,30 @@ class DataPreprocessor:
         Returns:
             tuple: (X_train, X_val, X_test, y_train, y_val, y_test)
         """
-        # Séparer features et target
-        X = df.drop(columns=[target_column])
-        y = df[target_column]
-        
-        # Nettoyer les données
-        X = self.clean_data(X)
-        
-        # Encoder les variables catégorielles
-        X = self.encode_categorical(X)
-        
         # Encoder la variable cible
         if target_column not in self.label_encoders:
             self.label_encoders[target_column] = LabelEncoder()
-        y = pd.Series(self.label_encoders[target_column].fit_transform(y), index=y.index)
+        y = self.label_encoders[target_column].fit_transform(df[target_column])
+        
+        # Diviser par indices, puis placer chaque ligne à sa position dans la matrice finale
+        splits = self.split_indices(y)
+        order = np.concatenate(splits)
+        rows = np.empty(len(order), dtype=np.intp)
+        rows[order] = np.arange(len(order))
+        
+        # Nettoyer, encoder et standardiser les features en une passe, dans une
+        # seule matrice (état conservé pour transform)
+        self.fit(df, target_column=target_column)
+        X = self.transform_array(df, rows=rows)
+        y = y[order]
+        index = df.index[order]
         
-        # Standardiser les variables numériques
-        X = self.scale_numerical(X)
+        X_parts, y_parts = [], []
+        start = 0
+        for idx in splits:
+            stop = start + len(idx)
+            X_parts.append(pd.DataFrame(X[start:stop], columns=self.feature_names, index=index[start:stop], copy=False))
+            y_parts.append(pd.Series(y[start:stop], index=index[start:stop], copy=False))
+            start = stop
         
-        # Diviser les données
-        return self.split_data(X, y)
\ No newline at end of file
+        return (*X_parts, *y_parts)
@@ -1,4 +1,3 @@
-import pandas as pd
 import os
 import sys
 from pathlib import Path
@@ -7,15 +6,23 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
+from src.data.dataset import Dataset
 from src.data.preprocessor import DataPreprocessor
+from src.data.storage import ProcessedDataStore
 
-def main():
+def main(output_format='npy'):
+    """
+    Prétraite le dataset brut et sauvegarde les splits dans data/processed/.
+
+    Args:
+        output_format (str): 'npy' (binaire memory-mappable), 'csv' ou 'both'
+    """
     # Obtenir le chemin absolu du projet
     project_root = Path(__file__).parent.parent.parent
-    data_file = os.path.join(project_root, 'data', 'raw', 'WA_Fn-UseC_-Telco-Customer-Churn.csv')
+    dataset = Dataset(dataset_path=os.path.join(project_root, 'data', 'raw'))
     
-    # 1. Charger les données
-    df = pd.read_csv(data_file)
+    # 1. Charger les données (types compacts, TotalCharges numérique dès la lecture)
+    df = dataset.load_data(compact=True)
     print(f"Données chargées avec succès. Shape: {df.shape}")
     
     # 2. Créer une instance du préprocesseur
@@ -34,20 +41,18 @@ def main():
     print(f"Taille de l'ensemble de validation : {X_val.shape}")
     print(f"Taille de l'ensemble de test : {X_test.shape}")
     
-    # 5. Sauvegarder les données prétraitées (optionnel)
-    # Créer le dossier processed s'il n'existe pas
+    # 5. Sauvegarder les données prétraitées
     processed_dir = os.path.join(project_root, 'data', 'processed')
-    os.makedirs(processed_dir, exist_ok=True)
-    
-    # Sauvegarder les fichiers
-    X_train.to_csv(os.path.join(processed_dir, 'X_train.csv'), index=False)
-    X_val.to_csv(os.path.join(processed_dir, 'X_val.csv'), index=False)
-    X_test.to_csv(os.path.join(processed_dir, 'X_test.csv'), index=False)
-    y_train.to_csv(os.path.join(processed_dir, 'y_train.csv'), index=False)
-    y_val.to_csv(os.path.join(processed_dir, 'y_val.csv'), index=False)
-    y_test.to_csv(os.path.join(processed_dir, 'y_test.csv'), index=False)
+    store = ProcessedDataStore(processed_dir)
+    store.save(X_train, X_val, X_test, y_train, y_val, y_test, fmt=output_format)
+    preprocessor.save(os.path.join(processed_dir, 'preprocessor.joblib'))
     
     print("\nLes données prétraitées ont été sauvegardées dans le dossier 'data/processed/'")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Prétraitement des données Telco")
+    parser.add_argument('--format', choices=ProcessedDataStore.FORMATS, default='npy',
+                        help="Format de sortie des splits (par défaut: npy)")
+    args = parser.parse_args()
+    main(output_format=args.format)
@@ -0,0 +1,52 @@
+"""
+Schéma des colonnes du dataset Telco Customer Churn
+"""
+
+ID_COLUMN = 'customerID'
+TARGET_COLUMN = 'Churn'
+
+NUMERIC_COLUMNS = ['tenure', 'MonthlyCharges', 'TotalCharges']
+
+CATEGORICAL_COLUMNS = [
+    'gender', 'Partner', 'Dependents', 'PhoneService',
+    'MultipleLines', 'InternetService', 'OnlineSecurity',
+    'OnlineBackup', 'DeviceProtection', 'TechSupport',
+    'StreamingTV', 'StreamingMovies', 'Contract',
+    'PaperlessBilling', 'PaymentMethod'
+]
+
+# Ordre des colonnes du fichier brut
+RAW_COLUMNS = [
+    ID_COLUMN, 'gender', 'SeniorCitizen', 'Partner', 'Dependents', 'tenure',
+    'PhoneService', 'MultipleLines', 'InternetService', 'OnlineSecurity',
+    'OnlineBackup', 'DeviceProtection', 'TechSupport', 'StreamingTV',
+    'StreamingMovies', 'Contract', 'PaperlessBilling', 'PaymentMethod',
+    'MonthlyCharges', 'TotalCharges', TARGET_COLUMN
+]
+
+# Types explicites pour la lecture du CSV brut : catégories pandas pour les
+# colonnes textuelles, float32 pour les numériques (NaN possibles), int8 pour
+# l'indicateur SeniorCitizen
+RAW_DTYPES = {
+    ID_COLUMN: 'object',
+    'SeniorCitizen': 'int8',
+    **{col: 'float32' for col in NUMERIC_COLUMNS},
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+    TARGET_COLUMN: 'category'
+}
+
+# TotalCharges contient des chaînes vides (' ') pour les clients de tenure 0
+RAW_NA_VALUES = {'TotalCharges': [' ', '']}
+
+# Colonnes strictement Yes/No, chargées en booléens (nullable) par le
+# chargement compact
+BOOLEAN_COLUMNS = ['Partner', 'Dependents', 'PhoneService', 'PaperlessBilling', TARGET_COLUMN]
+TRUE_VALUES = ['Yes']
+FALSE_VALUES = ['No']
+
+# Types du chargement compact : chaque colonne dans le plus petit type correct
+COMPACT_DTYPES = {
+    **RAW_DTYPES,
+    ID_COLUMN: 'string[pyarrow]',
+    **{col: 'boolean' for col in BOOLEAN_COLUMNS}
+}
@@ -0,0 +1,147 @@
+"""
+Stockage binaire des données prétraitées (train/val/test).
+
+Les six jeux de données sont écrits dans deux fichiers .npy (X.npy et y.npy)
+où les splits occupent des plages de lignes contiguës, accompagnés d'un
+manifeste JSON (noms de colonnes, dtypes, plages). Le chargement se fait en
+memory-map : chaque split est une vue du fichier, sans copie ni parsing.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class ProcessedDataStore:
+    """
+    Lecture/écriture des splits prétraités dans data/processed/.
+    """
+    MANIFEST_NAME = 'manifest.json'
+    FORMAT_VERSION = 1
+    SPLITS = ('train', 'val', 'test')
+    FORMATS = ('npy', 'csv', 'both')
+
+    def __init__(self, processed_dir='data/processed'):
+        self.processed_dir = os.path.normpath(str(processed_dir))
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.processed_dir, self.MANIFEST_NAME)
+
+    def exists(self):
+        """
+        Vérifie si un stockage binaire est présent dans le dossier.
+        """
+        return os.path.exists(self.manifest_path)
+
+    def read_manifest(self):
+        """
+        Lit le manifeste JSON du stockage binaire.
+
+        Returns:
+            dict: Contenu du manifeste
+        """
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, X_train, X_val, X_test, y_train, y_val, y_test, fmt='npy'):
+        """
+        Sauvegarde les splits prétraités.
+
+        Args:
+            X_train, X_val, X_test (pd.DataFrame): Features des trois splits
+            y_train, y_val, y_test (pd.Series): Cibles des trois splits
+            fmt (str): 'npy' (binaire), 'csv' (export historique) ou 'both'
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Format inconnu: {fmt} (attendu: {', '.join(self.FORMATS)})")
+
+        os.makedirs(self.processed_dir, exist_ok=True)
+        X_splits = dict(zip(self.SPLITS, (X_train, X_val, X_test)))
+        y_splits = dict(zip(self.SPLITS, (y_train, y_val, y_test)))
+
+        if fmt in ('npy', 'both'):
+            self._save_npy(X_splits, y_splits)
+        if fmt in ('csv', 'both'):
+            self._save_csv(X_splits, y_splits)
+
+    def _save_npy(self, X_splits, y_splits):
+        columns = list(X_splits['train'].columns)
+        n_rows = sum(len(X) for X in X_splits.values())
+        y_dtype = np.result_type(*[np.asarray(y).dtype for y in y_splits.values()])
+
+        # Écriture directe dans les fichiers mappés, sans concaténation en mémoire
+        X_out = np.lib.format.open_memmap(
+            os.path.join(self.processed_dir, 'X.npy'), mode='w+',
+            dtype=np.float64, shape=(n_rows, len(columns))
+        )
+        y_out = np.lib.format.open_memmap(
+            os.path.join(self.processed_dir, 'y.npy'), mode='w+',
+            dtype=y_dtype, shape=(n_rows,)
+        )
+
+        ranges = {}
+        start = 0
+        for split in self.SPLITS:
+            X = X_splits[split]
+            stop = start + len(X)
+            X_out[start:stop] = X[columns].to_numpy(dtype=np.float64)
+            y_out[start:stop] = np.asarray(y_splits[split])
+            ranges[split] = [start, stop]
+            start = stop
+
+        X_out.flush()
+        y_out.flush()
+        del X_out, y_out
+
+        manifest = {
+            'format_version': self.FORMAT_VERSION,
+            'columns': columns,
+            'dtypes': {col: str(dtype) for col, dtype in X_splits['train'].dtypes.items()},
+            'X': {'file': 'X.npy', 'dtype': 'float64', 'shape': [n_rows, len(columns)]},
+            'y': {'file': 'y.npy', 'dtype': str(y_dtype), 'shape': [n_rows]},
+            'splits': ranges
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def _save_csv(self, X_splits, y_splits):
+        for split in self.SPLITS:
+            X_splits[split].to_csv(os.path.join(self.processed_dir, f'X_{split}.csv'), index=False)
+            y_splits[split].to_csv(os.path.join(self.processed_dir, f'y_{split}.csv'), index=False)
+
+    def load(self, mmap=True, restore_dtypes=False):
+        """
+        Charge les splits prétraités.
+
+        Args:
+            mmap (bool): Charger les tableaux en memory-map (lecture seule, sans copie)
+            restore_dtypes (bool): Restaurer les dtypes d'origine des colonnes (implique une copie)
+
+        Returns:
+            tuple: (X_train, X_val, X_test, y_train, y_val, y_test)
+        """
+        if not self.exists():
+            return self._load_csv()
+
+        manifest = self.read_manifest()
+        mmap_mode = 'r' if mmap else None
+        X = np.load(os.path.join(self.processed_dir, manifest['X']['file']), mmap_mode=mmap_mode)
+        y = np.load(os.path.join(self.processed_dir, manifest['y']['file']), mmap_mode=mmap_mode)
+
+        X_parts, y_parts = [], []
+        for split in self.SPLITS:
+            start, stop = manifest['splits'][split]
+            X_split = pd.DataFrame(X[start:stop], columns=manifest['columns'], copy=False)
+            if restore_dtypes:
+                X_split = X_split.astype(manifest['dtypes'])
+            X_parts.append(X_split)
+            y_parts.append(pd.Series(y[start:stop], copy=False))
+
+        return (*X_parts, *y_parts)
+
+    def _load_csv(self):
+        X_parts = [pd.read_csv(os.path.join(self.processed_dir, f'X_{split}.csv')) for split in self.SPLITS]
+        y_parts = [pd.read_csv(os.path.join(self.processed_dir, f'y_{split}.csv'))['0'] for split in self.SPLITS]
+        return (*X_parts, *y_parts)
@@ -0,0 +1,261 @@
+"""
+Générateur de données synthétiques au format Telco Customer Churn.
+
+Les distributions sont apprises sur le dataset réel : chaque colonne
+catégorielle est tirée conditionnellement à ses « parents » (le churn et,
+selon la colonne, le contrat, le service internet ou téléphonique), ce qui
+conserve les corrélations utiles (contrat vs churn, services internet
+cohérents avec InternetService, etc.). Les numériques sont rééchantillonnées
+dans la population réelle du même groupe. Le taux de churn est contrôlable
+et la génération est déterministe pour une graine et une taille de bloc données.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .schema import RAW_COLUMNS, ID_COLUMN, TARGET_COLUMN
+
+# Colonne -> colonnes dont elle dépend (ordre de génération)
+DEPENDENCIES = [
+    ('Contract', [TARGET_COLUMN]),
+    ('gender', [TARGET_COLUMN]),
+    ('SeniorCitizen', [TARGET_COLUMN]),
+    ('Partner', [TARGET_COLUMN]),
+    ('Dependents', ['Partner', TARGET_COLUMN]),
+    ('PhoneService', [TARGET_COLUMN]),
+    ('MultipleLines', ['PhoneService', TARGET_COLUMN]),
+    ('InternetService', ['Contract', TARGET_COLUMN]),
+    ('OnlineSecurity', ['InternetService', TARGET_COLUMN]),
+    ('OnlineBackup', ['InternetService', TARGET_COLUMN]),
+    ('DeviceProtection', ['InternetService', TARGET_COLUMN]),
+    ('TechSupport', ['InternetService', TARGET_COLUMN]),
+    ('StreamingTV', ['InternetService', TARGET_COLUMN]),
+    ('StreamingMovies', ['StreamingTV', 'InternetService', TARGET_COLUMN]),
+    ('PaperlessBilling', ['Contract', TARGET_COLUMN]),
+    ('PaymentMethod', ['Contract', TARGET_COLUMN]),
+]
+
+# Numérique -> colonnes définissant le groupe de rééchantillonnage
+NUMERIC_GROUPS = {
+    'tenure': ['Contract', TARGET_COLUMN],
+    'MonthlyCharges': ['InternetService', 'PhoneService', 'StreamingTV', TARGET_COLUMN],
+}
+
+# Taille minimale d'un groupe observé pour l'utiliser tel quel
+MIN_GROUP_SIZE = 20
+
+
+class SyntheticTelcoGenerator:
+    """
+    Génère des clients synthétiques ayant les colonnes, catégories et
+    distributions du dataset Telco.
+    """
+    def __init__(self, seed=42, churn_rate=None):
+        """
+        Args:
+            seed (int): Graine du générateur aléatoire
+            churn_rate (float): Taux de churn cible (par défaut celui du dataset réel)
+        """
+        self.seed = seed
+        self.churn_rate = churn_rate
+        self.categories = {}
+        self.tables = {}
+        self.pools = {}
+        self.charge_ratios = None
+        self.is_fitted = False
+
+    def fit(self, df):
+        """
+        Apprend les distributions conditionnelles sur un DataFrame au format brut.
+
+        Args:
+            df (pd.DataFrame): Dataset Telco (chargement par défaut ou compact)
+
+        Returns:
+            SyntheticTelcoGenerator: L'instance ajustée
+        """
+        codes = {}
+        for col in [TARGET_COLUMN] + [col for col, _ in DEPENDENCIES]:
+            values = df[col].astype(str) if col != 'SeniorCitizen' else df[col].astype(int)
+            categorical = pd.Categorical(values)
+            self.categories[col] = list(categorical.categories)
+            codes[col] = categorical.codes.astype(np.int64)
+
+        empirical_rate = float(np.mean(codes[TARGET_COLUMN] == self.categories[TARGET_COLUMN].index('Yes')))
+        if self.churn_rate is None:
+            self.churn_rate = empirical_rate
+
+        # Table dense des fonctions de répartition : une ligne par combinaison des parents
+        for col, parents in DEPENDENCIES:
+            keys = self._group_keys(codes, parents)
+            n_values = len(self.categories[col])
+            marginal = np.bincount(codes[col], minlength=n_values) / len(codes[col])
+            probs = np.tile(marginal, (self._n_keys(parents), 1))
+            for key in np.unique(keys):
+                mask = keys == key
+                if mask.sum() >= MIN_GROUP_SIZE:
+                    probs[key] = np.bincount(codes[col][mask], minlength=n_values) / mask.sum()
+            self.tables[col] = np.cumsum(probs, axis=1)
+
+        # Populations des numériques, concaténées par groupe (valeurs, début, taille)
+        for col, group in NUMERIC_GROUPS.items():
+            values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+            keys = self._group_keys(codes, group)
+            parts = [values]
+            starts = np.zeros(self._n_keys(group), dtype=np.int64)
+            sizes = np.full(self._n_keys(group), len(values), dtype=np.int64)
+            offset = len(values)
+            for key in np.unique(keys):
+                mask = keys == key
+                if mask.sum() >= MIN_GROUP_SIZE:
+                    parts.append(values[mask])
+                    starts[key], sizes[key] = offset, mask.sum()
+                    offset += mask.sum()
+            self.pools[col] = (np.concatenate(parts), starts, sizes)
+
+        # Rapport TotalCharges / (tenure * MonthlyCharges) observé
+        total = pd.to_numeric(df['TotalCharges'], errors='coerce').to_numpy(dtype=np.float64)
+        expected = df['tenure'].to_numpy(dtype=np.float64) * df['MonthlyCharges'].to_numpy(dtype=np.float64)
+        valid = (expected > 0) & np.isfinite(total)
+        self.charge_ratios = total[valid] / expected[valid]
+
+        self.is_fitted = True
+        return self
+
+    @classmethod
+    def from_csv(cls, csv_path, seed=42, churn_rate=None):
+        """
+        Crée un générateur ajusté sur un fichier CSV Telco.
+        """
+        return cls(seed=seed, churn_rate=churn_rate).fit(pd.read_csv(csv_path))
+
+    def _n_keys(self, columns):
+        return int(np.prod([len(self.categories[col]) for col in columns]))
+
+    def _group_keys(self, codes, columns):
+        """
+        Combine les codes de plusieurs colonnes en une clé entière unique (base mixte).
+        """
+        keys = np.zeros(len(codes[TARGET_COLUMN]), dtype=np.int64)
+        for col in columns:
+            keys = keys * len(self.categories[col]) + codes[col]
+        return keys
+
+    def _sample_categorical(self, rng, col, keys):
+        # Tirage par inversion de la fonction de répartition du groupe de chaque ligne
+        cdf = self.tables[col][keys]
+        u = rng.random(len(keys))[:, None]
+        return np.minimum((u >= cdf).sum(axis=1), cdf.shape[1] - 1)
+
+    def _sample_numeric(self, rng, col, keys):
+        values, starts, sizes = self.pools[col]
+        index = starts[keys] + (rng.random(len(keys)) * sizes[keys]).astype(np.int64)
+        return values[index]
+
+    @staticmethod
+    def _customer_ids(start, n_rows):
+        """
+        Identifiants uniques au format du dataset (4 chiffres - 5 lettres).
+        """
+        index = np.arange(start, start + n_rows, dtype=np.int64)
+        chars = np.empty((n_rows, 10), dtype=np.uint8)
+        digits = index % 10000
+        for position in range(3, -1, -1):
+            chars[:, position] = ord('0') + digits % 10
+            digits //= 10
+        chars[:, 4] = ord('-')
+        rest = index // 10000
+        for position in range(9, 4, -1):
+            chars[:, position] = ord('A') + rest % 26
+            rest //= 26
+        return chars.view('S10').ravel().astype('U10')
+
+    def generate_chunk(self, n_rows, chunk_index=0, start=0):
+        """
+        Génère un bloc de clients synthétiques.
+
+        Args:
+            n_rows (int): Nombre de lignes
+            chunk_index (int): Indice du bloc (dérive la graine du bloc)
+            start (int): Numéro de la première ligne (identifiants clients)
+
+        Returns:
+            pd.DataFrame: Bloc au format brut (colonnes textuelles en category)
+        """
+        if not self.is_fitted:
+            raise ValueError("Le générateur doit être ajusté (fit) avant de générer des données")
+
+        rng = np.random.default_rng([self.seed, chunk_index])
+        churn_code = self.categories[TARGET_COLUMN].index('Yes')
+        no_churn_code = self.categories[TARGET_COLUMN].index('No')
+        codes = {
+            TARGET_COLUMN: np.where(rng.random(n_rows) < self.churn_rate, churn_code, no_churn_code)
+        }
+
+        for col, parents in DEPENDENCIES:
+            codes[col] = self._sample_categorical(rng, col, self._group_keys(codes, parents))
+
+        tenure = self._sample_numeric(rng, 'tenure', self._group_keys(codes, NUMERIC_GROUPS['tenure']))
+        monthly = self._sample_numeric(rng, 'MonthlyCharges', self._group_keys(codes, NUMERIC_GROUPS['MonthlyCharges']))
+        monthly = np.round(monthly * rng.normal(1.0, 0.01, n_rows), 2)
+        ratios = self.charge_ratios[rng.integers(0, len(self.charge_ratios), size=n_rows)]
+        total = np.round(tenure * monthly * ratios, 2)
+        total[tenure == 0] = np.nan  # TotalCharges vide pour les nouveaux clients, comme dans le fichier réel
+
+        data = {
+            ID_COLUMN: self._customer_ids(start, n_rows),
+            'tenure': tenure.astype(np.int64),
+            'MonthlyCharges': monthly,
+            'TotalCharges': total,
+        }
+        for col, col_codes in codes.items():
+            if col == 'SeniorCitizen':
+                data[col] = np.asarray(self.categories[col], dtype=np.int64)[col_codes]
+            else:
+                data[col] = pd.Categorical.from_codes(col_codes, categories=self.categories[col])
+
+        return pd.DataFrame(data)[RAW_COLUMNS]
+
+    def iter_chunks(self, n_rows, chunksize=1_000_000):
+        """
+        Génère n_rows clients par blocs de taille fixe.
+
+        Args:
+            n_rows (int): Nombre total de lignes
+            chunksize (int): Lignes par bloc
+
+        Yields:
+            pd.DataFrame: Blocs successifs
+        """
+        for chunk_index, start in enumerate(range(0, n_rows, chunksize)):
+            yield self.generate_chunk(min(chunksize, n_rows - start), chunk_index=chunk_index, start=start)
+
+    def write_csv(self, path, n_rows, chunksize=1_000_000):
+        """
+        Écrit n_rows clients dans un CSV au format du fichier brut.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        for i, chunk in enumerate(self.iter_chunks(n_rows, chunksize)):
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False, na_rep=' ')
+            print(f" Bloc {i + 1}: {min((i + 1) * chunksize, n_rows)}/{n_rows} lignes")
+
+    def write_parquet(self, path, n_rows, chunksize=1_000_000):
+        """
+        Écrit n_rows clients dans un fichier Parquet (un row group par bloc).
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        writer = None
+        try:
+            for i, chunk in enumerate(self.iter_chunks(n_rows, chunksize)):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                print(f" Bloc {i + 1}: {min((i + 1) * chunksize, n_rows)}/{n_rows} lignes")
+        finally:
+            if writer is not None:
+                writer.close()
@@ -1,19 +1,23 @@
 """
 Module d'évaluation des modèles de prédiction du churn
 """
+import json
+import os
+import time
+
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score, 
-    roc_auc_score, confusion_matrix, classification_report
+    roc_auc_score, confusion_matrix, classification_report,
+    roc_curve, precision_recall_curve, average_precision_score
 )
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 class ModelEvaluator:
     def __init__(self):
         self.results = {}
         self.models = {}
+        self.predictions = {}  # Nom -> (labels réels, probabilités) : courbes sans re-prédire
     
     def evaluate_model(self, model, model_name: str, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
         """Évalue un modèle et retourne ses métriques"""
@@ -31,6 +35,7 @@ class ModelEvaluator:
         
         self.results[model_name] = metrics
         self.models[model_name] = model
+        self.predictions[model_name] = (np.asarray(y_test), np.asarray(y_pred_proba))
         
         return metrics
     
@@ -46,3 +51,83 @@ class ModelEvaluator:
             print(f"ROC-AUC:   {metrics['roc_auc']:.3f}")
             print("\nMatrice de confusion:")
             print(metrics['confusion_matrix'])
+
+    @staticmethod
+    def _downsample(*curves, max_points=200):
+        """Réduit des courbes parallèles à max_points points (extrémités conservées)"""
+        n_points = len(curves[0])
+        if n_points > max_points:
+            index = np.unique(np.linspace(0, n_points - 1, max_points).round().astype(int))
+            curves = [curve[index] for curve in curves]
+        return [np.round(curve, 4).tolist() for curve in curves]
+
+    def build_report(self, feature_names: list, max_points: int = 200) -> dict:
+        """
+        Construit l'artefact d'évaluation à partir des modèles déjà évalués :
+        métriques, matrices de confusion, courbes ROC et précision-rappel
+        sous-échantillonnées, importances des features.
+
+        Args:
+            feature_names: Noms des features, dans l'ordre du modèle
+            max_points: Nombre maximal de points par courbe
+
+        Returns:
+            Dictionnaire sérialisable en JSON
+        """
+        models = {}
+        for model_name, metrics in self.results.items():
+            y_true, y_proba = self.predictions[model_name]
+            fpr, tpr, _ = roc_curve(y_true, y_proba)
+            precision, recall, _ = precision_recall_curve(y_true, y_proba)
+            fpr, tpr = self._downsample(fpr, tpr, max_points=max_points)
+            precision, recall = self._downsample(precision, recall, max_points=max_points)
+
+            entry = {
+                'metrics': {k: float(v) for k, v in metrics.items() if k != 'confusion_matrix'},
+                'confusion_matrix': np.asarray(metrics['confusion_matrix']).tolist(),
+                'roc_curve': {'fpr': fpr, 'tpr': tpr},
+                'pr_curve': {'precision': precision, 'recall': recall}
+            }
+            entry['metrics']['average_precision'] = float(average_precision_score(y_true, y_proba))
+
+            model = self.models[model_name]
+            if hasattr(model, 'get_feature_importance'):
+                importance = model.get_feature_importance(list(feature_names))
+                entry['feature_importance'] = {
+                    'feature': importance['feature'].tolist(),
+                    'importance': importance['importance'].astype(float).round(6).tolist()
+                }
+            models[model_name] = entry
+
+        best_model = max(models, key=lambda name: models[name]['metrics']['roc_auc']) if models else None
+        return {'created': time.time(), 'best_model': best_model, 'models': models}
+
+    def save_report(self, filepath, feature_names: list, max_points: int = 200, **extra) -> dict:
+        """
+        Écrit l'artefact d'évaluation en JSON (écriture atomique).
+
+        Args:
+            filepath: Fichier de sortie
+            feature_names: Noms des features, dans l'ordre du modèle
+            max_points: Nombre maximal de points par courbe
+            **extra: Informations complémentaires (ex. versions du registre, effectifs)
+
+        Returns:
+            Artefact écrit
+        """
+        report = self.build_report(feature_names, max_points=max_points)
+        report.update(extra)
+
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = str(filepath) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f)
+        os.replace(tmp_path, filepath)
+        return report
+
+    @staticmethod
+    def load_report(filepath) -> dict:
+        """Charge un artefact d'évaluation écrit par save_report"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
@@ -2,5 +2,13 @@ from .base_model import BaseModel
 from .logistic_regression import LogisticRegressionModel
 from .decision_tree import DecisionTreeModel
 from .random_forest import RandomForestModel
+from .gradient_boosting import GradientBoostingModel
+from .sgd_logistic import SGDLogisticModel
+from .scheduler import TrainingScheduler
+from .search import SuccessiveHalvingSearch, CachedGridSearch
+from .fold_cache import FoldCache
+from .inference import FlatTreeEnsemble
+from .codegen import CompiledTree
+from .prediction_cache import PredictionCache
 
-__all__ = ['BaseModel', 'LogisticRegressionModel', 'DecisionTreeModel', 'RandomForestModel']
\ No newline at end of file
+__all__ = ['BaseModel', 'LogisticRegressionModel', 'DecisionTreeModel', 'RandomForestModel', 'GradientBoostingModel', 'SGDLogisticModel', 'TrainingScheduler', 'SuccessiveHalvingSearch', 'CachedGridSearch', 'FoldCache', 'FlatTreeEnsemble', 'CompiledTree', 'PredictionCache']
\ No newline at end of file
@@ -4,19 +4,23 @@ Définit l'interface commune et les méthodes d'évaluation.
 """
 
 from abc import ABC, abstractmethod
+import warnings
 import numpy as np
 import pandas as pd
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
 from sklearn.metrics import confusion_matrix, roc_curve
-import matplotlib.pyplot as plt
-import seaborn as sns
 import joblib
+from ..data.storage import ProcessedDataStore
 
 class BaseModel(ABC):
     """
     Classe de base pour tous les modèles de prédiction du churn.
     Définit l'interface commune et les méthodes d'évaluation.
     """
+    # Type du vecteur de features du chemin ligne à ligne (float32 pour les
+    # arbres, qui comparent leurs seuils en float32 comme sklearn)
+    RECORD_DTYPE = np.float64
+    
     def __init__(self, name: str):
         self.name = name
         self.model = None
@@ -32,6 +36,27 @@ class BaseModel(ABC):
         """
         pass
     
+    def set_n_jobs(self, n_jobs: int) -> None:
+        """
+        Limite le parallélisme interne de l'estimateur (si celui-ci le supporte).
+        
+        Args:
+            n_jobs: Nombre de cœurs utilisables par le modèle
+        """
+        if self.model is not None and 'n_jobs' in self.model.get_params():
+            self.model.set_params(n_jobs=n_jobs)
+    
+    def train_from_store(self, processed_dir: str = 'data/processed', mmap: bool = True) -> None:
+        """
+        Entraîne le modèle sur le split d'entraînement du stockage binaire.
+        
+        Args:
+            processed_dir: Dossier contenant les données prétraitées
+            mmap: Charger les données en memory-map (sans copie)
+        """
+        X_train, _, _, y_train, _, _ = ProcessedDataStore(processed_dir).load(mmap=mmap)
+        self.train(X_train, y_train)
+    
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """
         Fait des prédictions sur de nouvelles données.
@@ -60,6 +85,40 @@ class BaseModel(ABC):
             raise ValueError("Le modèle doit être entraîné avant de faire des prédictions")
         return self.model.predict_proba(X)
     
+    def predict_record(self, record: dict, preprocessor) -> float:
+        """
+        Probabilité de churn d'un seul client, sans pandas ni validation sklearn :
+        le client est encodé dans un vecteur préalloué puis passé à la routine
+        de prédiction bas niveau de l'estimateur. Le vecteur est réutilisé
+        d'un appel à l'autre (un seul appel à la fois par instance).
+        
+        Args:
+            record: Valeurs brutes du client (colonnes du CSV Telco)
+            preprocessor: DataPreprocessor ajusté avec le modèle
+            
+        Returns:
+            Probabilité de la classe positive
+        """
+        if self.model is None:
+            raise ValueError("Le modèle doit être entraîné avant de faire des prédictions")
+        n_features = len(preprocessor.feature_names)
+        buffer = getattr(self, '_record_buffer', None)
+        if buffer is None or buffer.shape[1] != n_features or not buffer.flags.writeable:
+            buffer = self._record_buffer = np.empty((1, n_features), dtype=self.RECORD_DTYPE)
+        preprocessor.encode_record(record, out=buffer[0])
+        return float(self._predict_proba_array(buffer)[0, 1])
+    
+    def _predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Probabilités pour une matrice déjà prétraitée (RECORD_DTYPE, contiguë).
+        Les sous-classes remplacent ce chemin générique par l'appel bas niveau
+        de leur estimateur.
+        """
+        with warnings.catch_warnings():
+            # Estimateur ajusté sur un DataFrame : avertissement sur les noms de colonnes
+            warnings.simplefilter('ignore', UserWarning)
+            return self.model.predict_proba(X)
+    
     def evaluate(self, X: pd.DataFrame, y: pd.Series) -> dict:
         """
         Évalue le modèle sur les données fournies.
@@ -90,6 +149,9 @@ class BaseModel(ABC):
             X: Features pour l'évaluation
             y: Labels réels
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         y_pred = self.predict(X)
         cm = confusion_matrix(y, y_pred)
         
@@ -108,6 +170,8 @@ class BaseModel(ABC):
             X: Features pour l'évaluation
             y: Labels réels
         """
+        import matplotlib.pyplot as plt
+        
         y_proba = self.predict_proba(X)[:, 1]
         fpr, tpr, _ = roc_curve(y, y_proba)
         
@@ -124,7 +188,8 @@ class BaseModel(ABC):
     
     def save_model(self, filepath: str) -> None:
         """
-        Sauvegarde le modèle sur le disque.
+        Sauvegarde le modèle sur le disque (estimateur seul ; voir ModelRegistry
+        pour un paquet versionné avec préprocesseur et métriques).
         
         Args:
             filepath: Chemin où sauvegarder le modèle
@@ -134,16 +199,19 @@ class BaseModel(ABC):
         joblib.dump(self.model, filepath)
     
     @classmethod
-    def load_model(cls, filepath: str) -> 'BaseModel':
+    def load_model(cls, filepath: str, mmap_mode: str = None) -> 'BaseModel':
         """
         Charge un modèle sauvegardé.
         
         Args:
             filepath: Chemin vers le modèle sauvegardé
+            mmap_mode: Mode memory-map de joblib ('r' pour partager les tableaux entre processus)
             
         Returns:
             Instance du modèle chargé
         """
-        model = cls(name=filepath.split('/')[-1])
-        model.model = joblib.load(filepath)
+        # Les sous-classes ne prennent pas de nom en paramètre
+        model = cls.__new__(cls)
+        BaseModel.__init__(model, name=filepath.split('/')[-1])
+        model.model = joblib.load(filepath, mmap_mode=mmap_mode)
         return model
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Génération de code pour l'arbre de décision : l'arbre ajusté est traduit en
+une fonction Python autonome faite de comparaisons imbriquées (if / else),
+une par nœud, qui retourne directement les probabilités de la feuille.
+
+Le module généré ne dépend ni de sklearn ni de numpy : il se charge dans le
+service de décision en ligne par un simple import (ou exec), et score une
+ligne en quelques comparaisons, sans construire de DataFrame ni passer par
+la validation de sklearn.
+
+Comme sklearn, les features sont comparées après conversion en float32. Le
+seuil écrit dans le code est la plus grande valeur float64 dont l'arrondi en
+float32 passe encore à gauche : la comparaison directe en float64 donne
+exactement les mêmes décisions que DecisionTreeClassifier.predict_proba.
+"""
+import os
+
+import numpy as np
+
+
+# Limite d'indentation du tokenizer Python (100 niveaux), avec une marge
+MAX_DEPTH = 90
+
+HEADER = '''"""
+Scorer généré automatiquement à partir d'un arbre de décision ({n_nodes} nœuds,
+profondeur {max_depth}). Ne pas modifier : régénérer avec src.models.codegen.
+
+Usage:
+    predict_proba_row(x)  ->  tuple des probabilités des classes
+    x : séquence de {n_features} features prétraitées, dans l'ordre de FEATURE_NAMES
+"""
+
+FEATURE_NAMES = {feature_names!r}
+CLASSES = {classes!r}
+N_FEATURES = {n_features}
+
+'''
+
+FOOTER = '''
+
+def predict_proba(rows):
+    """
+    Probabilités des classes pour une séquence de lignes.
+    """
+    return [predict_proba_row(x) for x in rows]
+'''
+
+
+def _float64_threshold(threshold):
+    """
+    Plus grande valeur float64 x telle que float32(x) <= seuil (float64).
+
+    Args:
+        threshold (float): Seuil de l'arbre sklearn
+
+    Returns:
+        float: Seuil équivalent pour une comparaison en float64
+    """
+    # Plus grand float32 inférieur ou égal au seuil
+    t32 = np.float32(threshold)
+    if float(t32) > threshold:
+        t32 = np.nextafter(t32, np.float32(-np.inf))
+    upper = np.nextafter(t32, np.float32(np.inf))
+    if np.isinf(upper):
+        return float('inf')
+    # Le milieu de deux float32 consécutifs est exact en float64 ; il est arrondi
+    # vers celui dont la mantisse est paire
+    midpoint = (float(t32) + float(upper)) / 2
+    if np.float32(midpoint) == t32:
+        return midpoint
+    return float(np.nextafter(midpoint, -np.inf))
+
+
+class CompiledTree:
+    """
+    Arbre de décision compilé en fonction Python (comparaisons imbriquées).
+    """
+    FUNCTION_NAME = 'predict_proba_row'
+
+    def __init__(self, source):
+        """
+        Args:
+            source (str): Code source du module généré
+        """
+        self.source = source
+        namespace = {}
+        exec(compile(source, '<compiled_tree>', 'exec'), namespace)
+        self.predict_proba_row = namespace[self.FUNCTION_NAME]
+        self.feature_names = namespace['FEATURE_NAMES']
+        self.classes_ = namespace['CLASSES']
+        self.n_features = namespace['N_FEATURES']
+
+    @classmethod
+    def from_estimator(cls, estimator, decimals=None):
+        """
+        Génère le scorer d'un DecisionTreeClassifier ajusté.
+
+        Args:
+            estimator: DecisionTreeClassifier ou DecisionTreeModel entraîné
+            decimals (int): Arrondi des probabilités des feuilles (None : valeurs exactes)
+
+        Returns:
+            CompiledTree: Scorer compilé
+        """
+        estimator = getattr(estimator, 'model', estimator)
+        if not hasattr(estimator, 'tree_') or not hasattr(estimator, 'classes_'):
+            raise ValueError("Un DecisionTreeClassifier entraîné est attendu")
+        tree = estimator.tree_
+        if tree.n_outputs != 1:
+            raise ValueError("Seuls les arbres à une sortie sont supportés")
+        if tree.max_depth > MAX_DEPTH:
+            raise ValueError(f"Arbre trop profond pour être généré ({tree.max_depth} > {MAX_DEPTH})")
+
+        counts = tree.value[:, 0, :]
+        totals = counts.sum(axis=1, keepdims=True)
+        # Probabilités des feuilles, normalisées comme dans DecisionTreeClassifier.predict_proba
+        proba = counts / np.where(totals == 0, 1, totals)
+        if decimals is not None:
+            proba = np.round(proba, decimals)
+
+        lines = [f"def {cls.FUNCTION_NAME}(x):"]
+
+        def emit(node, depth):
+            indent = '    ' * depth
+            left, right = tree.children_left[node], tree.children_right[node]
+            if left == -1:
+                values = ', '.join(repr(float(p)) for p in proba[node])
+                lines.append(f"{indent}return ({values},)")
+                return
+            threshold = _float64_threshold(float(tree.threshold[node]))
+            lines.append(f"{indent}if x[{int(tree.feature[node])}] <= {threshold!r}:")
+            emit(left, depth + 1)
+            lines.append(f"{indent}else:")
+            emit(right, depth + 1)
+
+        emit(0, 1)
+
+        feature_names = getattr(estimator, 'feature_names_in_', None)
+        header = HEADER.format(
+            n_nodes=tree.node_count,
+            max_depth=tree.max_depth,
+            n_features=estimator.n_features_in_,
+            feature_names=[str(f) for f in feature_names] if feature_names is not None else None,
+            classes=np.asarray(estimator.classes_).tolist()
+        )
+        return cls(header + '\n'.join(lines) + '\n' + FOOTER)
+
+    def predict_proba(self, X):
+        """
+        Prédit les probabilités des classes.
+
+        Args:
+            X (np.ndarray | pd.DataFrame | list): Features prétraitées
+
+        Returns:
+            np.ndarray: Probabilités (n_lignes, n_classes)
+        """
+        if hasattr(X, 'columns') and self.feature_names is not None:
+            X = X[self.feature_names]
+        rows = np.asarray(X, dtype=np.float64)
+        if rows.ndim != 2 or rows.shape[1] != self.n_features:
+            raise ValueError(f"Matrice de features de forme {rows.shape} incompatible avec le modèle")
+        # Listes de floats Python : l'indexation y est bien plus rapide que sur un ndarray
+        row_proba = self.predict_proba_row
+        return np.array([row_proba(x) for x in rows.tolist()], dtype=np.float64).reshape(len(rows), -1)
+
+    def predict(self, X):
+        """
+        Prédit les classes.
+        """
+        return np.asarray(self.classes_)[np.argmax(self.predict_proba(X), axis=1)]
+
+    def save(self, filepath):
+        """
+        Écrit le module généré (importable sans sklearn ni numpy).
+
+        Args:
+            filepath (str): Chemin du fichier .py
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.source)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Charge un scorer généré.
+
+        Args:
+            filepath (str): Chemin du fichier .py
+
+        Returns:
+            CompiledTree: Scorer compilé
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls(f.read())
@@ -4,14 +4,14 @@ Modèle d'arbre de décision pour la prédiction du churn.
 from sklearn.tree import DecisionTreeClassifier, plot_tree
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from .base_model import BaseModel
 
 class DecisionTreeModel(BaseModel):
     """
     Modèle d'arbre de décision pour la prédiction du churn.
     """
+    RECORD_DTYPE = np.float32
+    
     def __init__(self):
         super().__init__(name="Arbre de Décision")
         self.model = DecisionTreeClassifier(
@@ -32,6 +32,12 @@ class DecisionTreeModel(BaseModel):
         """
         self.model.fit(X_train, y_train)
         
+    def _predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Parcours direct de l'arbre (X float32 contigu, sans validation d'entrée).
+        """
+        return self.model.tree_.predict(X)[:, :self.model.n_classes_]
+        
     def get_feature_importance(self, feature_names: list) -> pd.DataFrame:
         """
         Retourne l'importance des features basée sur l'arbre de décision.
@@ -60,6 +66,8 @@ class DecisionTreeModel(BaseModel):
             feature_names: Liste des noms des features
             top_n: Nombre de features à afficher (par défaut: 10)
         """
+        import matplotlib.pyplot as plt
+        
         importance = self.get_feature_importance(feature_names)
         top_features = importance.head(top_n)
         
@@ -79,6 +87,8 @@ class DecisionTreeModel(BaseModel):
             feature_names: Liste des noms des features
             max_depth: Profondeur maximale à afficher (par défaut: 3)
         """
+        import matplotlib.pyplot as plt
+        
         if self.model is None:
             raise ValueError("Le modèle doit être entraîné avant de visualiser l'arbre")
         
@@ -0,0 +1,252 @@
+"""
+Cache sur disque des résultats de validation croisée, fold par fold.
+
+Chaque entrée contient les scores d'un ajustement sur un fold, indexée par
+l'empreinte des données, le découpage, l'indice du fold, la classe de
+l'estimateur et ses paramètres. Relancer une recherche ou élargir une grille
+ne réajuste que les combinaisons nouvelles. Les entrées les moins récemment
+utilisées sont supprimées au-delà d'un nombre ou d'une taille maximale.
+"""
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import check_cv
+
+# Paramètres sans effet sur les scores, exclus de la clé
+IGNORED_PARAMS = ('n_jobs', 'verbose')
+
+
+class FoldCache:
+    """
+    Cache LRU des scores de folds (un fichier JSON par fold).
+    """
+    def __init__(self, cache_dir='data/cache/folds', max_entries=None, max_size_mb=None):
+        """
+        Args:
+            cache_dir (str): Dossier du cache
+            max_entries (int): Nombre maximal d'entrées
+            max_size_mb (float): Taille maximale du cache
+        """
+        self.cache_dir = os.path.normpath(str(cache_dir))
+        self.max_entries = max_entries
+        self.max_size_mb = max_size_mb
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def data_hash(X, y):
+        """
+        Calcule l'empreinte SHA-256 des features (valeurs et colonnes) et des labels.
+        """
+        digest = hashlib.sha256()
+        columns = list(getattr(X, 'columns', []))
+        digest.update(json.dumps([str(col) for col in columns]).encode('utf-8'))
+        for values in (np.asarray(X), np.asarray(y)):
+            values = np.ascontiguousarray(values)
+            digest.update(f"{values.dtype}{values.shape}".encode('utf-8'))
+            digest.update(memoryview(values).cast('B'))
+        return digest.hexdigest()
+
+    def make_key(self, data_hash, cv, fold, estimator, scoring, extra=None):
+        """
+        Construit la clé d'un fold.
+
+        Args:
+            data_hash (str): Empreinte des données (data_hash)
+            cv: Découpage sklearn (sa représentation fait partie de la clé)
+            fold (int): Indice du fold
+            estimator: Estimateur sklearn (classe et paramètres)
+            scoring (str): Métrique
+            extra (dict): Informations supplémentaires (taille d'entraînement, sous-échantillon...)
+
+        Returns:
+            str: Clé du fold
+        """
+        params = {k: v for k, v in estimator.get_params().items() if k not in IGNORED_PARAMS}
+        payload = json.dumps({
+            'data': data_hash,
+            'cv': repr(cv),
+            'fold': fold,
+            'estimator': f"{type(estimator).__module__}.{type(estimator).__name__}",
+            'params': params,
+            'scoring': scoring,
+            'extra': extra
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, key):
+        """
+        Retourne le résultat d'un fold (et marque son utilisation), ou None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Enregistre le résultat d'un fold (écriture atomique).
+        """
+        path = self._path(key)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _rows(X, idx):
+        return X.iloc[idx] if hasattr(X, 'iloc') else X[idx]
+
+    def _fold_scores(self, estimator, X, y, train_idx, test_idx, key, scorer, return_train_score):
+        """
+        Retourne les scores d'un fold depuis le cache, ou ajuste et enregistre.
+        """
+        result = self.get(key)
+        if result is None:
+            model = clone(estimator)
+            X_fit = self._rows(X, train_idx)
+            start = time.perf_counter()
+            model.fit(X_fit, y[train_idx])
+            result = {'fit_time': time.perf_counter() - start,
+                      'test_score': float(scorer(model, self._rows(X, test_idx), y[test_idx]))}
+            if return_train_score:
+                result['train_score'] = float(scorer(model, X_fit, y[train_idx]))
+            self.put(key, result)
+        return result
+
+    def cross_val_score(self, estimator, X, y, cv=3, scoring='roc_auc', data_hash=None, extra=None):
+        """
+        Équivalent de sklearn.model_selection.cross_val_score avec cache par fold.
+
+        Args:
+            estimator: Estimateur sklearn (non ajusté)
+            X (pd.DataFrame): Features
+            y (pd.Series): Labels
+            cv: Nombre de folds ou découpage sklearn
+            scoring (str): Métrique
+            data_hash (str): Empreinte de X, y déjà calculée (évite de la recalculer)
+            extra (dict): Informations supplémentaires pour la clé
+
+        Returns:
+            np.ndarray: Score de chaque fold
+        """
+        y_values = np.asarray(y)
+        cv = check_cv(cv, y_values, classifier=True)
+        data_hash = data_hash or self.data_hash(X, y_values)
+        scorer = get_scorer(scoring)
+
+        scores = []
+        for fold, (train_idx, test_idx) in enumerate(cv.split(X, y_values)):
+            key = self.make_key(data_hash, cv, fold, estimator, scoring, extra)
+            scores.append(self._fold_scores(estimator, X, y_values, train_idx, test_idx, key, scorer, False)['test_score'])
+
+        self.evict()
+        return np.array(scores)
+
+    def learning_curve(self, estimator, X, y, train_sizes, cv=3, scoring='roc_auc', data_hash=None):
+        """
+        Équivalent de sklearn.model_selection.learning_curve avec cache par fold.
+
+        Args:
+            estimator: Estimateur sklearn (non ajusté)
+            X (pd.DataFrame): Features
+            y (pd.Series): Labels
+            train_sizes (array): Fractions (<= 1) ou nombres de lignes d'entraînement
+            cv: Nombre de folds ou découpage sklearn
+            scoring (str): Métrique
+            data_hash (str): Empreinte de X, y déjà calculée
+
+        Returns:
+            tuple: (train_sizes_abs, train_scores, test_scores) de forme (n_tailles, n_folds)
+        """
+        y_values = np.asarray(y)
+        cv = check_cv(cv, y_values, classifier=True)
+        data_hash = data_hash or self.data_hash(X, y_values)
+        scorer = get_scorer(scoring)
+        splits = list(cv.split(X, y_values))
+
+        # Tailles absolues relatives au plus petit fold d'entraînement, comme sklearn
+        n_max = min(len(train_idx) for train_idx, _ in splits)
+        train_sizes = np.asarray(train_sizes)
+        if np.issubdtype(train_sizes.dtype, np.floating):
+            train_sizes_abs = np.unique(np.maximum((train_sizes * n_max).astype(int), 1))
+        else:
+            train_sizes_abs = np.unique(np.minimum(train_sizes, n_max))
+
+        train_scores = np.empty((len(train_sizes_abs), len(splits)))
+        test_scores = np.empty((len(train_sizes_abs), len(splits)))
+        for i, n_train in enumerate(train_sizes_abs):
+            for fold, (train_idx, test_idx) in enumerate(splits):
+                key = self.make_key(data_hash, cv, fold, estimator, scoring, {'train_size': int(n_train)})
+                result = self._fold_scores(estimator, X, y_values, train_idx[:n_train], test_idx, key, scorer, True)
+                train_scores[i, fold] = result['train_score']
+                test_scores[i, fold] = result['test_score']
+
+        self.evict()
+        return train_sizes_abs, train_scores, test_scores
+
+    def entries(self):
+        """
+        Liste les entrées du cache.
+
+        Returns:
+            list: Dictionnaires (key, last_used, size) triés du plus ancien au plus récent
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, name))
+            entries.append({'key': name[:-5], 'last_used': stat.st_mtime, 'size': stat.st_size})
+        return sorted(entries, key=lambda e: e['last_used'])
+
+    def evict(self):
+        """
+        Supprime les entrées les moins récemment utilisées au-delà des limites.
+
+        Returns:
+            list: Clés supprimées
+        """
+        if self.max_entries is None and self.max_size_mb is None:
+            return []
+
+        entries = self.entries()
+        total = sum(e['size'] for e in entries)
+        removed = []
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_size_mb is not None and total > self.max_size_mb * 1e6)
+        ):
+            entry = entries.pop(0)
+            self.remove(entry['key'])
+            removed.append(entry['key'])
+            total -= entry['size']
+        return removed
+
+    def remove(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """
+        Vide entièrement le cache.
+        """
+        for entry in self.entries():
+            self.remove(entry['key'])
@@ -0,0 +1,131 @@
+"""
+Modèle de gradient boosting sur histogrammes pour la prédiction du churn.
+"""
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.inspection import permutation_importance
+import pandas as pd
+import numpy as np
+from .base_model import BaseModel
+from ..data.schema import CATEGORICAL_COLUMNS
+from ..data.storage import ProcessedDataStore
+
+class GradientBoostingModel(BaseModel):
+    """
+    Gradient boosting à features discrétisées (HistGradientBoostingClassifier).
+    Le coût d'entraînement croît linéairement avec le nombre de lignes, ce qui
+    le rend adapté aux grands historiques clients.
+    """
+    def __init__(self, learning_rate=0.1, max_iter=500, max_leaf_nodes=31, min_samples_leaf=20,
+                 l2_regularization=0.0, max_bins=255, n_iter_no_change=10, tol=1e-4):
+        super().__init__(name="Gradient Boosting")
+        self.model = HistGradientBoostingClassifier(
+            learning_rate=learning_rate,
+            max_iter=max_iter,                  # Nombre maximal d'itérations (arbres)
+            max_leaf_nodes=max_leaf_nodes,
+            min_samples_leaf=min_samples_leaf,
+            l2_regularization=l2_regularization,
+            max_bins=max_bins,                  # Nombre de bins des histogrammes
+            early_stopping=True,                # Arrêt sur la perte de validation
+            n_iter_no_change=n_iter_no_change,
+            tol=tol,                            # Gain minimal de perte de validation par itération
+            class_weight='balanced',            # Pour gérer le déséquilibre des classes
+            random_state=42
+        )
+        self.importance_data = None
+
+    def train(self, X_train: pd.DataFrame, y_train: pd.Series,
+              X_val: pd.DataFrame = None, y_val: pd.Series = None) -> None:
+        """
+        Entraîne le modèle avec arrêt anticipé.
+
+        Args:
+            X_train: Features d'entraînement
+            y_train: Labels d'entraînement
+            X_val: Features de validation pour l'arrêt anticipé
+                (sinon 10% de l'entraînement sont mis de côté)
+            y_val: Labels de validation
+        """
+        # Les colonnes catégorielles (codes entiers) sont traitées nativement
+        if isinstance(X_train, pd.DataFrame):
+            categorical = [col for col in CATEGORICAL_COLUMNS if col in X_train.columns]
+            self.model.set_params(categorical_features=categorical or None)
+
+        if X_val is not None:
+            self.model.fit(X_train, y_train, X_val=X_val, y_val=y_val)
+            self.importance_data = self._sample(X_val, y_val)
+        else:
+            self.model.fit(X_train, y_train)
+            self.importance_data = self._sample(X_train, y_train)
+
+    @staticmethod
+    def _sample(X, y, max_samples=10_000):
+        """
+        Copie d'au plus max_samples lignes (données de référence de l'importance par permutation).
+        """
+        rows = np.arange(len(X))
+        if len(X) > max_samples:
+            rows = np.sort(np.random.default_rng(42).choice(len(X), max_samples, replace=False))
+        X_sample = X.iloc[rows].copy() if hasattr(X, 'iloc') else np.array(X[rows])
+        return X_sample, np.asarray(y)[rows]
+
+    def train_from_store(self, processed_dir: str = 'data/processed', mmap: bool = True) -> None:
+        """
+        Entraîne le modèle sur le stockage binaire, avec arrêt anticipé sur le split de validation.
+
+        Args:
+            processed_dir: Dossier contenant les données prétraitées
+            mmap: Charger les données en memory-map (sans copie)
+        """
+        X_train, X_val, _, y_train, y_val, _ = ProcessedDataStore(processed_dir).load(mmap=mmap)
+        self.train(X_train, y_train, X_val, y_val)
+
+    def get_feature_importance(self, feature_names: list, X: pd.DataFrame = None, y: pd.Series = None,
+                               max_samples: int = 10_000) -> pd.DataFrame:
+        """
+        Retourne l'importance des features par permutation (baisse d'AUC).
+
+        Args:
+            feature_names: Liste des noms des features
+            X: Données d'évaluation (par défaut un échantillon du split de validation de l'entraînement)
+            y: Labels d'évaluation
+            max_samples: Nombre maximal de lignes utilisées
+
+        Returns:
+            DataFrame avec les importances des features
+        """
+        if self.model is None or not hasattr(self.model, 'n_iter_'):
+            raise ValueError("Le modèle doit être entraîné avant de calculer l'importance des features")
+
+        if X is None:
+            X, y = self.importance_data
+        X, y = self._sample(X, y, max_samples)
+
+        result = permutation_importance(self.model, X, y, scoring='roc_auc', n_repeats=5, random_state=42)
+        importance = pd.DataFrame({
+            'feature': feature_names,
+            'importance': result.importances_mean,
+            'std': result.importances_std
+        })
+
+        return importance.sort_values('importance', ascending=False)
+
+    def plot_feature_importance(self, feature_names: list, top_n: int = 10) -> None:
+        """
+        Affiche un graphique des features les plus importantes.
+
+        Args:
+            feature_names: Liste des noms des features
+            top_n: Nombre de features à afficher (par défaut: 10)
+        """
+        import matplotlib.pyplot as plt
+
+        importance = self.get_feature_importance(feature_names)
+        top_features = importance.head(top_n)
+
+        plt.figure(figsize=(10, 6))
+        plt.barh(range(len(top_features)), top_features['importance'], xerr=top_features['std'], color='darkorange')
+        plt.yticks(range(len(top_features)), top_features['feature'])
+        plt.xlabel('Baisse moyenne de l\'AUC (permutation)')
+        plt.title(f'Top {top_n} features les plus importantes - Gradient Boosting')
+        plt.tight_layout()
+        plt.show()
@@ -0,0 +1,225 @@
+"""
+Moteur d'inférence NumPy pour les arbres de décision et les forêts aléatoires.
+
+Les arbres ajustés sont « aplatis » dans des tableaux contigus communs à tous
+les arbres (feature, seuil, enfants, probabilités des feuilles). Le parcours
+est vectorisé sur toutes les lignes et tous les arbres à la fois : à chaque
+niveau, chaque couple (ligne, arbre) descend d'un nœud ; les feuilles pointent
+sur elles-mêmes et restent donc stables jusqu'à la profondeur maximale. Cela
+évite la validation et la répartition arbre par arbre de sklearn, qui
+dominent la latence des petits lots.
+
+Comme sklearn, les features sont converties en float32 avant la comparaison
+aux seuils. Les seuils (float64 dans sklearn) sont arrondis au float32
+inférieur ou égal, ce qui donne exactement les mêmes décisions tout en
+comparant en float32. Les indices sont en int32 pour réduire le trafic mémoire.
+"""
+import json
+import os
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+
+class FlatTreeEnsemble:
+    """
+    Ensemble d'arbres aplatis (un arbre de décision ou une forêt aléatoire).
+    """
+    ARRAYS = ('feature', 'threshold', 'children', 'value', 'roots')
+    META_NAME = 'flat_trees.json'
+
+    def __init__(self, feature, threshold, children, value, roots, max_depth, classes, n_features,
+                 feature_names=None):
+        """
+        Args:
+            feature (np.ndarray): Feature testée par nœud, int32 (0 pour les feuilles)
+            threshold (np.ndarray): Seuil float32 par nœud (+inf pour les feuilles)
+            children (np.ndarray): Enfants gauche/droit par nœud, aplatis (2 * n_nœuds) ;
+                une feuille est son propre enfant
+            value (np.ndarray): Probabilités des classes par nœud (n_nœuds, n_classes)
+            roots (np.ndarray): Indice de la racine de chaque arbre
+            max_depth (int): Profondeur maximale des arbres
+            classes (np.ndarray): Classes du modèle
+            n_features (int): Nombre de features attendues
+            feature_names (list): Noms des features attendues
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = np.asarray(classes)
+        self.n_features = int(n_features)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+
+    @classmethod
+    def from_estimator(cls, estimator):
+        """
+        Aplatit un DecisionTreeClassifier ou un RandomForestClassifier ajusté.
+
+        Args:
+            estimator: Estimateur sklearn ou BaseModel (DecisionTreeModel, RandomForestModel)
+
+        Returns:
+            FlatTreeEnsemble: Ensemble prêt pour predict_proba
+        """
+        estimator = getattr(estimator, 'model', estimator)
+        if isinstance(estimator, RandomForestClassifier):
+            trees = [tree.tree_ for tree in estimator.estimators_]
+        elif isinstance(estimator, DecisionTreeClassifier):
+            trees = [estimator.tree_]
+        else:
+            raise ValueError(f"Estimateur non supporté : {type(estimator).__name__} "
+                             "(DecisionTreeClassifier ou RandomForestClassifier attendu)")
+        if not hasattr(estimator, 'classes_'):
+            raise ValueError("L'estimateur doit être entraîné avant d'être aplati")
+
+        sizes = np.array([tree.node_count for tree in trees])
+        roots = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+        n_nodes = int(sizes.sum())
+
+        feature = np.zeros(n_nodes, dtype=np.int32)
+        threshold = np.full(n_nodes, np.inf, dtype=np.float64)
+        children = np.empty((n_nodes, 2), dtype=np.int32)
+        value = np.empty((n_nodes, len(estimator.classes_)), dtype=np.float64)
+
+        for tree, offset, size in zip(trees, roots, sizes):
+            nodes = slice(offset, offset + size)
+            is_leaf = tree.children_left == -1
+            local = np.arange(size)
+            feature[nodes] = np.where(is_leaf, 0, tree.feature)
+            threshold[nodes] = np.where(is_leaf, np.inf, tree.threshold)
+            children[nodes, 0] = offset + np.where(is_leaf, local, tree.children_left)
+            children[nodes, 1] = offset + np.where(is_leaf, local, tree.children_right)
+            # Probabilités des feuilles, normalisées comme dans DecisionTreeClassifier.predict_proba
+            counts = tree.value[:, 0, :]
+            totals = counts.sum(axis=1, keepdims=True)
+            value[nodes] = counts / np.where(totals == 0, 1, totals)
+
+        # x (float32) <= seuil (float64)  <=>  x <= plus grand float32 <= seuil
+        threshold32 = threshold.astype(np.float32)
+        rounded_up = threshold32.astype(np.float64) > threshold
+        threshold32[rounded_up] = np.nextafter(threshold32[rounded_up], np.float32(-np.inf))
+
+        return cls(
+            feature=feature,
+            threshold=threshold32,
+            children=children.ravel(),
+            value=value,
+            roots=roots.astype(np.int32),
+            max_depth=max(tree.max_depth for tree in trees),
+            classes=estimator.classes_,
+            n_features=estimator.n_features_in_,
+            feature_names=getattr(estimator, 'feature_names_in_', None)
+        )
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def apply(self, X):
+        """
+        Retourne la feuille atteinte par chaque ligne dans chaque arbre.
+
+        Args:
+            X (np.ndarray): Features (n_lignes, n_features), converties en float32
+
+        Returns:
+            np.ndarray: Indices (globaux) des feuilles, de forme (n_lignes, n_arbres)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        n_rows, n_features = X.shape
+        X_flat = X.ravel()
+        row_offsets = (np.arange(n_rows, dtype=np.int32) * n_features)[:, None]
+
+        node = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            position = np.take(self.feature, node)
+            position += row_offsets
+            go_right = np.take(X_flat, position) > np.take(self.threshold, node)
+            node *= 2
+            node += go_right
+            node = np.take(self.children, node)
+        return node
+
+    def predict_proba(self, X, block_size=512):
+        """
+        Prédit les probabilités des classes (moyenne des arbres, comme sklearn).
+
+        Args:
+            X (np.ndarray | pd.DataFrame): Features prétraitées
+            block_size (int): Lignes traitées par bloc (borne la mémoire de travail)
+
+        Returns:
+            np.ndarray: Probabilités (n_lignes, n_classes)
+        """
+        if hasattr(X, 'columns') and self.feature_names is not None:
+            X = X[self.feature_names]
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Matrice de features de forme {X.shape} incompatible avec le modèle")
+
+        proba = np.empty((len(X), self.value.shape[1]), dtype=np.float64)
+        binary = self.value.shape[1] == 2
+        positive = np.ascontiguousarray(self.value[:, 1]) if binary else None
+        for start in range(0, len(X), block_size):
+            leaves = self.apply(X[start:start + block_size])
+            if binary:
+                # Une seule colonne à rassembler : P(0) = 1 - P(1)
+                proba[start:start + block_size, 1] = np.take(positive, leaves).mean(axis=1)
+            else:
+                proba[start:start + block_size] = np.take(self.value, leaves, axis=0).mean(axis=1)
+        if binary:
+            proba[:, 0] = 1.0 - proba[:, 1]
+        return proba
+
+    def predict(self, X):
+        """
+        Prédit les classes.
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def save(self, directory):
+        """
+        Sauvegarde les tableaux en .npy bruts (chargeables en memory-map).
+
+        Args:
+            directory (str): Dossier de destination
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(directory, self.META_NAME), 'w', encoding='utf-8') as f:
+            json.dump({
+                'max_depth': self.max_depth,
+                'classes': self.classes_.tolist(),
+                'n_features': self.n_features,
+                'feature_names': self.feature_names
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Charge un ensemble aplati.
+
+        Args:
+            directory (str): Dossier contenant les tableaux
+            mmap (bool): Projeter les tableaux en mémoire (partagés entre processus)
+
+        Returns:
+            FlatTreeEnsemble: Ensemble prêt pour predict_proba
+        """
+        with open(os.path.join(directory, cls.META_NAME), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r' if mmap else None)
+            for name in cls.ARRAYS
+        }
+        return cls(max_depth=meta['max_depth'], classes=meta['classes'], n_features=meta['n_features'],
+                   feature_names=meta['feature_names'], **arrays)
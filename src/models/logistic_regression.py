@@ -1,8 +1,7 @@
 from sklearn.linear_model import LogisticRegression
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from scipy.special import expit
 from .base_model import BaseModel
 
 class LogisticRegressionModel(BaseModel):
@@ -28,6 +27,13 @@ class LogisticRegressionModel(BaseModel):
         """
         self.model.fit(X_train, y_train)
         
+    def _predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fonction logistique du score linéaire, sans validation d'entrée.
+        """
+        positive = expit(X @ self.model.coef_.T + self.model.intercept_).ravel()
+        return np.column_stack([1 - positive, positive])
+        
     def get_feature_importance(self, feature_names: list) -> pd.DataFrame:
         """
         Retourne l'importance des features basée sur les coefficients.
@@ -59,6 +65,8 @@ class LogisticRegressionModel(BaseModel):
             feature_names: Liste des noms des features
             top_n: Nombre de features à afficher (par défaut: 10)
         """
+        import matplotlib.pyplot as plt
+        
         importance = self.get_feature_importance(feature_names)
         top_features = importance.head(top_n)
         
@@ -0,0 +1,212 @@
+"""
+Cache des prédictions, borné (LRU) et à durée de vie (TTL).
+
+La clé d'une ligne est une empreinte (blake2b) de ses features encodées
+(float64, dans l'ordre du modèle) et de la version du modèle : un client
+re-scoré avec des features identiques et le même modèle ne repasse pas par
+l'estimateur. Pour un lot, seules les lignes absentes du cache (ou expirées)
+sont scorées, en un seul appel à predict_proba.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+
+
+class PredictionCache:
+    """
+    Couche de cache autour du predict_proba d'un modèle.
+    """
+    def __init__(self, model, model_version=None, max_entries=100_000, ttl=3600.0, clock=time.monotonic):
+        """
+        Args:
+            model: Objet disposant de predict_proba (BaseModel, FlatTreeEnsemble...)
+            model_version (str): Version du modèle incluse dans les clés (par défaut
+                une empreinte de l'estimateur, calculée une fois)
+            max_entries (int): Nombre maximal de lignes en cache (les moins récemment
+                utilisées sont évincées)
+            ttl (float): Durée de vie d'une entrée en secondes (None : pas d'expiration)
+            clock: Horloge en secondes (monotone)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries doit être au moins 1")
+        self.model = model
+        if model_version is None:
+            model_version = joblib.hash(getattr(model, 'model', model))
+        self.model_version = str(model_version)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.feature_names = self._feature_names(model)
+
+        self._entries = OrderedDict()  # clé -> (expiration, probabilités)
+        self._lock = threading.Lock()
+        # La version du modèle sert de clé au hachage : une autre version ne
+        # retrouve jamais les entrées de la précédente
+        self._salt = hashlib.blake2b(self.model_version.encode('utf-8'), digest_size=32).digest()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _feature_names(model):
+        names = getattr(model, 'feature_names', None)
+        if names is None:
+            names = getattr(getattr(model, 'model', None), 'feature_names_in_', None)
+        return list(names) if names is not None else None
+
+    def _key(self, row):
+        return hashlib.blake2b(row.tobytes(), digest_size=16, key=self._salt).digest()
+
+    def _rows(self, X):
+        """
+        Remet les colonnes d'un DataFrame dans l'ordre du modèle ; retourne les
+        features ainsi ordonnées et leurs lignes en float64 contigu (pour les clés).
+        """
+        if hasattr(X, 'columns') and self.feature_names is not None:
+            X = X[self.feature_names]
+        rows = np.ascontiguousarray(np.asarray(X, dtype=np.float64))
+        if rows.ndim == 1:
+            rows = rows.reshape(1, -1)
+        return X, rows
+
+    def _lookup(self, keys, now):
+        """
+        Cherche les clés ; retourne les probabilités trouvées (None sinon) et
+        les lignes manquantes regroupées par clé (doublons d'un lot scorés une fois).
+        """
+        results = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None and (entry[0] is None or entry[0] > now):
+                    self._entries.move_to_end(key)
+                    results[i] = entry[1]
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    missing.setdefault(key, []).append(i)
+                    self.misses += 1
+        return results, missing
+
+    def _store(self, missing, proba, results, now):
+        expires = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            for (key, indices), row_proba in zip(missing.items(), proba):
+                row_proba = np.array(row_proba, dtype=np.float64)
+                row_proba.flags.writeable = False
+                self._entries[key] = (expires, row_proba)
+                self._entries.move_to_end(key)
+                for i in indices:
+                    results[i] = row_proba
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def predict_proba(self, X):
+        """
+        Probabilités des classes, depuis le cache pour les lignes déjà vues.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Features prétraitées (une ou plusieurs lignes)
+
+        Returns:
+            np.ndarray: Probabilités (n_lignes, n_classes)
+        """
+        X, rows = self._rows(X)
+        now = self.clock()
+        results, missing = self._lookup([self._key(row) for row in rows], now)
+
+        if missing:
+            # Un seul appel à l'estimateur pour toutes les lignes manquantes
+            first = np.fromiter((indices[0] for indices in missing.values()), dtype=np.int64, count=len(missing))
+            X_missing = X.iloc[first] if hasattr(X, 'iloc') else rows[first]
+            self._store(missing, self.model.predict_proba(X_missing), results, now)
+
+        return np.vstack(results)
+
+    def predict_record(self, record, preprocessor):
+        """
+        Probabilité de churn d'un seul client (dictionnaire brut), depuis le cache
+        si ses features encodées ont déjà été scorées.
+
+        Args:
+            record (dict): Valeurs brutes du client
+            preprocessor (DataPreprocessor): Préprocesseur ajusté avec le modèle
+
+        Returns:
+            float: Probabilité de la classe positive
+        """
+        row = preprocessor.encode_record(record)
+        now = self.clock()
+        results, missing = self._lookup([self._key(row)], now)
+
+        if missing:
+            if hasattr(self.model, 'predict_record'):
+                positive = self.model.predict_record(record, preprocessor)
+                proba = [[1.0 - positive, positive]]
+            else:
+                proba = self.model.predict_proba(row.reshape(1, -1))
+            self._store(missing, proba, results, now)
+
+        return float(results[0][1])
+
+    def predict(self, X):
+        """
+        Prédit les classes (via le cache des probabilités).
+        """
+        classes = getattr(self.model, 'classes_', None)
+        if classes is None:
+            classes = self.model.model.classes_
+        return np.asarray(classes)[np.argmax(self.predict_proba(X), axis=1)]
+
+    def purge_expired(self):
+        """
+        Supprime les entrées expirées.
+
+        Returns:
+            int: Nombre d'entrées supprimées
+        """
+        if self.ttl is None:
+            return 0
+        now = self.clock()
+        with self._lock:
+            expired = [key for key, (expires, _) in self._entries.items() if expires <= now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def clear(self):
+        """
+        Vide le cache (les compteurs sont conservés).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self):
+        """
+        Compteurs du cache.
+
+        Returns:
+            dict: Entrées, succès, échecs, taux de succès et évictions
+        """
+        with self._lock:
+            entries, hits, misses, evictions = len(self._entries), self.hits, self.misses, self.evictions
+        lookups = hits + misses
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'evictions': evictions
+        }
@@ -1,18 +1,23 @@
 """
 Modèle Random Forest pour la prédiction du churn.
 """
+import warnings
+
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import GridSearchCV
+from sklearn.metrics import roc_auc_score
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from .base_model import BaseModel
+from .search import SuccessiveHalvingSearch, CachedGridSearch
 
 class RandomForestModel(BaseModel):
     """
     Modèle Random Forest pour la prédiction du churn.
     """
+    RECORD_DTYPE = np.float32
+    
     def __init__(self, n_estimators=100, max_depth=10, min_samples_split=5, min_samples_leaf=2):
         super().__init__(name="Random Forest")
         self.model = RandomForestClassifier(
@@ -35,6 +40,70 @@ class RandomForestModel(BaseModel):
         """
         self.model.fit(X_train, y_train)
         
+    def _predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Moyenne des arbres par parcours direct (X float32 contigu), sans la
+        validation ni la répartition joblib de predict_proba, coûteuses pour une ligne.
+        """
+        n_classes = self.model.n_classes_
+        proba = self.model.estimators_[0].tree_.predict(X)[:, :n_classes]
+        for estimator in self.model.estimators_[1:]:
+            proba += estimator.tree_.predict(X)[:, :n_classes]
+        proba /= len(self.model.estimators_)
+        return proba
+        
+    def train_incremental(self, X_train: pd.DataFrame, y_train: pd.Series, step: int = 25,
+                          max_estimators: int = 500, tol: float = 1e-3, patience: int = 2) -> pd.DataFrame:
+        """
+        Fait croître la forêt par blocs d'arbres (warm_start) jusqu'à stabilisation
+        du score AUC out-of-bag, au lieu de réajuster une forêt par valeur de n_estimators.
+        
+        Args:
+            X_train: Features d'entraînement
+            y_train: Labels d'entraînement
+            step: Nombre d'arbres ajoutés par bloc
+            max_estimators: Taille maximale de la forêt
+            tol: Gain minimal d'AUC OOB pour considérer qu'un bloc améliore le modèle
+            patience: Nombre de blocs consécutifs sans gain avant l'arrêt
+            
+        Returns:
+            DataFrame de l'historique (n_estimators, oob_roc_auc)
+        """
+        # Repartir d'une forêt vide avec les mêmes hyperparamètres
+        self.model = clone(self.model).set_params(warm_start=True, oob_score=True, n_estimators=0)
+        y_values = np.asarray(y_train)
+        history = []
+        best_score = -np.inf
+        stale_blocks = 0
+        
+        while self.model.n_estimators + step <= max_estimators:
+            self.model.set_params(n_estimators=self.model.n_estimators + step)
+            with warnings.catch_warnings():
+                # Mêmes données à chaque bloc : les avertissements warm_start /
+                # class_weight et OOB incomplet (premiers blocs) sont attendus
+                warnings.simplefilter('ignore', UserWarning)
+                self.model.fit(X_train, y_train)
+            
+            # AUC OOB sur les lignes ayant déjà été hors sac au moins une fois
+            oob_proba = self.model.oob_decision_function_[:, 1]
+            covered = np.isfinite(oob_proba)
+            score = roc_auc_score(y_values[covered], oob_proba[covered])
+            history.append({'n_estimators': self.model.n_estimators, 'oob_roc_auc': score})
+            print(f"{self.model.n_estimators} arbres : AUC OOB = {score:.4f}")
+            
+            if score > best_score + tol:
+                best_score = score
+                stale_blocks = 0
+            else:
+                stale_blocks += 1
+                if stale_blocks >= patience:
+                    print(f"Plateau atteint à {self.model.n_estimators} arbres")
+                    break
+        
+        self.model.set_params(warm_start=False)
+        self.oob_history_ = pd.DataFrame(history)
+        return self.oob_history_
+        
     def get_feature_importance(self, feature_names: list) -> pd.DataFrame:
         """
         Retourne l'importance des features basée sur Random Forest.
@@ -63,6 +132,8 @@ class RandomForestModel(BaseModel):
             feature_names: Liste des noms des features
             top_n: Nombre de features à afficher (par défaut: 10)
         """
+        import matplotlib.pyplot as plt
+        
         importance = self.get_feature_importance(feature_names)
         top_features = importance.head(top_n)
         
@@ -74,14 +145,29 @@ class RandomForestModel(BaseModel):
         plt.tight_layout()
         plt.show()
     
-    def optimize_hyperparameters(self, X_train: pd.DataFrame, y_train: pd.Series, cv=3) -> dict:
+    def optimize_hyperparameters(self, X_train: pd.DataFrame, y_train: pd.Series, cv=3,
+                                 search: str = 'grid', resource: str = 'n_samples', factor: int = 3,
+                                 max_fits: int = None, max_time: float = None, fold_cache=None) -> dict:
         """
-        Optimise les hyperparamètres du Random Forest avec GridSearchCV.
+        Optimise les hyperparamètres du Random Forest.
+        
+        Le mode 'grid' évalue exhaustivement la grille avec GridSearchCV. Le mode
+        'halving' élimine les mauvaises configurations sur des ressources réduites
+        (lignes sous-échantillonnées ou peu d'arbres) et respecte un budget ; le
+        journal des essais est disponible dans self.search_.trial_log_. Avec un
+        FoldCache, les folds déjà évalués (mêmes données et paramètres) ne sont
+        pas réajustés.
         
         Args:
             X_train: Features d'entraînement
             y_train: Labels d'entraînement
             cv: Nombre de folds pour la validation croisée
+            search: 'grid' (recherche exhaustive) ou 'halving' (halving successif)
+            resource: Ressource du halving ('n_samples' ou 'n_estimators')
+            factor: Facteur d'élimination du halving
+            max_fits: Nombre maximal d'ajustements (halving)
+            max_time: Temps réel maximal en secondes (halving)
+            fold_cache: FoldCache partagé entre les recherches et les courbes d'apprentissage
             
         Returns:
             Dictionnaire des meilleurs paramètres
@@ -93,27 +179,52 @@ class RandomForestModel(BaseModel):
             'min_samples_split': [2, 5, 10],
             'min_samples_leaf': [1, 2, 4]
         }
+        estimator = RandomForestClassifier(random_state=42, class_weight='balanced', n_jobs=-1)
         
-        # Recherche par grille avec validation croisée
-        grid_search = GridSearchCV(
-            estimator=RandomForestClassifier(random_state=42, class_weight='balanced', n_jobs=-1),
-            param_grid=param_grid,
-            cv=cv,
-            scoring='roc_auc',  # Optimiser pour l'AUC
-            n_jobs=-1,
-            verbose=1
-        )
+        if search == 'grid' and fold_cache is not None:
+            self.search_ = CachedGridSearch(
+                estimator=estimator,
+                param_grid=param_grid,
+                fold_cache=fold_cache,
+                cv=cv,
+                scoring='roc_auc'
+            )
+        elif search == 'grid':
+            # Recherche par grille avec validation croisée
+            self.search_ = GridSearchCV(
+                estimator=estimator,
+                param_grid=param_grid,
+                cv=cv,
+                scoring='roc_auc',  # Optimiser pour l'AUC
+                n_jobs=-1,
+                verbose=1
+            )
+        elif search == 'halving':
+            # Les forêts sont déjà parallèles : validation croisée séquentielle
+            self.search_ = SuccessiveHalvingSearch(
+                estimator=estimator,
+                param_grid=param_grid,
+                resource=resource,
+                factor=factor,
+                cv=cv,
+                scoring='roc_auc',
+                max_fits=max_fits,
+                max_time=max_time,
+                fold_cache=fold_cache
+            )
+        else:
+            raise ValueError(f"Mode de recherche inconnu : {search}. Valeurs possibles : 'grid', 'halving'")
         
         print("Optimisation des hyperparamètres en cours...")
-        grid_search.fit(X_train, y_train)
+        self.search_.fit(X_train, y_train)
         
         # Mettre à jour le modèle avec les meilleurs paramètres
-        self.model = grid_search.best_estimator_
+        self.model = self.search_.best_estimator_
         
-        print(f"Meilleurs paramètres : {grid_search.best_params_}")
-        print(f"Meilleur score AUC : {grid_search.best_score_:.3f}")
+        print(f"Meilleurs paramètres : {self.search_.best_params_}")
+        print(f"Meilleur score AUC : {self.search_.best_score_:.3f}")
         
-        return grid_search.best_params_
+        return self.search_.best_params_
     
     def get_tree_diversity(self) -> dict:
         """
@@ -138,10 +249,14 @@ class RandomForestModel(BaseModel):
             'oob_score': getattr(self.model, 'oob_score_', 'Non disponible')
         }
         
+        # AUC OOB de la dernière croissance incrémentale (train_incremental)
+        if getattr(self, 'oob_history_', None) is not None and len(self.oob_history_):
+            diversity_stats['oob_roc_auc'] = self.oob_history_['oob_roc_auc'].iloc[-1]
+        
         return diversity_stats
     
     def plot_learning_curve(self, X_train: pd.DataFrame, y_train: pd.Series, 
-                           train_sizes: list = None) -> None:
+                           train_sizes: list = None, fold_cache=None) -> None:
         """
         Affiche la courbe d'apprentissage du Random Forest.
         
@@ -149,16 +264,24 @@ class RandomForestModel(BaseModel):
             X_train: Features d'entraînement
             y_train: Labels d'entraînement
             train_sizes: Tailles d'entraînement à tester
+            fold_cache: FoldCache partagé (les folds déjà évalués ne sont pas réajustés)
         """
+        import matplotlib.pyplot as plt
         from sklearn.model_selection import learning_curve
         
         if train_sizes is None:
             train_sizes = np.linspace(0.1, 1.0, 10)
         
-        train_sizes, train_scores, val_scores = learning_curve(
-            self.model, X_train, y_train, 
-            train_sizes=train_sizes, cv=3, scoring='roc_auc', n_jobs=-1
-        )
+        if fold_cache is not None:
+            train_sizes, train_scores, val_scores = fold_cache.learning_curve(
+                self.model, X_train, y_train,
+                train_sizes=train_sizes, cv=3, scoring='roc_auc'
+            )
+        else:
+            train_sizes, train_scores, val_scores = learning_curve(
+                self.model, X_train, y_train, 
+                train_sizes=train_sizes, cv=3, scoring='roc_auc', n_jobs=-1
+            )
         
         plt.figure(figsize=(10, 6))
         plt.plot(train_sizes, np.mean(train_scores, axis=1), 'o-', label='Score d\'entraînement')
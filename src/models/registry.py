@@ -0,0 +1,309 @@
+"""
+Registre local des modèles : paquets versionnés (modèle, préprocesseur,
+schéma des features, métriques) et manifeste avec un pointeur « champion »
+par modèle.
+
+Les modèles sont sauvegardés par joblib sans compression, ce qui permet de les
+recharger en memory-map (mmap_mode='r') : les tableaux numpy du modèle (ex.
+coefficients) sont projetés depuis le fichier au lieu d'être copiés. Ce n'est
+pas le cas des arbres sklearn, dont la désérialisation (Tree.__setstate__)
+recopie les nœuds en mémoire privée : pour qu'une forêt soit partagée entre
+processus de scoring, ses nœuds sont aussi enregistrés en tableaux bruts
+(dossier flat/, voir load_flat), projetés par np.load et partagés via le
+cache système. Le préprocesseur n'est lu qu'à la demande.
+"""
+import json
+import os
+import shutil
+import time
+
+import joblib
+import numpy as np
+
+
+class ModelRegistry:
+    """
+    Registre de modèles versionnés sur disque (models/registry/<nom>/<version>/).
+    """
+    MANIFEST_NAME = 'manifest.json'
+    MODEL_FILE = 'model.joblib'
+    FLAT_DIR = 'flat'
+    SCORER_FILE = 'scorer.py'
+    PREPROCESSOR_FILE = 'preprocessor.joblib'
+    METADATA_FILE = 'metadata.json'
+
+    def __init__(self, registry_dir='models/registry'):
+        self.registry_dir = os.path.normpath(str(registry_dir))
+        os.makedirs(self.registry_dir, exist_ok=True)
+
+    # Manifeste
+
+    def read_manifest(self):
+        """
+        Lit le manifeste du registre.
+
+        Returns:
+            dict: {'models': {nom: {'versions': [...], 'champion': version}}}
+        """
+        path = os.path.join(self.registry_dir, self.MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {'models': {}}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest):
+        path = os.path.join(self.registry_dir, self.MANIFEST_NAME)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def version_dir(self, name, version):
+        return os.path.join(self.registry_dir, name, version)
+
+    def versions(self, name):
+        """
+        Liste les versions enregistrées d'un modèle (de la plus ancienne à la plus récente).
+        """
+        return list(self.read_manifest()['models'].get(name, {}).get('versions', []))
+
+    def champion(self, name):
+        """
+        Retourne la version champion d'un modèle (None si aucune).
+        """
+        return self.read_manifest()['models'].get(name, {}).get('champion')
+
+    def resolve(self, name, version=None):
+        """
+        Résout une version : explicite, sinon le champion, sinon la plus récente.
+        """
+        if version is not None:
+            if version not in self.versions(name):
+                raise ValueError(f"Version inconnue pour {name} : {version}")
+            return version
+        version = self.champion(name) or (self.versions(name) or [None])[-1]
+        if version is None:
+            raise ValueError(f"Aucune version enregistrée pour le modèle {name}")
+        return version
+
+    # Enregistrement
+
+    def register(self, model, preprocessor=None, metrics=None, name=None, set_champion=False):
+        """
+        Enregistre une nouvelle version d'un modèle entraîné.
+
+        Args:
+            model (BaseModel): Modèle entraîné
+            preprocessor (DataPreprocessor): Préprocesseur ajusté utilisé pour l'entraînement
+            metrics (dict): Métriques d'évaluation (valeurs numériques ou tableaux)
+            name (str): Nom du modèle dans le registre (par défaut le nom de sa classe)
+            set_champion (bool): Désigner cette version comme champion
+
+        Returns:
+            str: Version créée (v1, v2, ...)
+        """
+        if model.model is None:
+            raise ValueError("Pas de modèle à enregistrer")
+
+        name = name or type(model).__name__
+        version = f"v{self._last_version_number(name) + 1}"
+
+        entry = self.version_dir(name, version)
+        tmp_entry = entry + '.tmp'
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        os.makedirs(tmp_entry)
+
+        # Sans compression : condition pour le chargement en memory-map
+        joblib.dump(model, os.path.join(tmp_entry, self.MODEL_FILE))
+        if preprocessor is not None:
+            preprocessor.save(os.path.join(tmp_entry, self.PREPROCESSOR_FILE))
+        flat = self._flatten(model)
+        if flat is not None:
+            # Tableaux bruts des arbres : partagés en memory-map entre processus
+            flat.save(os.path.join(tmp_entry, self.FLAT_DIR))
+        compiled = self._compile(model)
+        if compiled is not None:
+            # Scorer Python autonome pour le service de décision en ligne
+            compiled.save(os.path.join(tmp_entry, self.SCORER_FILE))
+
+        metadata = {
+            'name': name,
+            'version': version,
+            'model_class': f"{type(model).__module__}.{type(model).__name__}",
+            'display_name': model.name,
+            'created': time.time(),
+            'schema': self._feature_schema(model, preprocessor),
+            'params': {k: v for k, v in model.model.get_params().items() if isinstance(v, (int, float, str, bool, type(None)))},
+            'preprocessor_config': preprocessor.get_config() if preprocessor is not None else None,
+            'metrics': {k: np.asarray(v).tolist() for k, v in (metrics or {}).items()}
+        }
+        with open(os.path.join(tmp_entry, self.METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+        # Publication atomique de la version, puis mise à jour du manifeste
+        os.replace(tmp_entry, entry)
+        manifest = self.read_manifest()
+        model_entry = manifest['models'].setdefault(name, {'versions': [], 'champion': None})
+        model_entry['versions'].append(version)
+        if set_champion:
+            model_entry['champion'] = version
+        self._write_manifest(manifest)
+
+        return version
+
+    def _last_version_number(self, name):
+        """
+        Plus grand numéro de version connu : celui du manifeste ou d'un dossier
+        vN resté sur disque sans entrée au manifeste (enregistrement interrompu).
+        """
+        numbers = [int(v[1:]) for v in self.versions(name)]
+        model_dir = os.path.join(self.registry_dir, name)
+        if os.path.isdir(model_dir):
+            numbers += [int(d[1:]) for d in os.listdir(model_dir) if d[:1] == 'v' and d[1:].isdigit()]
+        return max(numbers, default=0)
+
+    @staticmethod
+    def _flatten(model):
+        from .inference import FlatTreeEnsemble
+        try:
+            return FlatTreeEnsemble.from_estimator(model)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _compile(model):
+        from .codegen import CompiledTree
+        try:
+            return CompiledTree.from_estimator(model)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _feature_schema(model, preprocessor):
+        if preprocessor is not None and preprocessor.feature_names:
+            features = list(preprocessor.feature_names)
+        else:
+            features = [str(f) for f in getattr(model.model, 'feature_names_in_', [])]
+        return {'features': features, 'n_features': len(features), 'dtype': 'float64'}
+
+    def set_champion(self, name, version):
+        """
+        Désigne une version comme champion.
+        """
+        version = self.resolve(name, version)
+        manifest = self.read_manifest()
+        manifest['models'][name]['champion'] = version
+        self._write_manifest(manifest)
+
+    def promote_if_better(self, name, version, metric='roc_auc'):
+        """
+        Désigne la version comme champion si elle bat le champion actuel sur la métrique.
+
+        Returns:
+            bool: True si la version est devenue champion
+        """
+        current = self.champion(name)
+        score = self.get_metadata(name, version)['metrics'].get(metric)
+        if current is not None and current != version:
+            best = self.get_metadata(name, current)['metrics'].get(metric)
+            if best is not None and (score is None or score <= best):
+                return False
+        self.set_champion(name, version)
+        return True
+
+    # Chargement
+
+    def get_metadata(self, name, version=None):
+        """
+        Lit les métadonnées d'une version (champion par défaut).
+        """
+        version = self.resolve(name, version)
+        with open(os.path.join(self.version_dir(name, version), self.METADATA_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_model(self, name, version=None, mmap=True):
+        """
+        Charge un modèle (champion par défaut).
+
+        Args:
+            name (str): Nom du modèle dans le registre
+            version (str): Version (champion, sinon la plus récente, si None)
+            mmap (bool): Projeter les tableaux numpy du modèle en mémoire (lecture seule) ;
+                sans effet sur les nœuds des arbres sklearn, recopiés au chargement
+                (utiliser load_flat pour partager une forêt entre processus)
+
+        Returns:
+            BaseModel: Modèle prêt pour predict / predict_proba
+        """
+        version = self.resolve(name, version)
+        path = os.path.join(self.version_dir(name, version), self.MODEL_FILE)
+        return joblib.load(path, mmap_mode='r' if mmap else None)
+
+    def load_flat(self, name, version=None, mmap=True):
+        """
+        Charge la version aplatie d'un modèle à base d'arbres (None si le modèle n'en a pas).
+
+        Args:
+            name (str): Nom du modèle dans le registre
+            version (str): Version (champion, sinon la plus récente, si None)
+            mmap (bool): Projeter les tableaux en mémoire (partagés entre processus)
+
+        Returns:
+            FlatTreeEnsemble: Moteur d'inférence NumPy
+        """
+        from .inference import FlatTreeEnsemble
+
+        version = self.resolve(name, version)
+        path = os.path.join(self.version_dir(name, version), self.FLAT_DIR)
+        return FlatTreeEnsemble.load(path, mmap=mmap) if os.path.isdir(path) else None
+
+    def load_compiled(self, name, version=None):
+        """
+        Charge le scorer généré d'un arbre de décision (None si le modèle n'en a pas).
+
+        Returns:
+            CompiledTree: Scorer compilé (comparaisons imbriquées)
+        """
+        from .codegen import CompiledTree
+
+        version = self.resolve(name, version)
+        path = os.path.join(self.version_dir(name, version), self.SCORER_FILE)
+        return CompiledTree.load(path) if os.path.exists(path) else None
+
+    def load_preprocessor(self, name, version=None):
+        """
+        Charge le préprocesseur enregistré avec une version (None s'il n'y en a pas).
+        """
+        from ..data.preprocessor import DataPreprocessor
+
+        version = self.resolve(name, version)
+        path = os.path.join(self.version_dir(name, version), self.PREPROCESSOR_FILE)
+        return DataPreprocessor.load(path) if os.path.exists(path) else None
+
+    def load_bundle(self, name, version=None, mmap=True):
+        """
+        Charge le paquet complet d'une version.
+
+        Returns:
+            dict: {'model', 'preprocessor', 'metadata'}
+        """
+        version = self.resolve(name, version)
+        return {
+            'model': self.load_model(name, version, mmap=mmap),
+            'preprocessor': self.load_preprocessor(name, version),
+            'metadata': self.get_metadata(name, version)
+        }
+
+    def remove(self, name, version):
+        """
+        Supprime une version (le pointeur champion est retiré s'il la désignait).
+        """
+        manifest = self.read_manifest()
+        model_entry = manifest['models'].get(name)
+        if model_entry is None or version not in model_entry['versions']:
+            raise ValueError(f"Version inconnue pour {name} : {version}")
+        model_entry['versions'].remove(version)
+        if model_entry['champion'] == version:
+            model_entry['champion'] = None
+        self._write_manifest(manifest)
+        shutil.rmtree(self.version_dir(name, version), ignore_errors=True)
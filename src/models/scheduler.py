@@ -0,0 +1,107 @@
+"""
+Ordonnanceur d'entraînement concurrent des modèles.
+
+Chaque modèle (sous-classe de BaseModel) est entraîné dans un processus
+distinct avec une part explicite des cœurs : le n_jobs du modèle et les pools
+de threads natifs (BLAS, OpenMP) sont limités à cette part, ce qui évite la
+sursouscription lorsque plusieurs modèles parallèles tournent en même temps.
+Les données sont lues en memory-map depuis le stockage prétraité par chaque
+processus, sans être sérialisées entre processus.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from threadpoolctl import threadpool_limits
+
+
+def _train_job(model_class, model_kwargs, n_cores, processed_dir):
+    """
+    Entraîne un modèle dans un processus de travail (fonction de module, picklable).
+    """
+    with threadpool_limits(limits=n_cores):
+        model = model_class(**model_kwargs)
+        model.set_n_jobs(n_cores)
+        start = time.perf_counter()
+        model.train_from_store(processed_dir, mmap=True)
+        elapsed = time.perf_counter() - start
+    return model, elapsed
+
+
+class TrainingScheduler:
+    """
+    Entraîne plusieurs modèles en parallèle avec un budget de cœurs.
+    """
+    def __init__(self, n_cores=None):
+        """
+        Args:
+            n_cores (int): Nombre total de cœurs alloués à l'entraînement
+                (par défaut tous les cœurs de la machine)
+        """
+        self.n_cores = n_cores or os.cpu_count() or 1
+        self.jobs = []
+
+    def add(self, model_class, weight=1.0, **model_kwargs):
+        """
+        Ajoute un modèle à entraîner.
+
+        Args:
+            model_class: Sous-classe de BaseModel
+            weight (float): Poids relatif dans le partage des cœurs
+                (ex. plus élevé pour Random Forest, parallélisable)
+            **model_kwargs: Paramètres du constructeur du modèle
+        """
+        self.jobs.append({'model_class': model_class, 'weight': weight, 'kwargs': model_kwargs})
+        return self
+
+    def allocate_cores(self):
+        """
+        Répartit les cœurs proportionnellement aux poids (au moins un par modèle).
+
+        Returns:
+            list: Nombre de cœurs par modèle, dans l'ordre d'ajout
+        """
+        if not self.jobs:
+            return []
+
+        # Au moins un cœur par modèle ; si les modèles sont plus nombreux que les
+        # cœurs, le pool limitera le nombre de processus simultanés
+        spare = max(self.n_cores - len(self.jobs), 0)
+        total_weight = sum(job['weight'] for job in self.jobs)
+        shares = [job['weight'] / total_weight * spare for job in self.jobs]
+        cores = [1 + int(share) for share in shares]
+
+        # Distribuer les cœurs restants aux plus grandes parts fractionnaires
+        remaining = spare - sum(int(share) for share in shares)
+        by_fraction = sorted(range(len(shares)), key=lambda i: shares[i] - int(shares[i]), reverse=True)
+        for i in by_fraction[:remaining]:
+            cores[i] += 1
+
+        return cores
+
+    def run(self, processed_dir='data/processed'):
+        """
+        Entraîne tous les modèles en parallèle.
+
+        Args:
+            processed_dir (str): Dossier du stockage prétraité (ProcessedDataStore)
+
+        Returns:
+            dict: Nom du modèle -> {'model', 'n_cores', 'wall_time'}
+        """
+        cores = self.allocate_cores()
+        max_workers = min(len(self.jobs), self.n_cores)
+        results = {}
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (executor.submit(_train_job, job['model_class'], job['kwargs'], n_cores, str(processed_dir)), n_cores)
+                for job, n_cores in zip(self.jobs, cores)
+            ]
+            for future, n_cores in futures:
+                model, elapsed = future.result()
+                results[model.name] = {'model': model, 'n_cores': n_cores, 'wall_time': elapsed}
+        self.total_wall_time = time.perf_counter() - start
+
+        return results
@@ -0,0 +1,263 @@
+"""
+Recherches d'hyperparamètres : halving successif sous budget et grille avec
+cache des folds.
+
+Toutes les configurations sont d'abord évaluées avec une ressource réduite
+(peu de lignes ou peu d'arbres), puis seul le meilleur tiers (facteur 3 par
+défaut) passe au tour suivant avec une ressource multipliée par le facteur.
+La recherche s'arrête dès que le budget (nombre d'ajustements ou temps réel)
+est épuisé : le meilleur candidat du tour le plus avancé est alors retenu.
+"""
+import math
+import time
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, StratifiedKFold, cross_val_score
+
+
+class SuccessiveHalvingSearch:
+    """
+    Halving successif avec budget, interface proche de GridSearchCV
+    (best_params_, best_score_, best_estimator_).
+    """
+    RESOURCES = ('n_samples', 'n_estimators')
+
+    def __init__(self, estimator, param_grid, resource='n_samples', factor=3, min_resource=None,
+                 max_resource=None, cv=3, scoring='roc_auc', max_fits=None, max_time=None,
+                 random_state=42, n_jobs=None, verbose=1, fold_cache=None):
+        """
+        Args:
+            estimator: Estimateur sklearn de base
+            param_grid (dict): Grille de paramètres (comme GridSearchCV)
+            resource (str): Ressource allouée par tour ('n_samples' ou 'n_estimators')
+            factor (int): Facteur d'élimination et de croissance de la ressource
+            min_resource (int): Ressource du premier tour (déduite du nombre de candidats si None)
+            max_resource (int): Ressource maximale (toutes les lignes ou n_estimators de la grille)
+            cv (int): Nombre de folds
+            scoring (str): Métrique sklearn à maximiser
+            max_fits (int): Nombre maximal d'ajustements (un par fold)
+            max_time (float): Temps réel maximal en secondes
+            random_state (int): Graine du sous-échantillonnage et des folds
+            n_jobs (int): Parallélisme de la validation croisée
+            verbose (int): Affiche un résumé par tour si > 0
+            fold_cache (FoldCache): Cache persistant des scores de folds
+        """
+        if resource not in self.RESOURCES:
+            raise ValueError(f"Ressource inconnue : {resource}. Valeurs possibles : {self.RESOURCES}")
+        if factor < 2:
+            raise ValueError("Le facteur de halving doit être au moins 2")
+
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.resource = resource
+        self.factor = factor
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.cv = cv
+        self.scoring = scoring
+        self.max_fits = max_fits
+        self.max_time = max_time
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.verbose = verbose
+        self.fold_cache = fold_cache
+
+    def _candidates(self):
+        grid = dict(self.param_grid)
+        if self.resource == 'n_estimators':
+            # Le nombre d'arbres devient la ressource : il sort de la grille
+            grid.pop('n_estimators', None)
+        return list(ParameterGrid(grid))
+
+    def _resource_bounds(self, n_samples, n_candidates):
+        if self.resource == 'n_samples':
+            max_resource = self.max_resource or n_samples
+            floor = 20 * self.cv  # quelques dizaines de lignes par fold au minimum
+        else:
+            n_estimators = self.param_grid.get('n_estimators', [self.estimator.get_params()['n_estimators']])
+            max_resource = self.max_resource or max(n_estimators)
+            floor = 10
+
+        # Assez de tours pour ramener les candidats à un seul
+        n_rounds = max(1, math.ceil(math.log(n_candidates, self.factor)) + 1)
+        min_resource = self.min_resource or max_resource // self.factor ** (n_rounds - 1)
+        return max(min(min_resource, max_resource), min(floor, max_resource)), max_resource
+
+    def _sample_order(self, y):
+        """
+        Ordre aléatoire stratifié : tout préfixe conserve la proportion des classes.
+        """
+        rng = np.random.default_rng(self.random_state)
+        keys = np.empty(len(y))
+        for cls in np.unique(y):
+            idx = np.flatnonzero(y == cls)
+            keys[idx] = (rng.permutation(len(idx)) + rng.random(len(idx))) / len(idx)
+        return np.argsort(keys, kind='stable')
+
+    def _budget_left(self, start):
+        if self.max_fits is not None and self.n_fits_ + self.cv > self.max_fits:
+            return False
+        if self.max_time is not None and time.perf_counter() - start >= self.max_time:
+            return False
+        return True
+
+    def fit(self, X, y):
+        """
+        Lance la recherche puis réajuste le meilleur candidat sur toutes les données.
+
+        Args:
+            X (pd.DataFrame): Features d'entraînement
+            y (pd.Series): Labels d'entraînement
+
+        Returns:
+            SuccessiveHalvingSearch: L'instance ajustée
+        """
+        y_values = np.asarray(y)
+        candidates = self._candidates()
+        resource, max_resource = self._resource_bounds(len(y_values), len(candidates))
+        order = self._sample_order(y_values) if self.resource == 'n_samples' else None
+        folds = StratifiedKFold(n_splits=self.cv, shuffle=True, random_state=self.random_state)
+        data_hash = self.fold_cache.data_hash(X, y_values) if self.fold_cache is not None else None
+
+        self.trial_log_ = []
+        self.n_fits_ = 0
+        self.budget_exhausted_ = False
+        start = time.perf_counter()
+        best = None
+        round_index = 0
+
+        while candidates:
+            if self.resource == 'n_samples':
+                rows = np.sort(order[:resource])
+                X_round, y_round = X.iloc[rows], y_values[rows]
+            else:
+                X_round, y_round = X, y_values
+
+            scores = []
+            for params in candidates:
+                if not self._budget_left(start):
+                    self.budget_exhausted_ = True
+                    break
+                estimator = clone(self.estimator).set_params(**params)
+                if self.resource == 'n_estimators':
+                    estimator.set_params(n_estimators=resource)
+
+                fit_start = time.perf_counter()
+                misses = self.fold_cache.misses if self.fold_cache is not None else 0
+                if self.fold_cache is not None:
+                    # Le sous-échantillon est déterminé par sa taille et la graine
+                    extra = {'n_samples': int(resource), 'sample_seed': self.random_state} \
+                        if self.resource == 'n_samples' else None
+                    cv_scores = self.fold_cache.cross_val_score(estimator, X_round, y_round, cv=folds,
+                                                                scoring=self.scoring, data_hash=data_hash,
+                                                                extra=extra)
+                else:
+                    cv_scores = cross_val_score(estimator, X_round, y_round, cv=folds,
+                                                scoring=self.scoring, n_jobs=self.n_jobs)
+                # Les folds lus dans le cache ne consomment pas de budget
+                self.n_fits_ += self.fold_cache.misses - misses if self.fold_cache is not None else self.cv
+                scores.append(float(np.mean(cv_scores)))
+                self.trial_log_.append({
+                    'round': round_index,
+                    'resource': resource,
+                    'params': params,
+                    'mean_score': scores[-1],
+                    'std_score': float(np.std(cv_scores)),
+                    'fit_time': time.perf_counter() - fit_start
+                })
+
+            if scores:
+                # Meilleur candidat du tour le plus avancé ayant au moins un essai
+                best_index = int(np.argmax(scores))
+                best = (candidates[best_index], scores[best_index], resource)
+                if self.verbose:
+                    print(f"Tour {round_index} : {len(scores)} candidats, ressource {self.resource}={resource}, "
+                          f"meilleur score {scores[best_index]:.3f}")
+
+            if self.budget_exhausted_ or len(candidates) == 1 or resource >= max_resource:
+                break
+
+            # Conserver le meilleur 1/factor des candidats, ressource multipliée par factor
+            n_keep = max(1, math.ceil(len(candidates) / self.factor))
+            ranking = np.argsort(scores)[::-1][:n_keep]
+            candidates = [candidates[i] for i in ranking]
+            resource = min(resource * self.factor, max_resource)
+            round_index += 1
+
+        if best is None:
+            raise ValueError("Budget insuffisant pour évaluer au moins une configuration")
+
+        params, self.best_score_, best_resource = best
+        self.best_params_ = dict(params)
+        if self.resource == 'n_estimators':
+            self.best_params_['n_estimators'] = best_resource
+
+        # Réajustement du meilleur candidat sur toutes les données
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        self.best_estimator_.fit(X, y)
+        self.n_fits_ += 1
+        self.elapsed_time_ = time.perf_counter() - start
+
+        if self.verbose and self.budget_exhausted_:
+            print(f"Budget épuisé après {self.n_fits_ - 1} ajustements ({self.elapsed_time_:.1f}s)")
+
+        return self
+
+
+class CachedGridSearch:
+    """
+    Recherche exhaustive sur grille dont chaque fold passe par un FoldCache :
+    seules les combinaisons absentes du cache sont ajustées.
+    """
+    def __init__(self, estimator, param_grid, fold_cache, cv=3, scoring='roc_auc', verbose=1):
+        """
+        Args:
+            estimator: Estimateur sklearn de base
+            param_grid (dict): Grille de paramètres (comme GridSearchCV)
+            fold_cache (FoldCache): Cache persistant des scores de folds
+            cv (int): Nombre de folds
+            scoring (str): Métrique sklearn à maximiser
+            verbose (int): Affiche le nombre d'ajustements évités si > 0
+        """
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.fold_cache = fold_cache
+        self.cv = cv
+        self.scoring = scoring
+        self.verbose = verbose
+
+    def fit(self, X, y):
+        """
+        Évalue toute la grille puis réajuste le meilleur candidat sur toutes les données.
+
+        Args:
+            X (pd.DataFrame): Features d'entraînement
+            y (pd.Series): Labels d'entraînement
+
+        Returns:
+            CachedGridSearch: L'instance ajustée
+        """
+        y_values = np.asarray(y)
+        data_hash = self.fold_cache.data_hash(X, y_values)
+        hits, misses = self.fold_cache.hits, self.fold_cache.misses
+
+        self.cv_results_ = {'params': [], 'mean_test_score': [], 'std_test_score': []}
+        for params in ParameterGrid(self.param_grid):
+            estimator = clone(self.estimator).set_params(**params)
+            scores = self.fold_cache.cross_val_score(estimator, X, y_values, cv=self.cv,
+                                                     scoring=self.scoring, data_hash=data_hash)
+            self.cv_results_['params'].append(params)
+            self.cv_results_['mean_test_score'].append(float(np.mean(scores)))
+            self.cv_results_['std_test_score'].append(float(np.std(scores)))
+
+        if self.verbose:
+            print(f"Folds lus dans le cache : {self.fold_cache.hits - hits}, "
+                  f"ajustés : {self.fold_cache.misses - misses}")
+
+        best_index = int(np.argmax(self.cv_results_['mean_test_score']))
+        self.best_params_ = self.cv_results_['params'][best_index]
+        self.best_score_ = self.cv_results_['mean_test_score'][best_index]
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        self.best_estimator_.fit(X, y)
+        return self
@@ -0,0 +1,108 @@
+"""
+Régression logistique par descente de gradient stochastique, entraînable par blocs.
+"""
+from sklearn.linear_model import SGDClassifier
+import pandas as pd
+import numpy as np
+from scipy.special import expit
+from .base_model import BaseModel
+
+class SGDLogisticModel(BaseModel):
+    """
+    Régression logistique (SGD) entraînée bloc par bloc avec partial_fit :
+    la mémoire nécessaire est bornée par la taille d'un bloc, pas par celle
+    du dataset.
+    """
+    def __init__(self, alpha=1e-4, class_weight='balanced', learning_rate='optimal', eta0=0.0):
+        super().__init__(name="Régression Logistique SGD")
+        self.model = SGDClassifier(
+            loss='log_loss',            # Régression logistique (predict_proba disponible)
+            alpha=alpha,                # Régularisation L2
+            learning_rate=learning_rate,
+            eta0=eta0,
+            shuffle=True,               # Mélange des lignes à l'intérieur de chaque bloc
+            average=True,               # Moyenne des poids (ASGD), plus stable d'un bloc à l'autre
+            random_state=42
+        )
+        # 'balanced' n'est pas supporté par partial_fit : les poids sont calculés
+        # sur les effectifs cumulés des blocs déjà vus
+        self.class_weight = class_weight
+        self.classes = np.array([0, 1])
+        self.class_counts = np.zeros(len(self.classes), dtype=np.int64)
+
+    def train(self, X_train: pd.DataFrame, y_train: pd.Series) -> None:
+        """
+        Entraîne le modèle sur des données en mémoire.
+
+        Args:
+            X_train: Features d'entraînement
+            y_train: Labels d'entraînement
+        """
+        self.model.set_params(class_weight=self.class_weight)
+        self.model.fit(X_train, y_train)
+        self.class_counts = np.bincount(np.asarray(y_train, dtype=np.int64), minlength=len(self.classes))
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Met à jour le modèle avec un bloc de données.
+
+        Args:
+            X: Features du bloc
+            y: Labels du bloc (0/1)
+        """
+        y = np.asarray(y, dtype=np.int64)
+        self.class_counts += np.bincount(y, minlength=len(self.classes))
+
+        sample_weight = None
+        if self.class_weight == 'balanced':
+            counts = np.maximum(self.class_counts, 1)
+            weights = counts.sum() / (len(self.classes) * counts)
+            sample_weight = weights[y]
+        elif isinstance(self.class_weight, dict):
+            sample_weight = np.array([self.class_weight.get(c, 1.0) for c in self.classes])[y]
+
+        self.model.partial_fit(X, y, classes=self.classes, sample_weight=sample_weight)
+
+    def train_incremental(self, chunks) -> int:
+        """
+        Entraîne le modèle sur un itérateur de blocs prétraités (une passe).
+
+        Args:
+            chunks: Itérateur de couples (X, y)
+
+        Returns:
+            Nombre de lignes vues
+        """
+        n_rows = 0
+        for X, y in chunks:
+            self.partial_fit(X, y)
+            n_rows += len(y)
+        return n_rows
+
+    def _predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fonction logistique du score linéaire, sans validation d'entrée.
+        """
+        positive = expit(X @ self.model.coef_.T + self.model.intercept_).ravel()
+        return np.column_stack([1 - positive, positive])
+
+    def get_feature_importance(self, feature_names: list) -> pd.DataFrame:
+        """
+        Retourne l'importance des features basée sur les coefficients.
+
+        Args:
+            feature_names: Liste des noms des features
+
+        Returns:
+            DataFrame avec les importances des features
+        """
+        if self.model is None or not hasattr(self.model, 'coef_'):
+            raise ValueError("Le modèle doit être entraîné avant de calculer l'importance des features")
+
+        importance = pd.DataFrame({
+            'feature': feature_names,
+            'importance': np.abs(self.model.coef_[0]),
+            'coefficient': self.model.coef_[0]
+        })
+
+        return importance.sort_values('importance', ascending=False)
@@ -0,0 +1,109 @@
+"""
+Entraînement hors mémoire : le CSV brut est lu par blocs, chaque bloc passe
+par le préprocesseur ajusté dans une matrice réutilisée, puis met à jour un
+modèle incrémental (partial_fit). La mémoire est bornée par la taille d'un bloc.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..data.dataset import Dataset
+from ..data.schema import TARGET_COLUMN, TRUE_VALUES
+
+
+def iter_preprocessed_chunks(preprocessor, raw_chunks, target_column=TARGET_COLUMN, chunksize=None, counts=None):
+    """
+    Applique le préprocesseur ajusté à des blocs bruts.
+
+    La même matrice de sortie est réutilisée d'un bloc à l'autre : chaque bloc
+    produit doit être consommé avant de demander le suivant. Les lignes sans
+    cible (vide ou manquante) sont écartées : elles ne sont pas du « non churn ».
+
+    Args:
+        preprocessor (DataPreprocessor): Préprocesseur ajusté (avec l'encodeur de la cible)
+        raw_chunks: Itérateur de DataFrames bruts
+        target_column (str): Colonne cible
+        chunksize (int): Taille maximale d'un bloc (dimensionne la matrice dès le départ)
+        counts (dict): Compteurs mis à jour au fil des blocs ('unlabelled' : lignes écartées)
+
+    Yields:
+        tuple: (X, y) du bloc, X étant un DataFrame sur la matrice réutilisée
+    """
+    if target_column not in preprocessor.label_encoders:
+        raise ValueError(f"Le préprocesseur n'a pas d'encodeur pour la cible {target_column}")
+    target_encoder = preprocessor.label_encoders[target_column]
+
+    buffer = np.empty((chunksize or 0, len(preprocessor.feature_names)), dtype=np.float64)
+    for chunk in raw_chunks:
+        if len(chunk) > len(buffer):
+            buffer = np.empty((len(chunk), len(preprocessor.feature_names)), dtype=np.float64)
+        labelled = _labelled(chunk[target_column])
+        n_unlabelled = len(labelled) - int(labelled.sum())
+        if n_unlabelled:
+            chunk = chunk[labelled]
+            if counts is not None:
+                counts['unlabelled'] = counts.get('unlabelled', 0) + n_unlabelled
+            if chunk.empty:
+                continue
+        X = preprocessor.transform_array(chunk, out=buffer[:len(chunk)])
+        X = pd.DataFrame(X, columns=preprocessor.feature_names, copy=False)
+        yield X, _encode_target(target_encoder, chunk[target_column])
+
+
+def _labelled(values):
+    """
+    Masque des lignes dont la cible est renseignée (ni manquante, ni vide).
+    """
+    labelled = values.notna().to_numpy()
+    if not pd.api.types.is_bool_dtype(values.dtype):
+        labelled &= (values.astype(str).str.strip() != '').to_numpy()
+    return labelled
+
+
+def _encode_target(target_encoder, values):
+    """
+    Encode la cible d'un bloc brut ('Yes'/'No' ou booléens) comme l'encodeur du
+    préprocesseur, quel que soit le type sur lequel il a été ajusté.
+    """
+    # Les classes apprises sont triées : la seconde est toujours le churn ('Yes', True ou 1)
+    if len(target_encoder.classes_) != 2:
+        raise ValueError(f"Cible binaire attendue, classes apprises : {list(target_encoder.classes_)}")
+    if pd.api.types.is_bool_dtype(values.dtype):
+        positive = values.to_numpy(dtype=bool, na_value=False)
+    else:
+        positive = values.astype(str).isin(TRUE_VALUES).to_numpy()
+    return positive.astype(np.int64)
+
+
+def train_streaming(model, preprocessor, csv_path, chunksize=100_000, n_epochs=1, target_column=TARGET_COLUMN):
+    """
+    Entraîne un modèle incrémental sur un CSV brut lu par blocs.
+
+    Args:
+        model: Modèle disposant de partial_fit (ex. SGDLogisticModel)
+        preprocessor (DataPreprocessor): Préprocesseur ajusté
+        csv_path (str): Fichier CSV brut
+        chunksize (int): Nombre de lignes par bloc
+        n_epochs (int): Nombre de passes sur le fichier
+        target_column (str): Colonne cible
+
+    Returns:
+        Le modèle entraîné
+    """
+    dataset = Dataset()
+    for epoch in range(n_epochs):
+        start = time.perf_counter()
+        counts = {}
+        chunks = iter_preprocessed_chunks(
+            preprocessor, dataset.iter_chunks(chunksize=chunksize, csv_path=str(csv_path)),
+            target_column=target_column, chunksize=chunksize, counts=counts
+        )
+        n_rows = model.train_incremental(chunks)
+        elapsed = time.perf_counter() - start
+        print(f" Époque {epoch + 1}/{n_epochs}: {n_rows} lignes en {elapsed:.1f}s "
+              f"({n_rows / max(elapsed, 1e-9):,.0f} lignes/s)")
+        if counts.get('unlabelled'):
+            print(f" {counts['unlabelled']} lignes sans cible ignorées")
+
+    return model
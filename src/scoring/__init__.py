@@ -0,0 +1,7 @@
+"""
+Module de scoring
+"""
+from .batch import BatchScorer, score_csv
+from .service import MicroBatcher, ScoringService
+
+__all__ = ['BatchScorer', 'score_csv', 'MicroBatcher', 'ScoringService']
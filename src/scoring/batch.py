@@ -0,0 +1,201 @@
+"""
+Scoring par lots de nouveaux clients à partir d'un CSV brut au format Telco.
+
+Le fichier est lu par blocs ; chaque bloc est envoyé à un pool de processus
+qui applique le préprocesseur ajusté (nettoyage, encodage, standardisation)
+dans une matrice réutilisée, puis predict_proba. Chaque processus charge une
+seule fois le modèle depuis le registre (en memory-map, avec le moteur aplati
+pour les modèles à base d'arbres). Les résultats sont écrits dans l'ordre du
+fichier d'entrée et le nombre de blocs en vol est borné : la mémoire reste
+constante quelle que soit la taille du fichier.
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from ..data.dataset import Dataset
+from ..data.schema import ID_COLUMN, TRUE_VALUES, FALSE_VALUES
+
+# État d'un processus de scoring, chargé une fois par _init_worker
+_worker = {}
+
+
+def _init_worker(registry_dir, name, version):
+    """
+    Charge le modèle et le préprocesseur dans un processus de travail.
+    """
+    # Un cœur par processus : le parallélisme vient du pool
+    threadpool_limits(limits=1)
+    _worker['scorer'] = BatchScorer.from_registry(registry_dir, name, version, n_jobs=1)
+
+
+def _score_job(chunk, threshold):
+    """
+    Score un bloc dans un processus de travail (fonction de module, picklable).
+    """
+    return _worker['scorer'].score_chunk(chunk, threshold)
+
+
+class BatchScorer:
+    """
+    Applique le préprocesseur et le modèle d'une version du registre à des blocs bruts.
+    """
+    def __init__(self, model, preprocessor, flat=None, cache=None):
+        """
+        Args:
+            model (BaseModel): Modèle entraîné
+            preprocessor (DataPreprocessor): Préprocesseur ajusté avec le modèle
+            flat (FlatTreeEnsemble): Moteur aplati équivalent au modèle (optionnel)
+            cache (PredictionCache): Cache des prédictions autour du modèle (ou du
+                moteur aplati), optionnel
+        """
+        if preprocessor is None:
+            raise ValueError("Un préprocesseur ajusté est nécessaire pour scorer des données brutes")
+        self.model = model
+        self.preprocessor = preprocessor
+        self.flat = flat
+        self.cache = cache
+        self.buffer = np.empty((0, len(preprocessor.feature_names)), dtype=np.float64)
+
+    @classmethod
+    def from_registry(cls, registry_dir, name, version=None, n_jobs=None, cache_size=None, cache_ttl=3600.0):
+        """
+        Charge un modèle (champion par défaut) et son préprocesseur depuis le registre.
+
+        Args:
+            registry_dir (str): Dossier du registre
+            name (str): Nom du modèle dans le registre
+            version (str): Version (champion, sinon la plus récente, si None)
+            n_jobs (int): Nombre de cœurs du modèle pour predict_proba
+            cache_size (int): Taille du cache des prédictions (pas de cache si None ou 0)
+            cache_ttl (float): Durée de vie des entrées du cache, en secondes
+
+        Returns:
+            BatchScorer: Scorer prêt à l'emploi
+        """
+        from ..models.registry import ModelRegistry
+        from ..models.prediction_cache import PredictionCache
+
+        registry = ModelRegistry(registry_dir)
+        version = registry.resolve(name, version)
+        model = registry.load_model(name, version, mmap=True)
+        if n_jobs is not None:
+            model.set_n_jobs(n_jobs)
+        flat = registry.load_flat(name, version)
+        cache = None
+        if cache_size:
+            cache = PredictionCache(flat if flat is not None else model, model_version=f"{name}/{version}",
+                                    max_entries=cache_size, ttl=cache_ttl)
+        return cls(model, registry.load_preprocessor(name, version), flat=flat, cache=cache)
+
+    def predict_proba(self, chunk):
+        """
+        Probabilité de churn de chaque ligne d'un bloc brut.
+
+        Args:
+            chunk (pd.DataFrame): Bloc brut (colonnes du CSV Telco, cible facultative)
+
+        Returns:
+            np.ndarray: Probabilités de la classe positive
+        """
+        if len(chunk) > len(self.buffer):
+            self.buffer = np.empty((len(chunk), self.buffer.shape[1]), dtype=np.float64)
+        X = self.preprocessor.transform_array(chunk, out=self.buffer[:len(chunk)])
+        if self.flat is None:
+            X = pd.DataFrame(X, columns=self.preprocessor.feature_names, copy=False)
+        if self.cache is not None:
+            return self.cache.predict_proba(X)[:, 1]
+        return (self.flat if self.flat is not None else self.model).predict_proba(X)[:, 1]
+
+    def score_chunk(self, chunk, threshold=0.5):
+        """
+        Score un bloc brut.
+
+        Args:
+            chunk (pd.DataFrame): Bloc brut
+            threshold (float): Seuil de décision sur la probabilité de churn
+
+        Returns:
+            pd.DataFrame: customerID, probability, label ('Yes' / 'No')
+        """
+        probability = self.predict_proba(chunk)
+        if ID_COLUMN in chunk.columns:
+            ids = chunk[ID_COLUMN].to_numpy()
+        else:
+            ids = chunk.index.to_numpy()
+        return pd.DataFrame({
+            ID_COLUMN: ids,
+            'probability': probability,
+            'label': np.where(probability >= threshold, TRUE_VALUES[0], FALSE_VALUES[0])
+        })
+
+
+def score_csv(input_path, output_path, registry_dir, name, version=None, chunksize=100_000,
+              n_workers=None, threshold=0.5, max_pending=None):
+    """
+    Score un CSV brut par blocs avec un pool de processus.
+
+    Args:
+        input_path (str): CSV brut de nouveaux clients (format Telco)
+        output_path (str): CSV de sortie (customerID, probability, label)
+        registry_dir (str): Dossier du registre des modèles
+        name (str): Nom du modèle dans le registre
+        version (str): Version (champion, sinon la plus récente, si None)
+        chunksize (int): Lignes par bloc
+        n_workers (int): Nombre de processus (par défaut tous les cœurs ; 1 : sans pool)
+        threshold (float): Seuil de décision sur la probabilité de churn
+        max_pending (int): Blocs lus mais pas encore écrits (par défaut 2 par processus)
+
+    Returns:
+        dict: Nombre de lignes, durée et débit
+    """
+    # Vérifier l'entrée avant d'ouvrir le fichier temporaire : une sortie
+    # existante n'est jamais remplacée par un fichier vide
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Fichier à scorer introuvable : {input_path}")
+    n_workers = n_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * n_workers
+    chunks = Dataset().iter_chunks(chunksize=chunksize, csv_path=str(input_path))
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = str(output_path) + '.tmp'
+
+    n_rows = 0
+    start = time.perf_counter()
+
+    def write(f, result):
+        nonlocal n_rows
+        result.to_csv(f, header=n_rows == 0, index=False, float_format='%.6f')
+        n_rows += len(result)
+
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        if n_workers == 1:
+            # Sans pool : même chemin de code, dans le processus courant
+            _init_worker(registry_dir, name, version)
+            for chunk in chunks:
+                write(f, _score_job(chunk, threshold))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                     initargs=(str(registry_dir), name, version)) as pool:
+                # File d'attente ordonnée : les résultats sont écrits dans l'ordre
+                # de lecture, et la lecture attend quand max_pending blocs sont en vol
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_score_job, chunk, threshold))
+                    if len(pending) >= max_pending:
+                        write(f, pending.popleft().result())
+                while pending:
+                    write(f, pending.popleft().result())
+    os.replace(tmp_path, output_path)
+
+    elapsed = time.perf_counter() - start
+    rows_per_second = n_rows / max(elapsed, 1e-9)
+    print(f" {n_rows} lignes scorées en {elapsed:.1f}s ({rows_per_second:,.0f} lignes/s, "
+          f"{n_workers} processus) -> {output_path}")
+    return {'rows': n_rows, 'elapsed': elapsed, 'rows_per_second': rows_per_second, 'output': str(output_path)}
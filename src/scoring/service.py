@@ -0,0 +1,314 @@
+"""
+Service HTTP de scoring (asyncio, bibliothèque standard uniquement).
+
+Les requêtes individuelles (un client par requête, au format brut Telco en
+JSON) sont regroupées en micro-lots : le premier client d'un lot attend au
+plus max_wait_ms l'arrivée d'autres requêtes, et un lot compte au plus
+max_batch_size clients. Chaque lot est prétraité et scoré en un seul appel
+vectorisé à predict_proba, dans un thread dédié pour que la boucle
+d'événements continue d'accepter les requêtes pendant le calcul.
+
+Routes :
+    POST /score   un client (objet JSON) -> {"customerID", "probability", "label"}
+    GET  /health  état du service, statistiques des micro-lots et du cache
+"""
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+MAX_BODY_SIZE = 1 << 20
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class MicroBatcher:
+    """
+    Regroupe des appels concurrents en lots traités par une seule fonction vectorisée.
+    """
+    def __init__(self, batch_fn, max_batch_size=64, max_wait_ms=5.0):
+        """
+        Args:
+            batch_fn: Fonction appelée sur la liste des éléments d'un lot ;
+                retourne un résultat par élément, dans le même ordre
+            max_batch_size (int): Nombre maximal d'éléments par lot
+            max_wait_ms (float): Attente maximale du premier élément d'un lot
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size doit être au moins 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = None
+        self.task = None
+        # Un seul thread : les lots sont traités l'un après l'autre
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.n_batches = 0
+        self.n_items = 0
+
+    def start(self):
+        """
+        Démarre la boucle de regroupement (dans la boucle d'événements courante).
+        """
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """
+        Arrête la boucle de regroupement.
+        """
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(wait=True)
+
+    async def submit(self, item):
+        """
+        Ajoute un élément au prochain lot et attend son résultat.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((item, future))
+        return await future
+
+    async def _collect(self):
+        # Le lot démarre avec le premier élément et se ferme quand il est plein
+        # ou quand l'attente maximale est écoulée
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # Éléments déjà en file : sans attente
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            remaining = deadline - time.perf_counter()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _process(self, items):
+        """
+        Traite un lot ; en cas d'échec, chaque élément est retraité seul pour que
+        l'erreur d'un élément invalide ne soit renvoyée qu'à sa propre requête.
+
+        Returns:
+            list: Un couple (succès, résultat ou exception) par élément
+        """
+        try:
+            return [(True, result) for result in self.batch_fn(items)]
+        except Exception as e:
+            if len(items) == 1:
+                return [(False, e)]
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append((True, self.batch_fn([item])[0]))
+            except Exception as e:
+                outcomes.append((False, e))
+        return outcomes
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            outcomes = await loop.run_in_executor(self.executor, self._process, items)
+            self.n_batches += 1
+            self.n_items += len(batch)
+            for (_, future), (ok, result) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+
+    def stats(self):
+        """
+        Statistiques des lots traités.
+        """
+        return {
+            'batches': self.n_batches,
+            'requests': self.n_items,
+            'mean_batch_size': self.n_items / self.n_batches if self.n_batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000
+        }
+
+
+class ScoringService:
+    """
+    Service HTTP de scoring d'un client par requête, avec micro-lots.
+    """
+    def __init__(self, scorer, host='127.0.0.1', port=8080, max_batch_size=64, max_wait_ms=5.0,
+                 threshold=0.5):
+        """
+        Args:
+            scorer (BatchScorer): Préprocesseur et modèle chargés
+            host (str): Adresse d'écoute
+            port (int): Port d'écoute (0 : port libre choisi par le système)
+            max_batch_size (int): Nombre maximal de clients par micro-lot
+            max_wait_ms (float): Attente maximale avant de scorer un lot incomplet
+            threshold (float): Seuil de décision du label
+        """
+        self.scorer = scorer
+        self.host = host
+        self.port = port
+        self.threshold = threshold
+        self.batcher = MicroBatcher(self._score_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        self.server = None
+
+    def _score_batch(self, records):
+        """
+        Score un micro-lot de clients bruts en un appel vectorisé.
+        """
+        result = self.scorer.score_chunk(pd.DataFrame.from_records(records), self.threshold)
+        return result.to_dict(orient='records')
+
+    async def start(self):
+        """
+        Ouvre le socket d'écoute et démarre le regroupement des requêtes.
+        """
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        print(f" Service de scoring à l'écoute sur http://{self.host}:{self.port} "
+              f"(lots de {self.batcher.max_batch_size} max, attente {self.batcher.max_wait * 1000:g} ms)")
+
+    async def stop(self):
+        """
+        Ferme le socket d'écoute et arrête le regroupement.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        """
+        Démarre le service et le laisse tourner jusqu'à l'annulation.
+        """
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(self, reader, writer):
+        # Connexions persistantes (HTTP/1.1 keep-alive) : plusieurs requêtes par connexion
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, path, _ = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Ligne de requête invalide'}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        key, value = line.split(':', 1)
+                        headers[key.strip().lower()] = value.strip()
+                keep_alive = headers.get('connection', '').lower() != 'close'
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': 'En-tête Content-Length invalide'}, keep_alive=False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {'error': 'Requête trop volumineuse'}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._route(method, path, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if path == '/health':
+            if method != 'GET':
+                return 405, {'error': 'Méthode non autorisée'}
+            payload = {'status': 'ok', 'model': self.scorer.model.name, **self.batcher.stats()}
+            if self.scorer.cache is not None:
+                payload['cache'] = self.scorer.cache.stats()
+            return 200, payload
+        if path != '/score':
+            return 404, {'error': f"Route inconnue : {path}"}
+        if method != 'POST':
+            return 405, {'error': 'Méthode non autorisée'}
+
+        try:
+            record = json.loads(body)
+        except ValueError:
+            return 400, {'error': 'Corps JSON invalide'}
+        if not isinstance(record, dict):
+            return 400, {'error': 'Un objet JSON (un client) est attendu'}
+        missing = [col for col in self.scorer.preprocessor.feature_names if col not in record]
+        if missing:
+            return 400, {'error': f"Champs manquants : {', '.join(missing)}"}
+
+        try:
+            return 200, await self.batcher.submit(record)
+        except (ValueError, TypeError) as e:
+            # Valeur de champ non convertible (ex. « SeniorCitizen »: "abc")
+            return 400, {'error': f"Client invalide : {e}"}
+        except Exception as e:
+            return 500, {'error': str(e)}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive=True):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+def serve(registry_dir, name, version=None, host='127.0.0.1', port=8080, max_batch_size=64,
+          max_wait_ms=5.0, threshold=0.5, cache_size=None, cache_ttl=3600.0):
+    """
+    Charge un modèle du registre et lance le service (bloquant, Ctrl+C pour arrêter).
+
+    Args:
+        registry_dir (str): Dossier du registre des modèles
+        name (str): Nom du modèle dans le registre
+        version (str): Version (champion, sinon la plus récente, si None)
+        host (str): Adresse d'écoute
+        port (int): Port d'écoute
+        max_batch_size (int): Nombre maximal de clients par micro-lot
+        max_wait_ms (float): Attente maximale avant de scorer un lot incomplet
+        threshold (float): Seuil de décision du label
+        cache_size (int): Taille du cache des prédictions (pas de cache si None ou 0)
+        cache_ttl (float): Durée de vie des entrées du cache, en secondes
+    """
+    from .batch import BatchScorer
+
+    scorer = BatchScorer.from_registry(registry_dir, name, version, cache_size=cache_size, cache_ttl=cache_ttl)
+    service = ScoringService(scorer, host=host, port=port, max_batch_size=max_batch_size,
+                             max_wait_ms=max_wait_ms, threshold=threshold)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        print(" Service de scoring arrêté")
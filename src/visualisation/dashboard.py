@@ -1,12 +1,21 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
 import os
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au PYTHONPATH
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.models.registry import ModelRegistry
+from src.evaluation.model_evaluator import ModelEvaluator
+
+REGISTRY_DIR = project_root / 'models' / 'registry'
+EVALUATION_FILE = project_root / 'models' / 'evaluation.json'
+MODEL_NAMES = ['RandomForestModel', 'LogisticRegressionModel', 'DecisionTreeModel']
 
 # Configuration de la page
 st.set_page_config(
@@ -27,106 +36,102 @@ page = st.sidebar.selectbox(
     ["📊 Vue d'ensemble", "🔮 Prédiction", "📈 Analyse des Modèles", "💼 Insights Business"]
 )
 
-# Chargement des données (cache pour performance)
-@st.cache_data
-def load_data():
+# Chargement des modèles entraînés (champions du registre) et de leur préprocesseur,
+# une seule fois par processus : aucune session ne ré-entraîne les modèles
+@st.cache_resource
+def load_models():
     try:
-        X_train = pd.read_csv('data/processed/X_train.csv')
-        X_test = pd.read_csv('data/processed/X_test.csv')
-        y_train = pd.read_csv('data/processed/y_train.csv')['0']
-        y_test = pd.read_csv('data/processed/y_test.csv')['0']
-        return X_train, X_test, y_train, y_test
+        registry = ModelRegistry(REGISTRY_DIR)
+        bundles = {}
+        for name in MODEL_NAMES:
+            if registry.versions(name):
+                bundle = registry.load_bundle(name)
+                bundles[bundle['metadata']['display_name']] = bundle
+        return bundles
     except Exception as e:
-        st.error(f"❌ Erreur de chargement des données: {e}")
-        return None, None, None, None
+        st.error(f"❌ Erreur de chargement des modèles: {e}")
+        return {}
 
-# Création des modèles (cache pour performance)
-@st.cache_resource
-def create_models():
-    # Random Forest (meilleur modèle)
-    rf_model = RandomForestClassifier(
-        n_estimators=100, max_depth=10, min_samples_split=5,
-        min_samples_leaf=2, random_state=42, class_weight='balanced', n_jobs=-1
-    )
-    
-    # Régression Logistique
-    lr_model = LogisticRegression(
-        random_state=42, max_iter=1000, class_weight='balanced', C=1.0
-    )
-    
-    # Arbre de Décision
-    dt_model = DecisionTreeClassifier(
-        max_depth=10, min_samples_split=20, min_samples_leaf=10,
-        random_state=42, class_weight='balanced'
-    )
-    
-    return rf_model, lr_model, dt_model
+# Artefact d'évaluation écrit par main.py : relu seulement quand le fichier change
+# (la date de modification fait partie de la clé du cache)
+@st.cache_data
+def read_evaluation(path, mtime):
+    return ModelEvaluator.load_report(path)
 
-# Chargement des données et modèles
-X_train, X_test, y_train, y_test = load_data()
-if X_train is not None:
-    rf_model, lr_model, dt_model = create_models()
-    
-    # Entraînement des modèles
-    with st.spinner("Entraînement des modèles en cours..."):
-        rf_model.fit(X_train, y_train)
-        lr_model.fit(X_train, y_train)
-        dt_model.fit(X_train, y_train)
+def load_evaluation():
+    try:
+        mtime = os.path.getmtime(EVALUATION_FILE)
+    except OSError:
+        return None
+    return read_evaluation(str(EVALUATION_FILE), mtime)
+
+models = load_models()
+if not models:
+    st.sidebar.warning("Aucun modèle enregistré : exécutez d'abord `python main.py`")
+evaluation = load_evaluation()
+
+METRIC_LABELS = {'accuracy': 'Accuracy', 'precision': 'Precision', 'recall': 'Recall',
+                 'f1_score': 'F1-Score', 'roc_auc': 'ROC-AUC'}
 
 # PAGE 1: VUE D'ENSEMBLE
 if page == "📊 Vue d'ensemble":
     st.header("📊 Vue d'Ensemble du Projet")
     
-    # Métriques principales
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("🎯 Meilleur Modèle", "Random Forest", "76.4%")
-    
-    with col2:
-        st.metric("📊 Accuracy", "76.4%", "+2.4%")
-    
-    with col3:
-        st.metric("🎪 ROC-AUC", "83.2%", "+3.2%")
-    
-    with col4:
-        st.metric("📈 Clients Analysés", "7,043", "100%")
-    
-    st.markdown("---")
-    
-    # Graphique de comparaison des modèles
-    st.subheader("🏆 Comparaison des Performances")
-    
-    models_data = {
-        'Modèle': ['Random Forest', 'Régression Logistique', 'Arbre de Décision'],
-        'Accuracy': [0.743, 0.739, 0.732],
-        'Precision': [0.515, 0.509, 0.501],
-        'Recall': [0.778, 0.778, 0.736],
-        'F1-Score': [0.620, 0.616, 0.596],
-        'ROC-AUC': [0.832, 0.835, 0.794]
-    }
-    
-    df_models = pd.DataFrame(models_data)
-    
-    # Graphique en barres comparatif
-    fig = px.bar(
-        df_models.melt(id_vars='Modèle', var_name='Métrique', value_name='Score'),
-        x='Métrique', y='Score', color='Modèle',
-        title="Comparaison des Performances par Métrique",
-        barmode='group'
-    )
-    fig.update_layout(yaxis_range=[0, 1])
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Tableau récapitulatif
-    st.subheader("📊 Tableau Récapitulatif")
-    st.dataframe(df_models.set_index('Modèle'), use_container_width=True)
+    if evaluation is not None:
+        best = evaluation['best_model']
+        best_metrics = evaluation['models'][best]['metrics']
+        
+        # Métriques principales
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("🎯 Meilleur Modèle", best, f"{best_metrics['roc_auc']:.1%} ROC-AUC")
+        
+        with col2:
+            st.metric("📊 Accuracy", f"{best_metrics['accuracy']:.1%}")
+        
+        with col3:
+            st.metric("🎪 ROC-AUC", f"{best_metrics['roc_auc']:.1%}")
+        
+        with col4:
+            st.metric("📈 Clients Analysés", f"{evaluation['n_samples']:,}", f"{evaluation['n_test']:,} en test")
+        
+        st.markdown("---")
+        
+        # Graphique de comparaison des modèles
+        st.subheader("🏆 Comparaison des Performances")
+        
+        df_models = pd.DataFrame([
+            {'Modèle': name, **{label: entry['metrics'][key] for key, label in METRIC_LABELS.items()}}
+            for name, entry in evaluation['models'].items()
+        ])
+        
+        # Graphique en barres comparatif
+        fig = px.bar(
+            df_models.melt(id_vars='Modèle', var_name='Métrique', value_name='Score'),
+            x='Métrique', y='Score', color='Modèle',
+            title="Comparaison des Performances par Métrique",
+            barmode='group'
+        )
+        fig.update_layout(yaxis_range=[0, 1])
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Tableau récapitulatif
+        st.subheader("📊 Tableau Récapitulatif")
+        st.dataframe(df_models.set_index('Modèle'), use_container_width=True)
+        st.caption(f"Évaluation du {pd.Timestamp(evaluation['created'], unit='s'):%d/%m/%Y %H:%M}")
+    else:
+        st.warning("Aucun artefact d'évaluation : exécutez d'abord `python main.py`.")
 
 # PAGE 2: PRÉDICTION
 elif page == "🔮 Prédiction":
     st.header("🔮 Prédiction de Churn pour un Nouveau Client")
     
-    if X_train is not None:
+    if models:
+        model_choice = st.selectbox("🎯 Modèle", list(models))
+        bundle = models[model_choice]
+        model, preprocessor = bundle['model'], bundle['preprocessor']
+        
         st.markdown("### 📝 Saisir les informations du client")
         
         # Formulaire de saisie
@@ -146,25 +151,23 @@ elif page == "🔮 Prédiction":
         
         # Bouton de prédiction
         if st.button("🎯 Prédire le Churn", type="primary"):
-            # Simulation simplifiée (pour la démo)
-            # Calcul basé sur les règles business identifiées
-            risk_score = 0
+            # Champs non saisis : valeurs les plus fréquentes (ou moyennes) de l'entraînement
+            form = {
+                'tenure': tenure,
+                'MonthlyCharges': monthly_charges,
+                'TotalCharges': total_charges,
+                'Contract': contract,
+                'InternetService': internet_service,
+                'OnlineSecurity': online_security
+            }
+            defaults = {col: preprocessor.fill_values.get(col, 0) for col in preprocessor.feature_names}
+            record = {**defaults, **form}
             
-            # Facteurs de risque
-            if contract == "Month-to-month":
-                risk_score += 0.4
-            if tenure < 12:
-                risk_score += 0.3
-            if online_security == "No":
-                risk_score += 0.2
-            if monthly_charges > 80:
-                risk_score += 0.1
-            
-            # Simulation de probabilité
-            churn_prob = min(risk_score, 0.9)
+            # Score du modèle réel (chemin ligne à ligne, sans DataFrame)
+            churn_prob = model.predict_record(record, preprocessor)
             no_churn_prob = 1 - churn_prob
             
-            prediction = 1 if churn_prob > 0.5 else 0
+            prediction = 1 if churn_prob >= 0.5 else 0
             
             # Affichage du résultat
             st.markdown("---")
@@ -189,6 +192,7 @@ elif page == "🔮 Prédiction":
                     st.success("✅ **CLIENT FIDÈLE**")
                     st.markdown(f"**Probabilité de rétention : {no_churn_prob:.1%}**")
                     st.markdown("### 🎉 Client à faible risque - Maintenir la qualité de service")
+                st.caption(f"Modèle : {model_choice} ({bundle['metadata']['version']})")
             
             with col2:
                 # Graphique de probabilité
@@ -206,105 +210,135 @@ elif page == "🔮 Prédiction":
                 )
                 st.plotly_chart(fig, use_container_width=True)
                 
-                # Facteurs de risque
+                # Facteurs de risque : variation de la probabilité quand le champ
+                # reprend sa valeur la plus fréquente (ou moyenne) de l'entraînement
                 st.markdown("### ⚖️ Facteurs de Risque")
+                labels = {
+                    'Contract': "📋 Type de contrat",
+                    'tenure': "📅 Ancienneté",
+                    'OnlineSecurity': "🔒 Sécurité en ligne",
+                    'MonthlyCharges': "💰 Charges mensuelles",
+                    'TotalCharges': "💳 Charges totales",
+                    'InternetService': "🌐 Service Internet"
+                }
                 factors = []
-                if contract == "Month-to-month":
-                    factors.append("📋 Contrat flexible (+40%)")
-                if tenure < 12:
-                    factors.append("📅 Client récent (+30%)")
-                if online_security == "No":
-                    factors.append("🔒 Pas de sécurité (+20%)")
-                if monthly_charges > 80:
-                    factors.append("💰 Charges élevées (+10%)")
+                for col, label in labels.items():
+                    delta = churn_prob - model.predict_record({**record, col: defaults[col]}, preprocessor)
+                    if delta > 0.01:
+                        factors.append((delta, label))
                 
                 if factors:
-                    for factor in factors:
-                        st.markdown(f"- {factor}")
+                    for delta, label in sorted(factors, reverse=True):
+                        st.markdown(f"- {label} (+{delta:.0%})")
                 else:
                     st.markdown("- ✅ Aucun facteur de risque majeur")
     
     else:
-        st.error("❌ Impossible de charger les modèles. Vérifiez les données.")
+        st.error("❌ Impossible de charger les modèles. Exécutez d'abord `python main.py`.")
 
 # PAGE 3: ANALYSE DES MODÈLES
 elif page == "📈 Analyse des Modèles":
     st.header("📈 Analyse Détaillée des Modèles")
     
-    if X_train is not None:
+    if evaluation is not None:
         # Sélecteur de modèle
         model_choice = st.selectbox(
             "🎯 Choisir un modèle à analyser",
-            ["Random Forest", "Régression Logistique", "Arbre de Décision"]
+            list(evaluation['models'])
         )
+        entry = evaluation['models'][model_choice]
+        color = {'Random Forest': 'purple', 'Régression Logistique': 'blue'}.get(model_choice, 'green')
         
         # Importance des features selon le modèle choisi
-        st.subheader(f"🎯 Importance des Features - {model_choice}")
-        
-        if model_choice == "Random Forest":
-            importances = rf_model.feature_importances_
-            color = 'purple'
-        elif model_choice == "Régression Logistique":
-            importances = np.abs(lr_model.coef_[0])
-            color = 'blue'
-        else:  # Arbre de Décision
-            importances = dt_model.feature_importances_
-            color = 'green'
-        
-        # Créer le DataFrame d'importance
-        feature_importance = pd.DataFrame({
-            'Feature': X_train.columns,
-            'Importance': importances
-        }).sort_values('Importance', ascending=False).head(10)
-        
-        # Graphique d'importance
-        fig = px.bar(
-            feature_importance, 
-            x='Importance', 
-            y='Feature',
-            orientation='h',
-            title=f"Top 10 Features - {model_choice}",
-            color_discrete_sequence=[color]
-        )
-        fig.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Tableau des importances
-        st.subheader("📊 Détail des Importances")
-        st.dataframe(feature_importance, use_container_width=True)
+        if 'feature_importance' in entry:
+            st.subheader(f"🎯 Importance des Features - {model_choice}")
+            
+            feature_importance = pd.DataFrame({
+                'Feature': entry['feature_importance']['feature'],
+                'Importance': entry['feature_importance']['importance']
+            }).sort_values('Importance', ascending=False).head(10)
+            
+            # Graphique d'importance
+            fig = px.bar(
+                feature_importance, 
+                x='Importance', 
+                y='Feature',
+                orientation='h',
+                title=f"Top 10 Features - {model_choice}",
+                color_discrete_sequence=[color]
+            )
+            fig.update_layout(yaxis={'categoryorder':'total ascending'})
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Tableau des importances
+            st.subheader("📊 Détail des Importances")
+            st.dataframe(feature_importance, use_container_width=True)
         
         # Performance du modèle sélectionné
         st.subheader(f"📊 Performance - {model_choice}")
         
-        if model_choice == "Random Forest":
-            perf_data = {'Accuracy': 0.743, 'Precision': 0.515, 'Recall': 0.778, 'F1-Score': 0.620, 'ROC-AUC': 0.832}
-        elif model_choice == "Régression Logistique":
-            perf_data = {'Accuracy': 0.739, 'Precision': 0.509, 'Recall': 0.778, 'F1-Score': 0.616, 'ROC-AUC': 0.835}
-        else:
-            perf_data = {'Accuracy': 0.732, 'Precision': 0.501, 'Recall': 0.736, 'F1-Score': 0.596, 'ROC-AUC': 0.794}
-        
+        perf_data = {label: entry['metrics'][key] for key, label in METRIC_LABELS.items()}
         cols = st.columns(len(perf_data))
         for i, (metric, value) in enumerate(perf_data.items()):
             with cols[i]:
                 st.metric(metric, f"{value:.3f}")
+        
+        # Courbes ROC et précision-rappel, matrice de confusion
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            fig = go.Figure(go.Scatter(x=entry['roc_curve']['fpr'], y=entry['roc_curve']['tpr'],
+                                       mode='lines', line_color=color, name=model_choice))
+            fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], mode='lines', line_dash='dash',
+                                     line_color='gray', showlegend=False))
+            fig.update_layout(title=f"Courbe ROC (AUC = {entry['metrics']['roc_auc']:.3f})",
+                              xaxis_title="Taux de faux positifs", yaxis_title="Taux de vrais positifs",
+                              showlegend=False)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = go.Figure(go.Scatter(x=entry['pr_curve']['recall'], y=entry['pr_curve']['precision'],
+                                       mode='lines', line_color=color))
+            fig.update_layout(title=f"Précision-Rappel (AP = {entry['metrics']['average_precision']:.3f})",
+                              xaxis_title="Rappel", yaxis_title="Précision", yaxis_range=[0, 1.05])
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col3:
+            fig = px.imshow(entry['confusion_matrix'], text_auto=True, color_continuous_scale='Blues',
+                            labels={'x': 'Prédiction', 'y': 'Vrai label'},
+                            x=['Fidèle', 'Churn'], y=['Fidèle', 'Churn'], title="Matrice de confusion")
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.error("❌ Aucun artefact d'évaluation. Exécutez d'abord `python main.py`.")
 
 # PAGE 4: INSIGHTS BUSINESS
 elif page == "💼 Insights Business":
     st.header("💼 Insights Business et Recommandations")
     
-    # Facteurs clés de churn
+    # Facteurs clés de churn : importances du meilleur modèle (artefact d'évaluation)
     st.subheader("🎯 Facteurs Clés de Churn")
     
-    insights_data = [
-        {"Facteur": "Type de contrat", "Impact": "40%", "Description": "Les contrats flexibles présentent un risque élevé"},
-        {"Facteur": "Ancienneté client", "Impact": "11%", "Description": "Les nouveaux clients (< 6 mois) sont 3x plus volatiles"},
-        {"Facteur": "Montants facturés", "Impact": "10%", "Description": "Relation complexe - extrêmes à risque"},
-        {"Facteur": "Services additionnels", "Impact": "7%", "Description": "OnlineSecurity et autres ont un impact protecteur"},
-        {"Facteur": "Service téléphonique", "Impact": "5%", "Description": "Absence corrélée avec risque plus élevé"}
-    ]
+    factor_descriptions = {
+        'Contract': "Les contrats flexibles présentent un risque élevé",
+        'tenure': "Les nouveaux clients sont plus volatiles",
+        'MonthlyCharges': "Relation complexe - extrêmes à risque",
+        'TotalCharges': "Relation complexe - extrêmes à risque",
+        'OnlineSecurity': "OnlineSecurity et autres ont un impact protecteur",
+        'TechSupport': "Le support technique a un impact protecteur",
+        'PhoneService': "Absence corrélée avec risque plus élevé"
+    }
     
-    df_insights = pd.DataFrame(insights_data)
-    st.dataframe(df_insights, use_container_width=True)
+    if evaluation is not None and 'feature_importance' in evaluation['models'][evaluation['best_model']]:
+        importance = evaluation['models'][evaluation['best_model']]['feature_importance']
+        df_insights = pd.DataFrame({'Facteur': importance['feature'], 'Impact': importance['importance']})
+        df_insights['Impact'] = df_insights['Impact'] / df_insights['Impact'].sum()
+        df_insights = df_insights.sort_values('Impact', ascending=False).head(5)
+        df_insights['Description'] = df_insights['Facteur'].map(factor_descriptions).fillna('')
+        df_insights['Impact'] = df_insights['Impact'].map('{:.0%}'.format)
+        st.dataframe(df_insights, use_container_width=True, hide_index=True)
+        st.caption(f"Impact : part de l'importance totale des features ({evaluation['best_model']})")
+    else:
+        st.warning("Aucun artefact d'évaluation : exécutez d'abord `python main.py`.")
     
     st.markdown("---")
     
@@ -344,24 +378,36 @@ elif page == "💼 Insights Business":
         7. **Net Promoter Score** (NPS)
         """)
     
-    # ROI estimé
+    # Impact du ciblage, mesuré sur le jeu de test (matrice de confusion du meilleur modèle)
     st.markdown("---")
-    st.subheader("💰 Impact Financier Estimé")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("💸 Réduction Coûts", "51.5%", "Moins de faux positifs")
-    
-    with col2:
-        st.metric("📈 Rétention", "+15%", "Actions ciblées")
-    
-    with col3:
-        st.metric("💰 ROI Estimé", "300%", "Sur 12 mois")
+    st.subheader("💰 Impact du Ciblage (jeu de test)")
     
-    with col4:
-        st.metric("🎯 Précision", "76.4%", "Modèle Random Forest")
+    if evaluation is not None:
+        best = evaluation['best_model']
+        (tn, fp), (fn, tp) = evaluation['models'][best]['confusion_matrix']
+        n_test = tn + fp + fn + tp
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("📉 Taux de Churn", f"{(tp + fn) / n_test:.1%}", f"{tp + fn} clients sur {n_test}",
+                      delta_color="off")
+        
+        with col2:
+            st.metric("🎯 Churners Détectés", f"{tp / max(tp + fn, 1):.1%}", "Rappel", delta_color="off")
+        
+        with col3:
+            st.metric("💸 Contacts Évités", f"{1 - (tp + fp) / n_test:.1%}", "vs contacter tous les clients",
+                      delta_color="off")
+        
+        with col4:
+            st.metric("✅ Précision", f"{tp / max(tp + fp, 1):.1%}", f"Alertes justes - {best}", delta_color="off")
+    else:
+        st.info("Indicateurs indisponibles sans artefact d'évaluation.")
 
 # Footer
 st.markdown("---")
-st.markdown("🎯 **Dashboard Prédiction Churn** - Développé avec Streamlit | Random Forest : 76.4% accuracy")
\ No newline at end of file
+footer = "🎯 **Dashboard Prédiction Churn** - Développé avec Streamlit"
+if evaluation is not None:
+    footer += f" | {evaluation['best_model']} : {evaluation['models'][evaluation['best_model']]['metrics']['accuracy']:.1%} accuracy"
+st.markdown(footer)
\ No newline at end of file